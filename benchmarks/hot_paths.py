@@ -0,0 +1,308 @@
+#! /usr/bin/env python3
+"""Offline benchmarks of the hot paths of the path parsers and the followers.
+
+Runs without ROS: rospy, tf and the message packages are replaced by the stubs of
+ros_stubs.py, the nodes are built through their constructors with the parameters of
+PARAMS and publish into publishers that serialize the messages like rospy would.
+Synthetic print paths of 10^3 .. 10^7 points are used, every run is appended to a
+JSON history.
+
+    python3 hot_paths.py                            default sizes, appends to history.json
+    python3 hot_paths.py --sizes 1e3,1e7 --filter parse
+    python3 hot_paths.py --compare --threshold 0.2  exit 1 if a median got >20 % slower than the last run
+"""
+import argparse
+import datetime
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO, "parse_path", "src"))
+sys.path.insert(0, os.path.join(REPO, "print_path_msgs", "src"))
+sys.path.insert(0, os.path.join(REPO, "node_instrumentation", "src"))
+sys.path.insert(0, os.path.join(REPO, "print_checkpoint", "src"))
+
+import ros_stubs
+
+# private parameters of every node, the nodes run with instrumentation, so its overhead is part of the numbers
+PARAMS = {
+    "instrumentation": True,
+    "checkpoint_period": 0.0,
+    "visualization_rate": 0.0,  # debug frames every cycle
+    "max_velocity": 0.1,
+}
+MIR_FRAME = "mur620a/base_link"
+UR_FRAME = "mur620a/UR10_r/base_link"
+ros_stubs.install(PARAMS)
+
+import rospy
+from geometry_msgs.msg import Pose, Transform, TransformStamped, Vector3, Quaternion
+from std_msgs.msg import Header
+from tf2_msgs.msg import TFMessage
+
+BENCHMARKS = []
+MESSAGE_LIMIT = 10 ** 6  # building more PoseStamped than this needs several GB
+
+
+def benchmark(name, max_size=10 ** 7):
+    """Register fn(size) -> zero argument callable, everything before the callable is setup."""
+    def register(fn):
+        BENCHMARKS.append((name, max_size, fn))
+        return fn
+    return register
+
+
+def load_script(package, script):
+    # scripts import their helper modules relative to the scripts directory. Both followers have
+    # a helper package, so the one of the requested package has to be the importable one.
+    scripts_dir = os.path.join(REPO, package, "scripts")
+    sys.path[:] = [p for p in sys.path if not (p.startswith(REPO) and p.endswith("scripts"))]
+    sys.path.insert(0, scripts_dir)
+    for name in [name for name in sys.modules if name == "helper" or name.startswith("helper.")]:
+        del sys.modules[name]
+    spec = importlib.util.spec_from_file_location(f"{package}_{script}", os.path.join(scripts_dir, f"{script}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_path(n, dims=3, spacing=0.02, radius=2.0, layer_height=0.002):
+    # circular layers with the point spacing of the real print paths
+    angle = np.arange(n) * spacing / radius
+    points = np.empty((n, dims))
+    points[:, 0] = radius * np.cos(angle)
+    points[:, 1] = radius * np.sin(angle)
+    if dims > 2:
+        points[:, 2] = np.floor(angle / (2 * np.pi)) * layer_height
+    return points
+
+
+def poses_of(points):
+    from parse_path import engine, node
+    positions = np.zeros((len(points), 3))
+    positions[:, :points.shape[1]] = points
+    return node.build_poses(positions, engine.identity_quaternions(len(points)), rospy.Time(0))
+
+
+def latch_mounting(translation=(0.5, 0.1, 0.2)):
+    # UR mounting on /tf_static, the StaticTransformCache of the UR nodes resolves it on construction
+    mounting = TransformStamped(header=Header(frame_id=MIR_FRAME), child_frame_id=UR_FRAME,
+                                transform=Transform(translation=Vector3(*translation), rotation=Quaternion(w=1.0)))
+    ros_stubs.latch("/tf_static", TFMessage(transforms=[mounting]))
+
+
+@benchmark("parse_path.transform[mir]")
+def bench_transform_mir(size):
+    from parse_path import engine
+    points = synthetic_path(size, 2)
+    profile = engine.PROFILES["mir"]
+    return lambda: (engine.original_path(points, profile),
+                    engine.transformed_path(points, profile, -51.6, -39.75, 0.0, 0.0, 0.0, 0.3))
+
+
+@benchmark("parse_path.transform[ur]")
+def bench_transform_ur(size):
+    from parse_path import engine
+    points = synthetic_path(size, 3)
+    profile = engine.PROFILES["ur"]
+    return lambda: (engine.original_path(points, profile),
+                    engine.transformed_path(points, profile, -51.6, -39.75, 0.0, 0.0, 0.0, 0.3))
+
+
+@benchmark("parse_path.preprocess[ur]")
+def bench_preprocess(size):
+    from parse_path import preprocess
+    points = synthetic_path(size, 3)
+    return lambda: preprocess.preprocess(points, 1e-6, 0.0, 0.0005)
+
+
+@benchmark("parse_path.build_path[mir]", MESSAGE_LIMIT)
+def bench_build_path_mir(size):
+    from parse_path import engine, node
+    arrays = engine.transformed_path(synthetic_path(size, 2), engine.PROFILES["mir"], 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    return lambda: node.build_path(*arrays, rospy.Time(0))
+
+
+@benchmark("parse_path.build_path[ur]", MESSAGE_LIMIT)
+def bench_build_path_ur(size):
+    from parse_path import engine, node
+    arrays = engine.transformed_path(synthetic_path(size, 3), engine.PROFILES["ur"], 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    return lambda: node.build_path(*arrays, rospy.Time(0))
+
+
+def mir_follower():
+    module = load_script("mir_trajectory_follower", "mir_trajectory_follower")
+    return module, module.PathFollowerNode()
+
+
+@benchmark("mir_follower.calculate_velocities", MESSAGE_LIMIT)
+def bench_calculate_velocities(size):
+    _, follower = mir_follower()
+    poses = poses_of(synthetic_path(size, 2))
+    return lambda: follower.calculate_velocities(poses, [])
+
+
+@benchmark("mir_follower.align_and_move_step", MESSAGE_LIMIT)
+def bench_align_and_move(size):
+    module, follower = mir_follower()
+    points = synthetic_path(size, 2)
+    poses = poses_of(points)
+    follower.path_callback(module.Path(poses=poses))
+    follower.set_ur_path(poses_of(synthetic_path(size, 3)))
+    path_index = follower.path.index
+    profile = follower.path.profile
+
+    idx = size // 2
+    follower.current_pose = Pose()
+    follower.current_pose.position.x, follower.current_pose.position.y = points[idx] + (0.01, -0.01)
+    follower.current_pose.orientation.w = 1.0
+    follower.ur_trajectory_index = idx
+    target = poses[idx + 1].pose.position
+
+    def step():
+        location = follower.locate_robot(idx, path_index)
+        speed = profile.speed_at(location[2])
+        follower.align_robot(target)
+        follower.move_toward_target(speed, idx, location[2], path_index)
+        follower.telemetry.end_cycle()
+    return step
+
+
+@benchmark("ur_follower.control_step", MESSAGE_LIMIT)
+def bench_ur_control_step(size):
+    module = load_script("ur_trajectory_follower", "ur_follow_trajectory")
+    latch_mounting()
+    control = module.Control_ur()
+    control.resolve_mounting()
+    control.is_active = True
+    control.mir_yaw = 0.3
+
+    points = synthetic_path(size, 3)
+    control.set_path(poses_of(points))
+    idx = size // 2
+    control.ur_position = tuple(points[idx] + 0.001)
+
+    def step():
+        control.path_index = idx
+        control.control_step()
+    return step
+
+
+def compensation_node():
+    module = load_script("ur_trajectory_follower", "ur_vel_induced_by_mir")
+    latch_mounting()
+    node = module.UrMobileRobotCompensation(MIR_FRAME, UR_FRAME)
+    node.ur_pose.position.x = 0.3
+    node.mir_vel.linear.x = 0.1
+    node.mir_vel.angular.z = 0.05
+    return node
+
+
+@benchmark("compensation.mir_cmd_vel_callback", 10 ** 3)
+def bench_pub_compensation(size):
+    # one call per MiR cmd_vel message, size only sets how many calls are timed together
+    node = compensation_node()
+
+    msg = node.mir_vel
+
+    def calls():
+        for _ in range(size):
+            node.mir_cmd_vel_callback(msg)
+    return calls
+
+
+@benchmark("compensation.preview_compensation")
+def bench_preview_compensation(size):
+    node = compensation_node()
+    ur_positions = synthetic_path(size, 3)
+    mir_vels = np.tile((0.1, 0.0, 0.05), (size, 1))
+    return lambda: node.preview_compensation(ur_positions, mir_vels)
+
+
+def measure(fn, repeat, min_time=0.05):
+    fn()  # warm up, also tells how many calls fit into min_time
+    start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - start
+    number = max(1, int(min_time / max(first, 1e-9)))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return {"min_s": min(samples), "median_s": float(np.median(samples)), "number": number, "repeat": repeat}
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=REPO, stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(filename):
+    if not os.path.exists(filename):
+        return []
+    with open(filename) as f:
+        return json.load(f)
+
+
+def regressions(previous, current, threshold):
+    slower = []
+    for key, result in current["results"].items():
+        before = previous["results"].get(key)
+        if before is not None and result["median_s"] > before["median_s"] * (1.0 + threshold):
+            slower.append((key, before["median_s"], result["median_s"]))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1e3,1e4,1e5,1e6", help="comma separated path sizes, up to 1e7")
+    parser.add_argument("--filter", default="", help="only benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--history", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json"))
+    parser.add_argument("--compare", action="store_true", help="compare against the last run in the history")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown for --compare")
+    args = parser.parse_args(argv)
+
+    sizes = [int(float(s)) for s in args.sizes.split(",")]
+    run = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+        "results": {},
+    }
+    for name, max_size, fn in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        for size in sizes:
+            if size > max_size:
+                continue
+            result = measure(fn(size), args.repeat)
+            result["per_point_ns"] = result["median_s"] / size * 1e9
+            run["results"][f"{name}[{size}]"] = result
+            print(f"{name:45s} {size:>9d}  median {result['median_s'] * 1e3:10.3f} ms  {result['per_point_ns']:8.1f} ns/point", flush=True)
+
+    history = load_history(args.history)
+    slower = regressions(history[-1], run, args.threshold) if args.compare and history else []
+    history.append(run)
+    with open(args.history, "w") as f:
+        json.dump(history, f, indent=1)
+
+    for key, before, after in slower:
+        print(f"REGRESSION {key}: {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,386 @@
+"""Stand-ins for rospy, tf, match_lib and the ROS message packages, so the benchmarks run without a ROS install.
+
+    ros_stubs.install({"max_velocity": 0.1})            before the nodes are imported
+    ros_stubs.latch("/tf_static", TFMessage(...))        delivered to every later subscriber
+    ros_stubs.publishers["/mur620a/mobile_base_controller/cmd_vel"].count
+
+The nodes are built through their real constructors. Publishers serialize every message
+into a reused buffer, like rospy does before writing to a socket. Timers are registered
+but never fire, the benchmarks call the timed methods themselves. The messages of
+print_path_msgs are generated from its .msg files, so they follow the repo.
+
+The stubs always replace the real modules, so the numbers are comparable between
+machines with and without ROS.
+"""
+import io
+import math
+import os
+import struct
+import sys
+import time
+import types
+
+import numpy as np
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+params = {}  # private parameter name without "~" -> value, the same for every node
+global_params = {}  # set_param of the nodes
+publishers = {}  # topic -> Publisher
+subscribers = {}  # topic -> [callback]
+latched = {}  # topic -> message
+
+
+# messages
+
+_PACK = {"float64": "<d", "float32": "<f", "int32": "<i", "uint32": "<I", "int8": "<b", "uint8": "<B",
+         "int64": "<q", "uint64": "<Q", "bool": "<?", "byte": "<B"}
+_DEFAULTS = {"float64": 0.0, "float32": 0.0, "bool": False, "string": ""}
+
+
+class Message:
+    """Fields in definition order as (name, type), type a primitive name, a message class or [type]."""
+
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, *args, **kwargs):
+        for (name, field_type), value in zip(self._fields, args):
+            setattr(self, name, value)
+        for name, field_type in self._fields[len(args):]:
+            setattr(self, name, kwargs[name] if name in kwargs else _default(field_type))
+
+    def serialize(self, buff):
+        for name, field_type in self._fields:
+            _write(buff, field_type, getattr(self, name))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name, _ in self._fields)})"
+
+
+def _default(field_type):
+    if isinstance(field_type, list):
+        return []
+    if isinstance(field_type, type):
+        return field_type()
+    if field_type == "time":
+        return Time()
+    return _DEFAULTS.get(field_type, 0)
+
+
+def _write(buff, field_type, value):
+    if isinstance(field_type, list):
+        buff.write(struct.pack("<I", len(value)))
+        if field_type[0] in _PACK:
+            # numpy arrays and lists of numbers in one go, like genpy
+            buff.write(np.asarray(value, dtype=_PACK[field_type[0]]).tobytes())
+            return
+        for item in value:
+            _write(buff, field_type[0], item)
+    elif isinstance(field_type, type):
+        value.serialize(buff)
+    elif field_type == "string":
+        data = value.encode()
+        buff.write(struct.pack("<I", len(data)))
+        buff.write(data)
+    elif field_type == "time":
+        buff.write(struct.pack("<II", value.secs, value.nsecs))
+    else:
+        buff.write(struct.pack(_PACK[field_type], value))
+
+
+def message(name, fields, **constants):
+    return type(name, (Message,), {"__slots__": tuple(field for field, _ in fields), "_fields": tuple(fields), **constants})
+
+
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+    parent, _, child = name.rpartition(".")
+    if parent in sys.modules:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def _message_types():
+    Header = message("Header", [("seq", "uint32"), ("stamp", "time"), ("frame_id", "string")])
+    Point = message("Point", [("x", "float64"), ("y", "float64"), ("z", "float64")])
+    Vector3 = message("Vector3", [("x", "float64"), ("y", "float64"), ("z", "float64")])
+    Quaternion = message("Quaternion", [("x", "float64"), ("y", "float64"), ("z", "float64"), ("w", "float64")])
+    Pose = message("Pose", [("position", Point), ("orientation", Quaternion)])
+    Twist = message("Twist", [("linear", Vector3), ("angular", Vector3)])
+    Transform = message("Transform", [("translation", Vector3), ("rotation", Quaternion)])
+    geometry = {
+        "Point": Point, "Vector3": Vector3, "Quaternion": Quaternion, "Pose": Pose, "Twist": Twist, "Transform": Transform,
+        "PoseStamped": message("PoseStamped", [("header", Header), ("pose", Pose)]),
+        "TwistStamped": message("TwistStamped", [("header", Header), ("twist", Twist)]),
+        "TransformStamped": message("TransformStamped", [("header", Header), ("child_frame_id", "string"),
+                                                         ("transform", Transform)]),
+    }
+    std = {
+        "Header": Header,
+        "Empty": message("Empty", []),
+        "Bool": message("Bool", [("data", "bool")]),
+        "Int32": message("Int32", [("data", "int32")]),
+        "Float64": message("Float64", [("data", "float64")]),
+    }
+    KeyValue = message("KeyValue", [("key", "string"), ("value", "string")])
+    DiagnosticStatus = message("DiagnosticStatus", [("level", "byte"), ("name", "string"), ("message", "string"),
+                                                    ("hardware_id", "string"), ("values", [KeyValue])],
+                               OK=0, WARN=1, ERROR=2, STALE=3)
+    diagnostic = {"KeyValue": KeyValue, "DiagnosticStatus": DiagnosticStatus,
+                  "DiagnosticArray": message("DiagnosticArray", [("header", Header), ("status", [DiagnosticStatus])])}
+    TriggerResponse = message("TriggerResponse", [("success", "bool"), ("message", "string")])
+    TriggerRequest = message("TriggerRequest", [])
+    srvs = {"Trigger": type("Trigger", (), {"_request_class": TriggerRequest, "_response_class": TriggerResponse}),
+            "TriggerRequest": TriggerRequest, "TriggerResponse": TriggerResponse}
+    packages = {
+        "std_msgs": std, "geometry_msgs": geometry, "diagnostic_msgs": diagnostic,
+        "nav_msgs": {"Path": message("Path", [("header", Header), ("poses", [geometry["PoseStamped"]])])},
+        "tf2_msgs": {"TFMessage": message("TFMessage", [("transforms", [geometry["TransformStamped"]])])},
+    }
+    return packages, srvs
+
+
+def _parse_msg_file(filename, types_by_name):
+    # "type name  # comment" lines, constants are not used by the repo messages
+    fields = []
+    with open(filename) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line or "=" in line:
+                continue
+            field_type, name = line.split()
+            is_array = field_type.endswith("[]")
+            field_type = field_type[:-2] if is_array else field_type
+            field_type = types_by_name.get(field_type.rpartition("/")[2], field_type)
+            fields.append((name, [field_type] if is_array else field_type))
+    return fields
+
+
+def _repo_messages(package, types_by_name):
+    msg_dir = os.path.join(REPO, package, "msg")
+    return {name[:-4]: message(name[:-4], _parse_msg_file(os.path.join(msg_dir, name), types_by_name))
+            for name in sorted(os.listdir(msg_dir)) if name.endswith(".msg")}
+
+
+# rospy
+
+class Time:
+    __slots__ = ("secs", "nsecs")
+
+    def __init__(self, secs=0, nsecs=0):
+        self.secs = int(secs)
+        self.nsecs = int(nsecs)
+
+    @classmethod
+    def from_sec(cls, seconds):
+        secs = int(math.floor(seconds))
+        return cls(secs, int(round((seconds - secs) * 1e9)))
+
+    @classmethod
+    def now(cls):
+        return cls.from_sec(time.time())
+
+    def to_sec(self):
+        return self.secs + 1e-9 * self.nsecs
+
+    def __sub__(self, other):
+        return Duration.from_sec(self.to_sec() - other.to_sec())
+
+
+class Duration(Time):
+    pass
+
+
+class Publisher:
+    def __init__(self, topic, data_class=None, queue_size=None, latch=False, subscriber_listener=None, **kwargs):
+        self.topic = _resolve(topic)
+        self.buffer = io.BytesIO()
+        self.count = 0
+        publishers[self.topic] = self
+
+    def publish(self, msg):
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        msg.serialize(self.buffer)
+        self.count += 1
+
+    def get_num_connections(self):
+        return 0
+
+    def unregister(self):
+        pass
+
+
+class Subscriber:
+    def __init__(self, topic, data_class=None, callback=None, callback_args=None, **kwargs):
+        self.topic = _resolve(topic)
+        subscribers.setdefault(self.topic, []).append(callback)
+        if self.topic in latched:
+            callback(latched[self.topic])
+
+    def unregister(self):
+        pass
+
+
+class _Handle:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def shutdown(self):
+        pass
+
+    def sleep(self):
+        pass
+
+
+class SubscribeListener:
+    pass
+
+
+class ROSException(Exception):
+    pass
+
+
+class ROSInterruptException(ROSException):
+    pass
+
+
+def _resolve(name):
+    if name.startswith("~"):
+        return "/node/" + name[1:]
+    return name if name.startswith("/") else "/" + name
+
+
+def get_param(name, default=None):
+    key = name.lstrip("~")
+    if key in params:
+        return params[key]
+    if default is None:
+        raise KeyError(name)
+    return default
+
+
+def set_param(name, value):
+    global_params[name] = value
+
+
+def _rospy():
+    def ignore(*args, **kwargs):
+        pass
+    return {
+        "Time": Time, "Duration": Duration, "Publisher": Publisher, "Subscriber": Subscriber, "Service": _Handle,
+        "Timer": _Handle, "Rate": _Handle, "SubscribeListener": SubscribeListener, "ROSException": ROSException,
+        "ROSInterruptException": ROSInterruptException, "get_param": get_param, "set_param": set_param, "init_node": ignore, "spin": ignore,
+        "on_shutdown": ignore, "is_shutdown": lambda: False, "get_name": lambda: "/node", "get_namespace": lambda: "/",
+        "loginfo": ignore, "logwarn": ignore, "logerr": ignore, "logdebug": ignore, "logwarn_throttle": ignore,
+        "loginfo_throttle": ignore,
+    }
+
+
+# tf
+
+def quaternion_matrix(q):
+    x, y, z, w = q
+    matrix = np.identity(4)
+    matrix[:3, :3] = [[1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+                      [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+                      [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)]]
+    return matrix
+
+
+def quaternion_from_matrix(matrix):
+    m = np.asarray(matrix, dtype=float)[:3, :3]
+    w = math.sqrt(max(0.0, 1.0 + m[0, 0] + m[1, 1] + m[2, 2])) / 2.0
+    x = math.copysign(math.sqrt(max(0.0, 1.0 + m[0, 0] - m[1, 1] - m[2, 2])) / 2.0, m[2, 1] - m[1, 2])
+    y = math.copysign(math.sqrt(max(0.0, 1.0 - m[0, 0] + m[1, 1] - m[2, 2])) / 2.0, m[0, 2] - m[2, 0])
+    z = math.copysign(math.sqrt(max(0.0, 1.0 - m[0, 0] - m[1, 1] + m[2, 2])) / 2.0, m[1, 0] - m[0, 1])
+    return np.array([x, y, z, w])
+
+
+def quaternion_multiply(q1, q0):
+    x0, y0, z0, w0 = q0
+    x1, y1, z1, w1 = q1
+    return np.array([x1 * w0 + y1 * z0 - z1 * y0 + w1 * x0,
+                     -x1 * z0 + y1 * w0 + z1 * x0 + w1 * y0,
+                     x1 * y0 - y1 * x0 + z1 * w0 + w1 * z0,
+                     -x1 * x0 - y1 * y0 - z1 * z0 + w1 * w0])
+
+
+def quaternion_conjugate(q):
+    return np.array([-q[0], -q[1], -q[2], q[3]])
+
+
+def quaternion_from_euler(ai, aj, ak):
+    # static xyz
+    ci, si = math.cos(ai / 2), math.sin(ai / 2)
+    cj, sj = math.cos(aj / 2), math.sin(aj / 2)
+    ck, sk = math.cos(ak / 2), math.sin(ak / 2)
+    return np.array([si * cj * ck - ci * sj * sk, ci * sj * ck + si * cj * sk,
+                     ci * cj * sk - si * sj * ck, ci * cj * ck + si * sj * sk])
+
+
+def euler_from_quaternion(q):
+    m = quaternion_matrix(q)
+    return (math.atan2(m[2, 1], m[2, 2]), math.atan2(-m[2, 0], math.hypot(m[2, 1], m[2, 2])), math.atan2(m[1, 0], m[0, 0]))
+
+
+class TransformListener:
+    """Knows no frames, the nodes get their transforms from /tf_static (see latch)."""
+
+    def waitForTransform(self, target_frame, source_frame, stamp, timeout):
+        raise TfException(f"No transform from {source_frame} to {target_frame}")
+
+    lookupTransform = waitForTransform
+
+
+class TfException(Exception):
+    pass
+
+
+def get_jacobian_platform_with_eef(x, y):
+    # twist of the EEF at (x, y) in the MiR frame from the MiR twist (vx, vy, wz)
+    return np.array([[1.0, 0.0, -y], [0.0, 1.0, x], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+
+
+def install(node_params=None):
+    """Replace rospy, tf, match_lib and the message packages in sys.modules."""
+    params.clear()
+    params.update(node_params or {})
+    global_params.clear()
+    publishers.clear()
+    subscribers.clear()
+    latched.clear()
+
+    packages, srvs = _message_types()
+    for package, classes in packages.items():
+        _module(package)
+        _module(f"{package}.msg", **classes)
+    _module("std_srvs")
+    _module("std_srvs.srv", **srvs)
+
+    types_by_name = {name: cls for classes in packages.values() for name, cls in classes.items()}
+    import print_path_msgs  # the real package, only its generated messages are missing
+    _module("print_path_msgs.msg", **_repo_messages("print_path_msgs", types_by_name))
+
+    rospy = _module("rospy", **_rospy())
+    _module("rospy.rostime", Time=Time, Duration=Duration)
+    rospy.rostime = sys.modules["rospy.rostime"]
+    _module("rospkg", RosPack=_Handle)
+
+    _module("tf", TransformListener=TransformListener, Exception=TfException, LookupException=TfException,
+            ConnectivityException=TfException, ExtrapolationException=TfException)
+    _module("tf.transformations", quaternion_matrix=quaternion_matrix, quaternion_from_matrix=quaternion_from_matrix,
+            quaternion_multiply=quaternion_multiply, quaternion_conjugate=quaternion_conjugate,
+            quaternion_from_euler=quaternion_from_euler, euler_from_quaternion=euler_from_quaternion)
+
+    for name in ("match_lib", "match_lib.robot_mats", "match_lib.robot_mats.jacobians"):
+        _module(name)
+    _module("match_lib.robot_mats.jacobians.jacobian_platform", getJacobianPlatformWithEEF=get_jacobian_platform_with_eef)
+
+
+def latch(topic, msg):
+    """Latched message, handed to every subscriber of topic that is created afterwards."""
+    latched[_resolve(topic)] = msg
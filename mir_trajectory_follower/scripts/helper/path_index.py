@@ -0,0 +1,71 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class PathSegmentIndex:
+    """Nearest segment lookup on a 2d polyline.
+
+    Segment i goes from point i to point i+1. Lookups return (segment, t, arc_length, distance)
+    with t in [0, 1] the position of the projection on the segment.
+    """
+
+    def __init__(self, points):
+        points = np.asarray(points, dtype=float)[:, :2]
+        self.points = points
+        self.starts = points[:-1]
+        self.deltas = np.diff(points, axis=0)
+        self.lengths = np.hypot(self.deltas[:, 0], self.deltas[:, 1])
+        self.arc_length = np.concatenate(([0.0], np.cumsum(self.lengths)))
+        # zero length segments project onto their start point
+        length_sq = self.lengths ** 2
+        self.inv_length_sq = np.divide(1.0, length_sq, out=np.zeros_like(length_sq), where=length_sq > 0.0)
+
+        # kd-tree over the segment midpoints. A segment within distance d of a point
+        # has its midpoint within d + length/2, which bounds the candidate search.
+        self.tree = cKDTree(self.starts + 0.5 * self.deltas) if len(self.lengths) else None
+        self.max_half_length = 0.5 * self.lengths.max() if len(self.lengths) else 0.0
+
+    @property
+    def num_segments(self):
+        return len(self.lengths)
+
+    def _project(self, point, segments):
+        rel = np.asarray(point, dtype=float)[:2] - self.starts[segments]
+        deltas = self.deltas[segments]
+        t = np.clip(np.einsum("ij,ij->i", rel, deltas) * self.inv_length_sq[segments], 0.0, 1.0)
+        offset = rel - t[:, None] * deltas
+        dist_sq = np.einsum("ij,ij->i", offset, offset)
+        best = np.argmin(dist_sq)
+        segment = int(segments[best])
+        return segment, float(t[best]), self.arc_length[segment] + t[best] * self.lengths[segment], float(np.sqrt(dist_sq[best]))
+
+    def nearest_in_window(self, point, first_segment, window):
+        """Closest segment among first_segment .. first_segment+window-1, O(window)."""
+        first = min(max(0, first_segment), self.num_segments - 1)
+        last = min(self.num_segments, first + max(1, window))
+        return self._project(point, np.arange(first, last))
+
+    def nearest(self, point, min_segment=0, max_segment=None):
+        """Closest segment on the whole path, optionally only min_segment .. max_segment, O(log n) on average."""
+        if self.num_segments == 0:
+            raise ValueError("Path has no segments")
+        point = np.asarray(point, dtype=float)[:2]
+        min_segment = min(max(0, min_segment), self.num_segments - 1)
+        max_segment = self.num_segments - 1 if max_segment is None else min(max(min_segment, max_segment), self.num_segments - 1)
+        midpoint_distance, _ = self.tree.query(point)
+        radius = midpoint_distance
+        while True:
+            candidates = np.asarray(self.tree.query_ball_point(point, radius + self.max_half_length), dtype=int)
+            candidates = candidates[(candidates >= min_segment) & (candidates <= max_segment)]
+            if len(candidates) == 0:
+                # every close segment lies outside the allowed range
+                return self._project(point, np.arange(min_segment, max_segment + 1))
+            result = self._project(point, candidates)
+            if result[3] <= radius:
+                return result
+            # best allowed segment is farther than the search radius, widen it once to be exact
+            radius = result[3]
+
+    def segment_at(self, arc_length):
+        """Segment that contains the given arc length, clamped to the path."""
+        return min(max(int(np.searchsorted(self.arc_length, arc_length, side="right")) - 1, 0), self.num_segments - 1)
@@ -0,0 +1,63 @@
+import numpy as np
+
+
+def arc_length_table(points):
+    """Cumulative arc length at every point of a polyline (any dimension)."""
+    points = np.asarray(points, dtype=float)
+    if len(points) == 0:
+        return np.zeros(0)
+    return np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))))
+
+
+class PathSynchronizer:
+    """Couples MiR and UR by their normalized arc length progress instead of raw indices.
+
+    Both paths describe the same print with different point densities, so index i on one
+    path and index i on the other are not the same place. Progress p = s / total_length is.
+    Index mapping between the paths goes through a uniform progress table and is O(1).
+
+    The speed command is feedforward (nominal MiR speed) plus gain * lag, where lag is the
+    progress difference expressed in meters along the MiR path.
+    """
+
+    def __init__(self, mir_arc_length, ur_arc_length, gain=0.5, max_velocity=0.2):
+        self.mir_arc_length = mir_arc_length
+        self.mir_length = mir_arc_length[-1]
+        self.mir_progress = mir_arc_length / max(self.mir_length, 1e-9)
+        self.ur_progress = ur_arc_length / max(ur_arc_length[-1], 1e-9)
+        self.gain = gain
+        self.max_velocity = max_velocity
+
+        # progress -> index tables, as fine as the denser path
+        self.table_size = max(len(self.mir_progress), len(self.ur_progress))
+        grid = np.linspace(0.0, 1.0, self.table_size)
+        self.mir_index_table = self._index_table(self.mir_progress, grid)
+        self.ur_index_table = self._index_table(self.ur_progress, grid)
+
+    @staticmethod
+    def _index_table(progress, grid):
+        # last point whose progress is not beyond the grid value
+        return np.clip(np.searchsorted(progress, grid, side="right") - 1, 0, len(progress) - 1)
+
+    def _cell(self, progress):
+        return min(max(int(progress * (self.table_size - 1)), 0), self.table_size - 1)
+
+    def ur_progress_at(self, ur_idx):
+        return self.ur_progress[min(max(ur_idx, 0), len(self.ur_progress) - 1)]
+
+    def mir_progress_at(self, mir_idx):
+        return self.mir_progress[min(max(mir_idx, 0), len(self.mir_progress) - 1)]
+
+    def ur_to_mir_index(self, ur_idx):
+        return int(self.mir_index_table[self._cell(self.ur_progress_at(ur_idx))])
+
+    def mir_to_ur_index(self, mir_idx):
+        return int(self.ur_index_table[self._cell(self.mir_progress_at(mir_idx))])
+
+    def lag(self, mir_arc_length, ur_idx):
+        # how far (m along the MiR path) the MiR is behind the UR, negative if it is ahead
+        return self.ur_progress_at(ur_idx) * self.mir_length - mir_arc_length
+
+    def speed(self, feedforward, mir_arc_length, ur_idx):
+        speed = feedforward + self.gain * self.lag(mir_arc_length, ur_idx)
+        return min(max(speed, 0.0), self.max_velocity)
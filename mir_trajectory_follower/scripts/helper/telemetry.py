@@ -0,0 +1,76 @@
+from collections import deque
+
+import rospy
+from geometry_msgs.msg import TransformStamped
+from tf2_msgs.msg import TFMessage
+
+
+class TransformTelemetry:
+    """Debug frames of the control loop, published as one tf2_msgs/TFMessage per cycle.
+
+    The control loop only sets frames and closes the cycle. With rate > 0 a closed cycle
+    goes into a bounded ring buffer and a rospy.Timer (own thread) publishes the newest
+    one at that rate, older cycles are dropped. With rate <= 0 every cycle is published
+    directly from the control loop.
+    """
+
+    def __init__(self, rate=20.0, buffer_size=8, topic="/tf"):
+        self.frames = {}  # child frame -> (parent frame, translation, rotation)
+        self.changed = False
+        self.buffer = deque(maxlen=buffer_size)
+        self.messages = {}  # child frame -> TransformStamped, reused for every publish
+        self.published = 0
+        self.dropped = 0
+        self.publisher = rospy.Publisher(topic, TFMessage, queue_size=1)
+        self.timer = rospy.Timer(rospy.Duration(1.0 / rate), self.publish_latest) if rate > 0 else None
+
+    def set_frame(self, child, parent, translation, rotation):
+        self.frames[child] = (parent, translation, rotation)
+        self.changed = True
+
+    def end_cycle(self):
+        if not self.changed:
+            return
+        self.changed = False
+        # snapshot of all frames, set_frame of the next cycle does not touch it
+        snapshot = (rospy.Time.now(), tuple(self.frames.items()))
+        if self.timer is None:
+            self.publish_snapshot(snapshot)
+        else:
+            self.buffer.append(snapshot)
+
+    def publish_latest(self, event=None):
+        # deque appends and pops are atomic, the control loop never waits for this thread
+        try:
+            snapshot = self.buffer.popleft()
+        except IndexError:
+            return
+        while True:
+            try:
+                snapshot = self.buffer.popleft()
+            except IndexError:
+                break
+            self.dropped += 1
+        self.publish_snapshot(snapshot)
+
+    def publish_snapshot(self, snapshot):
+        stamp, frames = snapshot
+        transforms = []
+        for child, (parent, translation, rotation) in frames:
+            msg = self.messages.get(child)
+            if msg is None:
+                msg = TransformStamped()
+                msg.child_frame_id = child
+                self.messages[child] = msg
+            msg.header.frame_id = parent
+            msg.header.stamp = stamp
+            t, r = msg.transform.translation, msg.transform.rotation
+            t.x, t.y, t.z = translation
+            r.x, r.y, r.z, r.w = rotation
+            transforms.append(msg)
+        self.publisher.publish(TFMessage(transforms))
+        self.published += 1
+
+    def shutdown(self):
+        if self.timer is not None:
+            self.timer.shutdown()
@@ -0,0 +1,109 @@
+import numpy as np
+from scipy.ndimage import minimum_filter1d
+
+# m/s, lowest speed limit (or min_velocity if higher) and lowest mean speed of a grid cell in the
+# time integration. Keeps the duration of the profile bounded by length / MIN_SPEED.
+MIN_SPEED = 0.005
+
+
+class VelocityProfile:
+    """Time parameterization of a 2d path with velocity, acceleration and jerk limits.
+
+    The path is resampled to a uniform arc length grid. On that grid the squared speed
+    is limited by a forward (acceleration) and a backward (deceleration) pass, both written
+    as running minima so they are vectorized. The result is resampled in time and smoothed
+    with a moving average of length 2*a_max/j_max, which bounds the jerk. The speed limit is
+    eroded by the same window beforehand, so the smoothing can not exceed it.
+
+    Dense result (uniform time grid with step dt): time, arc_length, velocity, acceleration.
+    speed_at(s) is an O(1) table lookup by arc length. A path not longer than one grid cell
+    gets a standing two sample profile.
+    """
+
+    def __init__(self, points, max_velocity, max_acceleration, max_jerk, ds=0.005, dt=0.01,
+                 min_velocity=0.0, speed_limits=None):
+        points = np.asarray(points, dtype=float)[:, :2]
+        segment_lengths = np.hypot(*np.diff(points, axis=0).T)
+        path_s = np.concatenate(([0.0], np.cumsum(segment_lengths)))
+        self.length = path_s[-1]
+        self.ds = ds
+        self.dt = dt
+        self.min_velocity = min_velocity
+
+        # uniform arc length grid, last sample exactly at the path end
+        grid_s = np.append(np.arange(0.0, self.length, ds), self.length)
+        if len(grid_s) < 3:
+            self._set_standstill(grid_s)
+            return
+        min_speed = max(min_velocity, MIN_SPEED)
+        limit = np.full(len(grid_s), max(float(max_velocity), min_speed))
+        if speed_limits is not None:
+            # a zero limit would stop the robot on the path for good
+            limit = np.minimum(limit, np.fmax(np.interp(grid_s, path_s, speed_limits), min_speed))
+
+        # jerk limit: moving average over smooth_time in the time domain
+        smooth_time = 2.0 * max_acceleration / max_jerk if max_jerk > 0.0 else 0.0
+        smooth_samples = max(1, int(round(smooth_time / dt)))
+        erode_cells = int(np.ceil(0.5 * max_velocity * smooth_time / ds))
+        if erode_cells > 0:
+            limit = minimum_filter1d(limit, size=2 * erode_cells + 1, mode="nearest")
+
+        u_limit = limit ** 2
+        u_limit[0] = 0.0
+        u_limit[-1] = 0.0
+        two_a_s = 2.0 * max_acceleration * grid_s
+        # forward pass u[i+1] = min(L[i+1], u[i] + 2*a*ds) <=> running minimum of L - 2*a*s
+        u = np.minimum.accumulate(u_limit - two_a_s) + two_a_s
+        # backward pass u[i] = min(u[i], u[i+1] + 2*a*ds) <=> reversed running minimum of u + 2*a*s
+        u = np.minimum.accumulate((u + two_a_s)[::-1])[::-1] - two_a_s
+        v = np.sqrt(np.clip(u, 0.0, None))
+
+        # time at every grid point, v is piecewise linear in s between two samples. The mean speed
+        # of a cell is floored at the one of a ramp up from standstill over the cell, and the step
+        # time of a cell where the robot (nearly) stands is capped at ds / MIN_SPEED.
+        cell = np.diff(grid_s)
+        min_mean_speed = np.maximum(0.5 * np.sqrt(2.0 * max_acceleration * cell), MIN_SPEED * cell / ds)
+        step_time = cell / np.maximum(0.5 * (v[1:] + v[:-1]), min_mean_speed)
+        grid_t = np.concatenate(([0.0], np.cumsum(step_time)))
+
+        # resample on uniform time and smooth, zero padded (robot stands before and after). The time
+        # grid is stretched by less than dt to end exactly at the stop, a cut off last sample would
+        # drop the speed to 0 within one step.
+        steps = max(int(np.ceil(grid_t[-1] / dt)), 1)
+        time = np.arange(steps + 1) * dt
+        velocity = np.interp(time * (grid_t[-1] / time[-1]), grid_t, v)
+        if smooth_samples > 1:
+            # full convolution with a box of smooth_samples, via the cumulative sum
+            cumulative = np.concatenate(([0.0], np.cumsum(velocity)))
+            k = np.arange(len(velocity) + smooth_samples - 1)
+            upper = np.minimum(k + 1, len(velocity))
+            lower = np.maximum(k + 1 - smooth_samples, 0)
+            velocity = (cumulative[upper] - cumulative[lower]) / smooth_samples
+            time = np.arange(len(velocity)) * dt
+
+        arc_length = np.concatenate(([0.0], np.cumsum(0.5 * (velocity[1:] + velocity[:-1]) * dt)))
+        if arc_length[-1] > 0.0:
+            # remove the discretization error, the profile has to end exactly at the path end
+            arc_length *= self.length / arc_length[-1]
+
+        self.time = time
+        self.arc_length = arc_length
+        self.velocity = velocity
+        self.acceleration = np.gradient(velocity, dt) if len(velocity) > 1 else np.zeros_like(velocity)
+        self.duration = time[-1] if len(time) else 0.0
+
+        # lookup table by arc length on the uniform grid
+        self.speed_table = np.interp(grid_s, arc_length, velocity)
+
+    def _set_standstill(self, grid_s):
+        self.time = np.array([0.0, self.dt])
+        self.arc_length = np.array([0.0, self.length])
+        self.velocity = np.zeros(2)
+        self.acceleration = np.zeros(2)
+        self.duration = self.dt
+        self.speed_table = np.zeros(len(grid_s))
+
+    def speed_at(self, s):
+        k = int(s / self.ds)
+        k = min(max(k, 0), len(self.speed_table) - 1)
+        return max(self.speed_table[k], self.min_velocity)
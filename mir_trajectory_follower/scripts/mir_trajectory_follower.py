@@ -1,87 +1,321 @@
 #! /usr/bin/env python3
 import rospy
 from nav_msgs.msg import Path
-from geometry_msgs.msg import PoseStamped, Twist, Pose, Quaternion
+from geometry_msgs.msg import PoseStamped, Twist, Pose, Point, Quaternion
 from std_msgs.msg import Empty, Bool, Int32
 from tf.transformations import euler_from_quaternion
 import tf.transformations as tr
 import math
-from tf import TransformBroadcaster
+import numpy as np
+from collections import deque, namedtuple
+from print_path_msgs.msg import PathChunk, PathGeometry, PathManifest
+from print_path_msgs.path_chunks import PathChunkAssembler, manifest_topic, chunk_topic
+from helper.path_index import PathSegmentIndex
+from helper.velocity_profile import MIN_SPEED, VelocityProfile
+from helper.path_sync import PathSynchronizer, arc_length_table
+from helper.telemetry import TransformTelemetry
+from node_instrumentation import Instrumentation
+import print_checkpoint
+
+# controller states
+IDLE = "idle"
+RUNNING = "running"
+PAUSED = "paused"
+RESUME = "resume"  # command only: start at the checkpointed waypoint
+
+# Everything the control loop needs about a path. Callbacks replace the whole tuple,
+# so the timer thread always sees a consistent set without locking.
+FollowerPath = namedtuple("FollowerPath", ["poses", "velocities", "index", "profile", "complete"])
 
 class PathFollowerNode:
     def __init__(self):
         rospy.init_node('path_follower_node')
         
         # Config
-        self.path = []
-        self.velocities = []
+        self.path = FollowerPath([], [], None, None, False)
         self.distance_threshold = rospy.get_param("~distance_threshold", 0.15)
         self.Kp = rospy.get_param("~Kp", 1.0)
         self.Kw = rospy.get_param("~Kw", 1.0)
-        self.mir_path_topic = rospy.get_param("~mir_path_topic", "/mir_path_original")
-        self.mir_pose_topic = rospy.get_param("~mir_pose_topic", "/mur620a/mir_pose_simple")
-        self.cmd_vel_topic = rospy.get_param("~cmd_vel_topic", "/mur620a/mobile_base_controller/cmd_vel")
-        self.trajectory_index_topic = rospy.get_param("~trajectory_index_topic", "/trajectory_index")
+        # path and command topics are relative, one follower per robot namespace (see parse_path.service)
+        self.robot_name = rospy.get_param("~robot_name", "mur620a")
+        self.ur_name = rospy.get_param("~ur_name", "UR10_r")
+        self.mir_path_topic = rospy.get_param("~mir_path_topic", "mir_path_original")
+        self.ur_path_topic = rospy.get_param("~ur_path_topic", "ur_path_original")
+        # curvature speed limits of the parser, parallel to the poses of the MiR path
+        self.geometry_topic = rospy.get_param("~geometry_topic", "mir_path_geometry")
+        self.mir_pose_topic = rospy.get_param("~mir_pose_topic", f"/{self.robot_name}/mir_pose_simple")
+        self.ur_pose_topic = rospy.get_param("~ur_pose_topic", f"/{self.robot_name}/{self.ur_name}/global_tcp_pose")
+        self.cmd_vel_topic = rospy.get_param("~cmd_vel_topic", f"/{self.robot_name}/mobile_base_controller/cmd_vel")
+        self.trajectory_index_topic = rospy.get_param("~trajectory_index_topic", "trajectory_index")
         self.control_rate = rospy.get_param("~control_rate", 100)
+        self.lookahead_window = rospy.get_param("~lookahead_window", 20)  # segments searched ahead of the target
+        self.relocalize_distance = rospy.get_param("~relocalize_distance", 0.5)
+        # relocalization only searches this far (m) along the path, every layer retraces the same contour
+        self.relocalize_search_length = rospy.get_param("~relocalize_search_length", 2.0)
+        # velocity profile limits
+        self.max_velocity = rospy.get_param("~max_velocity", 0.1)
+        self.max_acceleration = rospy.get_param("~max_acceleration", 0.1)
+        self.max_jerk = rospy.get_param("~max_jerk", 0.5)
+        self.min_velocity = rospy.get_param("~min_velocity", 0.01)  # keeps the robot moving off the start point
+        # steer towards the path point this far (m) ahead of the robot instead of the target waypoint, 0 = waypoint
+        self.heading_lookahead = rospy.get_param("~heading_lookahead", 0.0)
+        # MiR/UR synchronization on arc length progress
+        self.sync_gain = rospy.get_param("~sync_gain", 0.5)
+        self.sync_max_velocity = rospy.get_param("~sync_max_velocity", 0.2)
+        # fallback without UR path: speed scale per index the UR is ahead
+        self.index_coupling_gain = rospy.get_param("~index_coupling_gain", 0.1)
+        # target_position / current_position frames, batched per cycle and published at this rate (0 = every cycle)
+        self.visualization_rate = rospy.get_param("~visualization_rate", 20.0)
+        self.visualization_buffer = rospy.get_param("~visualization_buffer", 8)
         
         # Subscriber
         rospy.Subscriber(self.mir_path_topic, Path, self.path_callback)
+        # streamed path (chunked publish mode of the path parsers)
+        self.path_assembler = PathChunkAssembler(self.path_chunks_callback)
+        rospy.Subscriber(manifest_topic(self.mir_path_topic), PathManifest, self.path_assembler.manifest_callback)
+        rospy.Subscriber(chunk_topic(self.mir_path_topic), PathChunk, self.path_assembler.chunk_callback)
+        # UR path, only needed for its arc length. The original one, so its indices match trajectory_index of the UR follower
+        rospy.Subscriber(self.ur_path_topic, Path, self.ur_path_callback)
+        self.ur_path_assembler = PathChunkAssembler(self.ur_path_chunks_callback)
+        rospy.Subscriber(manifest_topic(self.ur_path_topic), PathManifest, self.ur_path_assembler.manifest_callback)
+        rospy.Subscriber(chunk_topic(self.ur_path_topic), PathChunk, self.ur_path_assembler.chunk_callback)
+        rospy.Subscriber(self.geometry_topic, PathGeometry, self.geometry_callback)
         rospy.Subscriber(self.mir_pose_topic, Pose, self.pose_callback)
+        rospy.Subscriber(self.ur_pose_topic, PoseStamped, self.ur_pose_callback)
         rospy.Subscriber(self.trajectory_index_topic, Int32, self.trajectory_index_callback)
         
         # Publisher 
         self.cmd_vel_pub = rospy.Publisher(self.cmd_vel_topic, Twist, queue_size=1)
         
         # Start und Status
-        rospy.Subscriber("/start_follow_path", Empty, self.start_callback)
-        self.completion_pub = rospy.Publisher("/path_following_complete", Bool, queue_size=1)
+        rospy.Subscriber("start_follow_path", Empty, self.start_callback)
+        rospy.Subscriber("pause_follow_path", Empty, self.pause_callback)
+        rospy.Subscriber("abort_follow_path", Empty, self.abort_callback)
+        rospy.Subscriber("resume_follow_path", Empty, self.resume_callback)
+        self.completion_pub = rospy.Publisher("path_following_complete", Bool, queue_size=1)
         
         # Init
         self.current_pose = None
-        self.is_active = False
+        self.ur_position = None
+        self.state = IDLE
+        self.commands = deque()  # filled by the command callbacks, consumed by the control loop
+        self.active_path = self.path
+        self.target_idx = 0
+        self.broadcast_idx = -1
         self.controller_output = Twist()
-        self.broadcaster = TransformBroadcaster()
+        self.aim_point = Point()
+        self.telemetry = TransformTelemetry(self.visualization_rate, self.visualization_buffer)
+        # debug frames of several followers must not collide, e.g. mur620b/target_position
+        namespace = rospy.get_namespace().strip("/")
+        self.target_frame = f"{namespace}/target_position" if namespace else "target_position"
+        self.current_frame = f"{namespace}/current_position" if namespace else "current_position"
         self.ur_trajectory_index = 0
+        self.ur_arc_length = None
+        self.path_sync = None
+        self.geometry = None
+
+        # timing of the control loop and its parts, see node_instrumentation
+        self.instrumentation = Instrumentation.from_params()
+        self.loop_monitor = self.instrumentation.loop("control_step", self.control_rate)
+        self.align_timer = self.instrumentation.timer("align_robot")
+        self.broadcast_timer = self.instrumentation.timer("telemetry")
+        self.publish_timer = self.instrumentation.timer("publish_cmd_vel")
+        self.checkpoint_timer = self.instrumentation.timer("checkpoint")
 
-    def calculate_velocities(self):
-        self.velocities = []
-        for i in range(len(self.path) - 1):
-            p1 = self.path[i].pose.position
-            p2 = self.path[i + 1].pose.position
+        # progress for resuming an interrupted print, ~checkpoint_file, ~checkpoint_period (s, 0 = off)
+        self.checkpoint_writer = print_checkpoint.CheckpointWriter.from_params()
+        self.checkpoint_arc_length = None
+        rospy.on_shutdown(self.checkpoint_writer.close)
+
+        self.control_timer = rospy.Timer(rospy.Duration(1.0 / self.control_rate), self.control_step)
+
+    def calculate_velocities(self, poses, velocities):
+        # only segments added since the last call, a streamed path grows chunk by chunk
+        for i in range(len(velocities), len(poses) - 1):
+            p1 = poses[i].pose.position
+            p2 = poses[i + 1].pose.position
             distance = math.sqrt((p2.x - p1.x) ** 2 + (p2.y - p1.y) ** 2)
             speed = distance  # Goal: reach the next point in 1 second
-            self.velocities.append(speed)
-        #print("Velocities: ", self.velocities)
+            velocities.append(speed)
+        #print("Velocities: ", velocities)
+        return velocities
 
     def start_callback(self, msg):
-        if not self.path:
+        if not self.path.poses:
             rospy.logwarn("Got no path. Ignoring start command")
             return
-        self.is_active = True
         rospy.loginfo("Start commnand received. Starting ...")
-        self.follow_path()
+        self.commands.append(RUNNING)
 
-    def follow_path(self):
-        for idx, target_pose in enumerate(self.path):
-            target_position = target_pose.pose.position
-            target_orientation = target_pose.pose.orientation
-            speed = self.velocities[idx]
-            
+    def pause_callback(self, msg):
+        self.commands.append(PAUSED)
+
+    def abort_callback(self, msg):
+        self.commands.append(IDLE)
+
+    def resume_callback(self, msg):
+        if not self.path.poses:
+            rospy.logwarn("Got no path. Ignoring resume command")
+            return
+        self.commands.append(RESUME)
+
+    def load_checkpoint(self):
+        # waypoint to resume at, None if there is no usable checkpoint for the current path
+        try:
+            checkpoint = print_checkpoint.read_last(self.checkpoint_writer.filename)
+        except ValueError as e:
+            rospy.logwarn("Can not read the checkpoint, starting without: %s", e)
+            return None
+        if checkpoint is None:
+            rospy.logwarn("No checkpoint in %s, cannot resume", self.checkpoint_writer.filename)
+            return None
+        if checkpoint.status == print_checkpoint.COMPLETE:
+            rospy.logwarn("Last print was completed, nothing to resume")
+            return None
+        if checkpoint.n_poses != len(self.path.poses):
+            rospy.logwarn("Checkpoint is of a path with %d poses, current path has %d", checkpoint.n_poses, len(self.path.poses))
+            return None
+        return checkpoint.index
+
+    def process_commands(self):
+        while self.commands:
+            command = self.commands.popleft()
+            if command in (RUNNING, RESUME) and self.state == IDLE:
+                start_idx = 0
+                if command == RESUME:
+                    start_idx = self.load_checkpoint()
+                    if start_idx is None:
+                        continue
+                    rospy.loginfo("Resuming print at checkpointed waypoint %d", start_idx)
+                self.active_path = self.path
+                self.target_idx = start_idx
+                self.broadcast_idx = -1
+                self.checkpoint_arc_length = None
+                self.state = RUNNING
+            elif command in (RUNNING, RESUME) and self.state == PAUSED:
+                rospy.loginfo("Resuming at waypoint %d", self.target_idx)
+                self.state = RUNNING
+            elif command == PAUSED and self.state == RUNNING:
+                rospy.loginfo("Paused at waypoint %d", self.target_idx)
+                self.state = PAUSED
+                self.stop_robot()
+                self.write_checkpoint(print_checkpoint.PAUSED, force=True)
+            elif command == IDLE and self.state != IDLE:
+                rospy.logwarn("Path following aborted at waypoint %d", self.target_idx)
+                self.state = IDLE
+                self.stop_robot()
+                self.write_checkpoint(print_checkpoint.ABORTED, force=True)
+                self.completion_pub.publish(Bool(data=False))
+
+    def control_step(self, event):
+        with self.loop_monitor:
+            self.control_cycle()
+            with self.broadcast_timer:
+                self.telemetry.end_cycle()
+
+    def control_cycle(self):
+        self.process_commands()
+        if self.state != RUNNING:
+            return
+
+        # a streamed path grows in place, a new path is only taken over on the next start
+        path = self.path
+        if path.poses is self.active_path.poses:
+            self.active_path = path
+        poses, velocities, path_index, profile, complete = self.active_path
+
+        idx = self.target_idx
+        # skip all waypoints that are already reached, at most one look-ahead window per tick
+        last_idx = idx + self.lookahead_window
+        while idx < len(poses) and idx < last_idx and self.reached_target(poses[idx].pose.position):
+            idx += 1
+        location = self.locate_robot(idx, path_index) if idx < len(poses) else None
+        if location is not None:
+            segment, t, _, _ = location
+            if segment >= idx and t > 0.0:
+                # robot is already beyond this waypoint, continue with the one after its segment
+                idx = segment + 1
+        self.target_idx = idx
+
+        if idx >= len(poses) - 1 and not complete:
+            # streamed path: wait until the next chunk arrived
+            return
+        if idx >= len(poses):
+            self.finish_path()
+            return
+
+        target_pose = poses[idx]
+        target_position = target_pose.pose.position
+        if idx != self.broadcast_idx:
             #broadcast target position
-            self.broadcaster.sendTransform((target_position.x, target_position.y, target_position.z), (target_orientation.x, target_orientation.y, target_orientation.z, target_orientation.w), rospy.Time.now(), "target_position", "map")
-            rate = rospy.Rate(self.control_rate)
-            while not rospy.is_shutdown() and self.is_active and not self.reached_target(target_position):
-                self.align_robot(target_position)
-                self.move_toward_target(speed,idx)
-                rate.sleep() 
-            
-            if not self.is_active:
-                break
-        
-        self.is_active = False
+            target_orientation = target_pose.pose.orientation
+            self.telemetry.set_frame(self.target_frame, "map", (target_position.x, target_position.y, target_position.z), (target_orientation.x, target_orientation.y, target_orientation.z, target_orientation.w))
+            self.broadcast_idx = idx
+
+        s = None
+        if path_index is not None:
+            # arc length of the robot, or of the last waypoint if it could not be located
+            s = location[2] if location is not None else path_index.arc_length[max(idx - 1, 0)]
+        if profile is not None:
+            speed = profile.speed_at(s)
+        else:
+            speed = velocities[min(idx, len(velocities) - 1)]
+        with self.align_timer:
+            self.align_robot(self.aim(target_position, s, path_index))
+        self.move_toward_target(speed, idx, s, path_index)
+        self.checkpoint_arc_length = s
+        with self.checkpoint_timer:
+            self.write_checkpoint(print_checkpoint.RUNNING)
+
+    def write_checkpoint(self, status, force=False):
+        # a no-op until the checkpoint period passed, writes are rare and small
+        mir_pose = None
+        if self.current_pose is not None:
+            p, q = self.current_pose.position, self.current_pose.orientation
+            mir_pose = (p.x, p.y, math.atan2(2.0 * (q.w * q.z + q.x * q.y), 1.0 - 2.0 * (q.y * q.y + q.z * q.z)))
+        self.checkpoint_writer.update(rospy.Time.now().to_sec(), status, self.target_idx, len(self.active_path.poses),
+                                      self.checkpoint_arc_length, mir_pose, self.ur_position, force)
+
+    def finish_path(self):
+        self.state = IDLE
+        self.stop_robot()
+        self.write_checkpoint(print_checkpoint.COMPLETE, force=True)
         self.completion_pub.publish(Bool(data=True))
         rospy.loginfo("Pfadverfolgung abgeschlossen.")
 
+    def stop_robot(self):
+        self.controller_output = Twist()
+        self.cmd_vel_pub.publish(self.controller_output)
+
+    def locate_robot(self, idx, path_index):
+        # projection of the robot on the path around target idx: (segment, t, arc length, distance)
+        if path_index is None or self.current_pose is None:
+            return None
+        position = self.current_pose.position
+        point = (position.x, position.y)
+        location = path_index.nearest_in_window(point, idx - 1, self.lookahead_window + 1)
+        if location[3] > self.relocalize_distance:
+            # disturbed: search ahead, never back to already printed parts and never onto a later layer
+            first = max(idx - 1, 0)
+            last = path_index.segment_at(path_index.arc_length[min(first, path_index.num_segments - 1)]
+                                         + self.relocalize_search_length)
+            location = path_index.nearest(point, min_segment=first, max_segment=last)
+        return location
+
+    def aim(self, target_position, s, path_index):
+        # the waypoints of jittery stretches point in all directions, a point further along the path does not
+        if self.heading_lookahead <= 0.0 or s is None:
+            return target_position
+        arc_length = path_index.arc_length
+        s = min(s + self.heading_lookahead, arc_length[-1])
+        k = min(max(int(np.searchsorted(arc_length, s)), 1), len(arc_length) - 1)
+        length = arc_length[k] - arc_length[k - 1]
+        t = (s - arc_length[k - 1]) / length if length > 0.0 else 0.0
+        start, end = path_index.points[k - 1], path_index.points[k]
+        self.aim_point.x = start[0] + t * (end[0] - start[0])
+        self.aim_point.y = start[1] + t * (end[1] - start[1])
+        return self.aim_point
+
     def reached_target(self, target_position):
         if self.current_pose is None:
             return False
@@ -100,7 +334,7 @@ class PathFollowerNode:
         current_orientation = self.current_pose.orientation
 
         # broadcast current position
-        self.broadcaster.sendTransform((current_position.x, current_position.y, current_position.z), (current_orientation.x, current_orientation.y, current_orientation.z, current_orientation.w), rospy.Time.now(), "current_position", "map")
+        self.telemetry.set_frame(self.current_frame, "map", (current_position.x, current_position.y, current_position.z), (current_orientation.x, current_orientation.y, current_orientation.z, current_orientation.w))
 
         # Richtung zum Zielpunkt als Ziel-Orientierung berechnen
         angle_to_target = math.atan2(target_position.y - current_position.y, target_position.x - current_position.x)
@@ -126,20 +360,89 @@ class PathFollowerNode:
     
         self.controller_output.angular.z = angle_diff*self.Kw
 
-    def move_toward_target(self, speed, mir_idx):
-        # compute index error
-        index_error = self.ur_trajectory_index - mir_idx
-        
-        self.controller_output.linear.x = speed* self.Kp * (1.0 + 0.1*index_error)
-        self.cmd_vel_pub.publish(self.controller_output)
+    def move_toward_target(self, speed, mir_idx, mir_arc_length=None, path_index=None):
+        path_sync = self.path_sync
+        if path_sync is not None and mir_arc_length is not None and path_sync.mir_arc_length is path_index.arc_length:
+            # feedforward plus feedback on the arc length progress difference of MiR and UR
+            self.controller_output.linear.x = path_sync.speed(speed * self.Kp, mir_arc_length, self.ur_trajectory_index)
+        else:
+            # compute index error
+            index_error = self.ur_trajectory_index - mir_idx
+            
+            self.controller_output.linear.x = speed* self.Kp * (1.0 + self.index_coupling_gain*index_error)
+        with self.publish_timer:
+            self.cmd_vel_pub.publish(self.controller_output)
 
     def path_callback(self, msg):
-        self.path = msg.poses
-        self.calculate_velocities()
+        velocities = self.calculate_velocities(msg.poses, [])
+        path_index = self.build_path_index(msg.poses)
+        self.path = FollowerPath(msg.poses, velocities, path_index, self.build_profile(path_index), True)
+        self.update_path_sync()
+
+    def path_chunks_callback(self, poses, complete):
+        # first chunk of a new path starts new velocities, later chunks extend them
+        velocities = self.path.velocities if poses is self.path.poses else []
+        self.calculate_velocities(poses, velocities)
+        # index and profile are only built for the complete path, until then the waypoints are followed one by one
+        path_index = self.build_path_index(poses) if complete else None
+        self.path = FollowerPath(poses, velocities, path_index, self.build_profile(path_index), complete)
+        self.update_path_sync()
+
+    def build_path_index(self, poses):
+        if len(poses) < 2:
+            return None
+        points = [(p.pose.position.x, p.pose.position.y) for p in poses]
+        return PathSegmentIndex(points)
+
+    def build_profile(self, path_index):
+        # time parameterization once per path, the control loop only looks up speeds
+        if path_index is None:
+            return None
+        geometry = self.geometry
+        speed_limits = None
+        if geometry is not None and len(geometry.speed_limit) == len(path_index.points):
+            speed_limits = np.asarray(geometry.speed_limit)
+            if not np.all(speed_limits > 0.0):
+                rospy.logwarn("Path geometry has speed limits <= 0, raised to %.3f m/s", max(self.min_velocity, MIN_SPEED))
+        return VelocityProfile(path_index.points, self.max_velocity, self.max_acceleration, self.max_jerk,
+                               dt=1.0 / self.control_rate, min_velocity=self.min_velocity, speed_limits=speed_limits)
+
+    def geometry_callback(self, msg):
+        self.geometry = msg
+        path = self.path
+        if path.index is not None:
+            # the geometry may arrive after the path, a running path gets the new profile as well
+            self.path = path._replace(profile=self.build_profile(path.index))
+            if len(msg.speed_limit) != len(path.poses):
+                rospy.logwarn("Path geometry has %d poses, the path %d, not using its speed limits",
+                              len(msg.speed_limit), len(path.poses))
+
+    def ur_path_callback(self, msg):
+        self.set_ur_path(msg.poses)
+
+    def ur_path_chunks_callback(self, poses, complete):
+        if complete:
+            self.set_ur_path(poses)
+
+    def set_ur_path(self, poses):
+        if len(poses) < 2:
+            return
+        self.ur_arc_length = arc_length_table([(p.pose.position.x, p.pose.position.y, p.pose.position.z) for p in poses])
+        self.update_path_sync()
+
+    def update_path_sync(self):
+        path_index = self.path.index
+        if path_index is None or self.ur_arc_length is None:
+            return
+        self.path_sync = PathSynchronizer(path_index.arc_length, self.ur_arc_length, self.sync_gain, self.sync_max_velocity)
 
     def pose_callback(self, msg):
         self.current_pose = msg
 
+    def ur_pose_callback(self, msg):
+        p = msg.pose.position
+        self.ur_position = (p.x, p.y, p.z)
+
     def trajectory_index_callback(self, msg):
         self.ur_trajectory_index = msg.data
 
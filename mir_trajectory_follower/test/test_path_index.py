@@ -0,0 +1,61 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from helper.path_index import PathSegmentIndex  # noqa: E402
+
+
+def brute_force(points, point, first=0, last=None):
+    best = None
+    for i in range(first, len(points) - 1 if last is None else last + 1):
+        start, delta = points[i], points[i + 1] - points[i]
+        t = np.clip(np.dot(point - start, delta) / np.dot(delta, delta), 0.0, 1.0)
+        distance = np.hypot(*(point - start - t * delta))
+        if best is None or distance < best[1]:
+            best = (i, distance)
+    return best
+
+
+def layers(n_layers=6, n_points=60):
+    # every layer retraces the same circle, like the MiR path of a print
+    t = np.linspace(0.0, 2.0 * np.pi, n_points, endpoint=False)
+    circle = np.column_stack((2.0 * np.cos(t), 2.0 * np.sin(t)))
+    return np.vstack([circle] * n_layers + [circle[:1]])
+
+
+def test_nearest_matches_brute_force():
+    rng = np.random.default_rng(1)
+    points = np.cumsum(rng.normal(size=(300, 2)), axis=0)
+    index = PathSegmentIndex(points)
+    for point in rng.uniform(points.min(axis=0), points.max(axis=0), size=(50, 2)):
+        segment, _, _, distance = index.nearest(point)
+        assert abs(distance - brute_force(points, point)[1]) < 1e-9
+        first, last = 100, 180
+        segment, _, _, distance = index.nearest(point, min_segment=first, max_segment=last)
+        assert first <= segment <= last
+        assert abs(distance - brute_force(points, point, first, last)[1]) < 1e-9
+
+
+def test_repeated_layers_stay_in_window():
+    points = layers()
+    index = PathSegmentIndex(points)
+    # robot in layer 1, pushed 0.5 m off the contour: every layer is equally close
+    idx = 75
+    point = 1.25 * points[idx]
+    last = index.segment_at(index.arc_length[idx - 1] + 2.0)
+    bounded, _, bounded_arc_length, _ = index.nearest(point, min_segment=idx - 1, max_segment=last)
+    assert idx - 1 <= bounded <= last
+    assert bounded_arc_length - index.arc_length[idx - 1] <= 2.0 + 1e-9
+    assert abs(bounded - idx) <= 1
+
+
+def test_segment_at():
+    index = PathSegmentIndex(np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [1.0, 3.0]]))
+    assert index.segment_at(-1.0) == 0
+    assert index.segment_at(0.5) == 0
+    assert index.segment_at(1.0) == 1
+    assert index.segment_at(2.5) == 2
+    assert index.segment_at(10.0) == 2
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from helper.path_sync import PathSynchronizer, arc_length_table  # noqa: E402
+
+
+def line(n, length):
+    return np.column_stack((np.linspace(0.0, length, n), np.zeros(n)))
+
+
+def test_arc_length_table():
+    np.testing.assert_allclose(arc_length_table([[0.0, 0.0], [3.0, 4.0], [3.0, 5.0]]), [0.0, 5.0, 6.0])
+    assert len(arc_length_table(np.zeros((0, 3)))) == 0
+
+
+def test_index_mapping():
+    # the UR path is 4x denser and half as long, the same progress is the same place
+    mir = arc_length_table(line(101, 10.0))
+    ur = arc_length_table(line(401, 5.0))
+    sync = PathSynchronizer(mir, ur)
+    # the progress table has one cell per point of the denser path, rounding down can cost a cell
+    for ur_idx in range(0, 401, 7):
+        assert abs(sync.ur_to_mir_index(ur_idx) - ur_idx // 4) <= 1
+    for mir_idx in range(101):
+        assert abs(sync.mir_to_ur_index(mir_idx) - 4 * mir_idx) <= 2
+    # indices out of range are clamped
+    assert sync.ur_to_mir_index(-5) == 0 and sync.ur_to_mir_index(1000) == 100
+
+
+def test_index_mapping_uneven():
+    # dense points in the first half of the UR path: index mapping has to go through arc length
+    ur_points = np.concatenate((line(301, 1.0), line(11, 1.0)[1:] + (1.0, 0.0)))
+    mir = arc_length_table(line(201, 2.0))
+    sync = PathSynchronizer(mir, arc_length_table(ur_points))
+    assert abs(sync.ur_to_mir_index(300) - 100) <= 1
+    assert abs(sync.ur_to_mir_index(305) - 150) <= 1
+    assert abs(sync.mir_to_ur_index(150) - 305) <= 2
+
+
+def test_speed():
+    mir = arc_length_table(line(101, 10.0))
+    sync = PathSynchronizer(mir, arc_length_table(line(101, 5.0)), gain=0.5, max_velocity=0.2)
+    # UR at half the path, MiR 1 m behind
+    assert np.isclose(sync.lag(4.0, 50), 1.0)
+    assert np.isclose(sync.speed(0.1, 4.0, 50), 0.2)
+    assert np.isclose(sync.speed(0.1, 4.9, 50), 0.15)
+    # ahead: slower, but never backwards
+    assert np.isclose(sync.speed(0.1, 5.1, 50), 0.05)
+    assert sync.speed(0.1, 8.0, 50) == 0.0
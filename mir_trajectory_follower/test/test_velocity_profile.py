@@ -0,0 +1,67 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from helper.velocity_profile import MIN_SPEED, VelocityProfile  # noqa: E402
+
+V_MAX, A_MAX, J_MAX = 0.3, 0.1, 0.5
+
+
+def ellipse(n=400):
+    t = np.linspace(0.0, 2.0 * np.pi, n)
+    return np.column_stack((3.0 * np.cos(t), 2.0 * np.sin(t)))
+
+
+def check_limits(profile, dt, v_max=V_MAX):
+    acceleration = np.diff(profile.velocity) / dt
+    jerk = np.diff(acceleration) / dt
+    assert profile.velocity.max() <= v_max + 1e-9
+    assert profile.velocity.min() >= 0.0
+    assert np.abs(acceleration).max() <= A_MAX * (1.0 + 1e-3)
+    assert np.abs(jerk).max() <= J_MAX * (1.0 + 1e-3)
+
+
+def test_limits():
+    points = ellipse()
+    for dt in (0.01, 0.002):
+        profile = VelocityProfile(points, V_MAX, A_MAX, J_MAX, dt=dt)
+        check_limits(profile, dt)
+        assert profile.velocity[0] == 0.0 and profile.velocity[-1] == 0.0
+        assert abs(profile.arc_length[-1] - profile.length) < 1e-9
+        np.testing.assert_allclose(np.diff(profile.time), dt)
+
+
+def test_speed_limits():
+    points = ellipse()
+    speed_limits = np.where(np.arange(len(points)) % 97 < 20, 0.05, V_MAX)
+    profile = VelocityProfile(points, V_MAX, A_MAX, J_MAX, dt=0.01, speed_limits=speed_limits)
+    check_limits(profile, 0.01)
+    # below the limit of the path point at every arc length
+    path_s = np.concatenate(([0.0], np.hypot(*np.diff(points, axis=0).T).cumsum()))
+    assert np.all(profile.velocity <= np.interp(profile.arc_length, path_s, speed_limits) + 1e-6)
+
+
+def test_zero_speed_limits():
+    points = ellipse()
+    speed_limits = np.full(len(points), V_MAX)
+    speed_limits[100:150] = 0.0
+    profile = VelocityProfile(points, V_MAX, A_MAX, J_MAX, dt=0.01, speed_limits=speed_limits)
+    check_limits(profile, 0.01)
+    assert np.isfinite(profile.duration)
+
+    profile = VelocityProfile(points, V_MAX, A_MAX, J_MAX, dt=0.01, speed_limits=np.zeros(len(points)))
+    # crawls along at the lowest speed instead of taking forever
+    assert profile.duration <= profile.length / MIN_SPEED + 1.0
+    assert profile.speed_at(0.5 * profile.length) > 0.0
+
+
+def test_short_paths():
+    for points in (np.zeros((1, 2)), np.zeros((2, 2)), np.array([[0.0, 0.0], [0.001, 0.0]])):
+        profile = VelocityProfile(points, V_MAX, A_MAX, J_MAX, dt=0.01, min_velocity=0.01)
+        assert len(profile.time) == 2
+        assert profile.duration == 0.01
+        assert np.all(profile.velocity == 0.0)
+        assert profile.speed_at(0.0) == 0.01
@@ -5,6 +5,10 @@ from geometry_msgs.msg import PoseStamped
 from move_base_msgs.msg import MoveBaseAction, MoveBaseGoal
 import actionlib
 import tf.transformations as tr
+from print_path_msgs.msg import PathChunk
+from print_path_msgs.path_chunks import chunk_topic
+import math
+import print_checkpoint
 
 class MoveToFirstPathPoint:
     def __init__(self):
@@ -13,11 +17,14 @@ class MoveToFirstPathPoint:
         
         # load paramaters
         self.robot_name = rospy.get_param('~robot_name', 'mur620a')
-        self.path_topic = rospy.get_param('~path_topic', '/mir_path')
+        self.path_topic = rospy.get_param('~path_topic', 'mir_path')
+        # resume: drive to the MiR pose of the last checkpoint instead of the first path pose
+        self.resume = rospy.get_param('~resume', False)
+        self.checkpoint_file = rospy.get_param('~checkpoint_file', '') or print_checkpoint.default_checkpoint_file()
 
        
         # Action client for 'move_base'
-        self.move_base_client = actionlib.SimpleActionClient(self.robot_name + '/move_base', MoveBaseAction)
+        self.move_base_client = actionlib.SimpleActionClient('/' + self.robot_name + '/move_base', MoveBaseAction)
         
         # Wait for the action server to be available
         rospy.loginfo("Waiting for move_base action server...")
@@ -26,6 +33,12 @@ class MoveToFirstPathPoint:
 
         # Subscriber to 'mir_path' topic
         self.path_sub = rospy.Subscriber(self.path_topic, Path, self.path_callback)
+        # streamed paths (chunked publish mode): the first chunk is enough
+        self.path_chunk_sub = rospy.Subscriber(chunk_topic(self.path_topic), PathChunk, self.path_chunk_callback)
+
+    def path_chunk_callback(self, chunk_msg):
+        if chunk_msg.start_index == 0:
+            self.path_callback(Path(header=chunk_msg.header, poses=chunk_msg.poses))
 
     def path_callback(self, path_msg):
         # Check if the path contains at least one pose
@@ -35,6 +48,10 @@ class MoveToFirstPathPoint:
         
         # Extract the first pose from the path
         first_pose = path_msg.poses[0]
+        if self.resume:
+            first_pose = self.checkpoint_pose(path_msg)
+            if first_pose is None:
+                return
         rospy.loginfo(f"Moving to first pose: {first_pose.pose}")
 
         # Create and send the goal
@@ -53,6 +70,29 @@ class MoveToFirstPathPoint:
         else:
             rospy.logwarn("Failed to reach the first pose.")
 
+    def checkpoint_pose(self, path_msg):
+        try:
+            checkpoint = print_checkpoint.read_last(self.checkpoint_file)
+        except ValueError as e:
+            rospy.logerr(f"{e}, not moving")
+            return None
+        if checkpoint is None or checkpoint.status == print_checkpoint.COMPLETE:
+            rospy.logerr(f"No interrupted print in {self.checkpoint_file}, not moving")
+            return None
+        x, y, yaw = checkpoint.mir_pose
+        if math.isnan(x):
+            rospy.logerr("Checkpoint has no MiR pose, not moving")
+            return None
+        rospy.loginfo(f"Resuming at waypoint {checkpoint.index} of {checkpoint.n_poses}")
+        pose = PoseStamped()
+        pose.header.frame_id = path_msg.header.frame_id or "map"
+        pose.header.stamp = rospy.Time.now()
+        pose.pose.position.x = x
+        pose.pose.position.y = y
+        pose.pose.orientation.z = math.sin(yaw / 2)
+        pose.pose.orientation.w = math.cos(yaw / 2)
+        return pose
+
 if __name__ == '__main__':
     try:
         mover = MoveToFirstPathPoint()
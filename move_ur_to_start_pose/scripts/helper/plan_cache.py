@@ -0,0 +1,73 @@
+import hashlib
+import json
+import os
+from io import BytesIO
+
+from genpy import DeserializationError
+from moveit_msgs.msg import RobotTrajectory
+
+
+def plan_key(group, end_effector, target_pose, joint_values, position_resolution=0.001, angle_resolution=0.005):
+    """Key of a start pose plan: planning group, quantized target pose [x, y, z, rx, ry, rz] and start joint state.
+
+    The joint resolution has to stay below the start state tolerance of the trajectory execution,
+    a cached trajectory starts at most that far away from the current joint state.
+    """
+    position = [round(v / position_resolution) for v in target_pose[:3]]
+    orientation = [round(v / angle_resolution) for v in target_pose[3:]]
+    joints = [round(v / angle_resolution) for v in joint_values]
+    key = json.dumps([group, end_effector, position, orientation, joints])
+    return hashlib.sha1(key.encode("ascii")).hexdigest()
+
+
+class PlanCache:
+    """Planned trajectories on disk, one serialized moveit_msgs/RobotTrajectory per file.
+
+    The file modification time is the last use, the least recently used plans are
+    removed when there are more than max_entries.
+    """
+
+    SUFFIX = ".traj"
+
+    def __init__(self, directory, max_entries=50):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def filename(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key):
+        filename = self.filename(key)
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+            trajectory = RobotTrajectory().deserialize(data)
+        except (OSError, DeserializationError):
+            return None
+        os.utime(filename)  # mark as recently used
+        return trajectory
+
+    def put(self, key, trajectory):
+        buffer = BytesIO()
+        trajectory.serialize(buffer)
+        # write and rename, an interrupted write never leaves a broken plan behind
+        filename = self.filename(key)
+        with open(filename + ".tmp", "wb") as f:
+            f.write(buffer.getvalue())
+        os.replace(filename + ".tmp", filename)
+        self.evict()
+
+    def remove(self, key):
+        try:
+            os.remove(self.filename(key))
+        except FileNotFoundError:
+            pass
+
+    def evict(self):
+        entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith(self.SUFFIX)]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_entries]:
+            os.remove(entry.path)
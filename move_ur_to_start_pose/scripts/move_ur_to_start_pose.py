@@ -11,6 +11,16 @@ from std_msgs.msg import Header
 from geometry_msgs.msg import Point, Pose
 from moveit_msgs.msg import DisplayTrajectory
 import math
+from print_path_msgs.msg import PathChunk
+from print_path_msgs.path_chunks import chunk_topic
+import print_checkpoint
+import os
+import threading
+from helper.plan_cache import PlanCache, plan_key
+
+# defaults, ~move_group (default UR_arm_<side>, side of ur_name, e.g. UR_arm_l for UR10_l) and ~end_effector (default <ur_name>/tool0)
+GROUP = "UR_arm_{side}"
+END_EFFECTOR = "tool0"
 
 
 class MoveManipulatorToTarget:
@@ -18,25 +28,49 @@ class MoveManipulatorToTarget:
         rospy.init_node('move_manipulator_to_target', anonymous=True)
 
 
-        # Initialize parameters
-        self.path_topic = rospy.get_param('~path_topic', '/ur_path')
-        self.manipulator_base_link = rospy.get_param('~manipulator_base_link', 'mur620a/UR10_r/base_link')
+        # Initialize parameters, topics are relative to the namespace of the robot
+        self.path_topic = rospy.get_param('~path_topic', 'ur_path')
+        self.robot_name = rospy.get_param('~robot_name', 'mur620a')
+        self.ur_name = rospy.get_param('~ur_name', 'UR10_r')
+        self.group = rospy.get_param('~move_group', '') or GROUP.format(side=self.ur_name.rsplit('_', 1)[-1])
+        self.end_effector = rospy.get_param('~end_effector', f'{self.ur_name}/{END_EFFECTOR}')
+        self.manipulator_base_link = rospy.get_param('~manipulator_base_link', f'{self.robot_name}/{self.ur_name}/base_link')
+        # resume: move to the TCP position of the last checkpoint instead of the first path pose
+        self.resume = rospy.get_param('~resume', False)
+        self.checkpoint_file = rospy.get_param('~checkpoint_file', '') or print_checkpoint.default_checkpoint_file()
+        # plans keyed on the quantized target pose and start joint state, kept across runs
+        plan_cache_dir = rospy.get_param('~plan_cache_dir', '') or os.path.join(
+            os.environ.get('ROS_HOME', os.path.expanduser('~/.ros')), 'ur_start_pose_plans')
+        self.plan_cache = PlanCache(plan_cache_dir, rospy.get_param('~plan_cache_size', 50))
+        self.position_resolution = rospy.get_param('~plan_cache_position_resolution', 0.001)
+        self.angle_resolution = rospy.get_param('~plan_cache_angle_resolution', 0.005)
+        # the parsers may republish the same path, it is only handled once and never while moving
+        self.busy = threading.Lock()
+        self.handled_target = None
         
         # Initialize MoveIt
         roscpp_initialize(sys.argv)
-        self.move_group = MoveGroupCommander("UR_arm_r", ns="/mur620a", robot_description="mur620a/robot_description")
-        self.move_group.set_pose_reference_frame("UR10_r/base_link")
-        rospy.loginfo("MoveIt MoveGroup for UR_arm_r initialized.")
+        self.move_group = MoveGroupCommander(self.group, ns=f"/{self.robot_name}",
+                                             robot_description=f"{self.robot_name}/robot_description")
+        self.move_group.set_pose_reference_frame(f"{self.ur_name}/base_link")
+        rospy.loginfo(f"MoveIt MoveGroup for {self.group} of {self.robot_name} initialized.")
 
         # Initialize the subscriber for the path
-        self.path_sub = rospy.Subscriber(self.path_topic, Path, self.path_callback)
+        self.path_sub = rospy.Subscriber(self.path_topic, Path, self.path_callback, queue_size=1)
+        # streamed paths (chunked publish mode): the first chunk is enough
+        self.path_chunk_sub = rospy.Subscriber(chunk_topic(self.path_topic), PathChunk, self.path_chunk_callback, queue_size=1)
         
         # TF listener
         self.tf_listener = tf.TransformListener()
 
         # initialize the publisher for the target pose
-        self.local_target_pose_pub = rospy.Publisher('/ur_local_target_pose', PoseStamped, queue_size=1)
+        self.local_target_pose_pub = rospy.Publisher('ur_local_target_pose', PoseStamped, queue_size=1)
         self.display_trajectory_publisher = rospy.Publisher('move_group/display_planned_path', DisplayTrajectory, queue_size=10)
+        self.display_planned_path_publisher = rospy.Publisher('display_planned_path', DisplayTrajectory, queue_size=10)
+
+    def path_chunk_callback(self, chunk_msg):
+        if chunk_msg.start_index == 0:
+            self.path_callback(Path(header=chunk_msg.header, poses=chunk_msg.poses))
 
     def path_callback(self, path_msg):
         if len(path_msg.poses) == 0:
@@ -45,21 +79,39 @@ class MoveManipulatorToTarget:
 
         # Get the first TCP pose from the path
         target_tcp_pose = path_msg.poses[0]
-        
+        if self.resume:
+            target_tcp_pose = self.checkpoint_pose()
+            if target_tcp_pose is None:
+                return
+        target_tcp_position = np.array([target_tcp_pose.pose.position.x,
+                                        target_tcp_pose.pose.position.y,
+                                        target_tcp_pose.pose.position.z])
+
+        # drop republished paths while moving and paths with the start pose that was already reached
+        if not self.busy.acquire(blocking=False):
+            return
+        try:
+            target = tuple(np.round(target_tcp_position / self.position_resolution).astype(int).tolist())
+            if target == self.handled_target:
+                rospy.logdebug("Start pose already handled, ignoring path")
+                return
+            if self.move_to_target(target_tcp_position):
+                self.handled_target = target
+        finally:
+            self.busy.release()
+
+    def move_to_target(self, target_tcp_position):
         # Get the current pose of the manipulator base in the map frame
         try:
-            now = rospy.Time.now()
-            self.tf_listener.waitForTransform("map", self.manipulator_base_link, now, rospy.Duration(2.0))
-            (trans, rot) = self.tf_listener.lookupTransform("map", self.manipulator_base_link, now)
-        except (tf.LookupException, tf.ConnectivityException, tf.ExtrapolationException) as e:
+            # latest available transform, the base does not move while the arm goes to the start pose
+            self.tf_listener.waitForTransform("map", self.manipulator_base_link, rospy.Time(0), rospy.Duration(2.0))
+            (trans, rot) = self.tf_listener.lookupTransform("map", self.manipulator_base_link, rospy.Time(0))
+        except (tf.LookupException, tf.ConnectivityException, tf.ExtrapolationException, tf.Exception) as e:
             rospy.logerr(f"TF error: {e}")
-            return
+            return False
         
         # Convert to numpy arrays for easier manipulation
         manipulator_base_position = np.array(trans)
-        target_tcp_position = np.array([target_tcp_pose.pose.position.x,
-                                        target_tcp_pose.pose.position.y,
-                                        target_tcp_pose.pose.position.z])
         
         # Compute the target position in the manipulator’s local frame
         relative_position = target_tcp_position - manipulator_base_position
@@ -74,9 +126,9 @@ class MoveManipulatorToTarget:
         
         # Set the target pose for MoveIt
         #self.move_group.set_position_target(relative_position, end_effector_link="UR10_r/tool0" )
-        self.move_group.set_pose_target(relative_pose, end_effector_link="UR10_r/tool0")
+        self.move_group.set_pose_target(relative_pose, end_effector_link=self.end_effector)
         local_target_pose = PoseStamped()
-        local_target_pose.header.frame_id = "UR10_r/base_link"
+        local_target_pose.header.frame_id = f"{self.ur_name}/base_link"
         local_target_pose.header.stamp = rospy.Time.now()
         local_target_pose.pose.position.x = relative_position[0]
         local_target_pose.pose.position.y = relative_position[1]
@@ -84,30 +136,58 @@ class MoveManipulatorToTarget:
         self.local_target_pose_pub.publish(local_target_pose)
 
         
-        # Plan and execute the motion
-        plan_result = self.move_group.plan()
-
-        if isinstance(plan_result, tuple):
+        # Plan (or reuse the plan of an earlier run from the same joint state) and execute the motion
+        key = plan_key(self.group, self.end_effector, relative_pose, self.move_group.get_current_joint_values(),
+                       self.position_resolution, self.angle_resolution)
+        plan_trajectory = self.plan_cache.get(key)
+        if plan_trajectory is not None:
+            rospy.loginfo("Using cached plan to the start pose.")
+        else:
+            plan_result = self.move_group.plan()
+            if not isinstance(plan_result, tuple):
+                rospy.logwarn("Unexpected plan structure received.")
+                return False
             success = plan_result[0]  # Typically the success flag is the first item
             plan_trajectory = plan_result[1]  # The trajectory is usually the second item
-
-            if success:
-                # Publish the plan to the display path topic
-                display_trajectory_publisher = rospy.Publisher('/display_planned_path', DisplayTrajectory, queue_size=10)
-                display_trajectory = DisplayTrajectory()
-                display_trajectory.trajectory_start = self.move_group.get_current_state()
-                display_trajectory.trajectory.append(plan_trajectory)
-                display_trajectory_publisher.publish(display_trajectory)
-
-                # Execute the motion
-                self.move_group.execute(plan_trajectory, wait=True)
-                rospy.loginfo("Motion executed successfully.")
-                rospy.signal_shutdown("Motion executed successfully.")
-            else:
+            if not success:
                 rospy.logwarn("Motion planning failed.")
-        else:
-            rospy.logwarn("Unexpected plan structure received.")
-
+                return False
+            self.plan_cache.put(key, plan_trajectory)
+
+        # Publish the plan to the display path topic
+        display_trajectory = DisplayTrajectory()
+        display_trajectory.trajectory_start = self.move_group.get_current_state()
+        display_trajectory.trajectory.append(plan_trajectory)
+        self.display_planned_path_publisher.publish(display_trajectory)
+
+        # Execute the motion
+        if not self.move_group.execute(plan_trajectory, wait=True):
+            rospy.logwarn("Execution of the start pose motion failed.")
+            # e.g. the start state of a cached plan is out of tolerance, plan again next time
+            self.plan_cache.remove(key)
+            return False
+        rospy.loginfo("Motion executed successfully.")
+        rospy.signal_shutdown("Motion executed successfully.")
+        return True
+
+
+    def checkpoint_pose(self):
+        try:
+            checkpoint = print_checkpoint.read_last(self.checkpoint_file)
+        except ValueError as e:
+            rospy.logerr(f"{e}, not moving")
+            return None
+        if checkpoint is None or checkpoint.status == print_checkpoint.COMPLETE:
+            rospy.logerr(f"No interrupted print in {self.checkpoint_file}, not moving")
+            return None
+        if any(math.isnan(v) for v in checkpoint.ur_position):
+            rospy.logerr("Checkpoint has no UR position, not moving")
+            return None
+        rospy.loginfo(f"Resuming at waypoint {checkpoint.index} of {checkpoint.n_poses}")
+        pose = PoseStamped()
+        pose.header.frame_id = "map"
+        pose.pose.position = Point(*checkpoint.ur_position)
+        return pose
 
 
 if __name__ == '__main__':
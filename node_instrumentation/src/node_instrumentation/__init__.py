@@ -0,0 +1 @@
+from node_instrumentation.instrumentation import Histogram, Instrumentation, LoopMonitor, Timer
@@ -0,0 +1,253 @@
+"""Low overhead timing of callbacks and control loops.
+
+    instrumentation = Instrumentation.from_params()          # ~instrumentation, ~instrumentation_dump, ...
+    self.loop_monitor = instrumentation.loop("control_step", rate=100.0)
+    self.align_timer = instrumentation.timer("align_robot")
+
+    def control_step(self, event):
+        with self.loop_monitor:                              # period, jitter, compute time, missed deadlines
+            with self.align_timer:                           # latency histogram
+                ...
+
+    @instrumentation.timed("callback")                       # same as a timer around the whole function
+    def callback(msg): ...
+
+Timers and loop monitors are created once and reused, they are not reentrant.
+Every metric has a single writer (the thread of its callback), readers only copy the
+counters, so recording needs no lock. Summaries are published as diagnostic_msgs/DiagnosticArray,
+raw samples can additionally be appended to a text file (one "metric t_ns value_ns" per line).
+"""
+import bisect
+import functools
+import time
+
+import rospy
+from diagnostic_msgs.msg import DiagnosticArray, DiagnosticStatus, KeyValue
+
+# bucket upper bounds in ns: 4 per octave from 1 us to ~17 s
+BUCKET_BOUNDS = [int(1000 * 2 ** (i / 4)) for i in range(97)]
+
+
+class Histogram:
+    """Fixed bucket latency histogram in ns, plus count, sum, min and max."""
+
+    __slots__ = ("name", "counts", "count", "total", "min", "max", "samples")
+
+    def __init__(self, name, keep_samples=False):
+        self.name = name
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        # raw (t_ns, value_ns) since the last dump, None if not dumped
+        self.samples = [] if keep_samples else None
+
+    def record(self, value_ns):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, value_ns)] += 1
+        self.count += 1
+        self.total += value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+        if self.min is None or value_ns < self.min:
+            self.min = value_ns
+        if self.samples is not None:
+            self.samples.append((time.time_ns(), value_ns))
+
+    def percentile(self, q):
+        # upper bound of the bucket that holds the q quantile, the last bucket reports max
+        counts = list(self.counts)
+        target = q * sum(counts)
+        cumulative = 0
+        for i, c in enumerate(counts):
+            cumulative += c
+            if c and cumulative >= target:
+                return BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max
+        return 0
+
+    def take_samples(self):
+        # swap instead of copy, the writer continues on the new list
+        samples, self.samples = self.samples, []
+        return samples
+
+    def summary(self):
+        count = self.count
+        mean = self.total / count if count else 0.0
+        return [("count", count), ("mean_us", mean / 1e3), ("p50_us", self.percentile(0.5) / 1e3),
+                ("p99_us", self.percentile(0.99) / 1e3), ("max_us", self.max / 1e3)]
+
+
+class Timer:
+    """Context manager that records its duration into a histogram."""
+
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.record(time.perf_counter_ns() - self.start)
+        return False
+
+
+class NullTimer:
+    """Stands in for Timer and LoopMonitor when instrumentation is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_TIMER = NullTimer()
+
+
+class LoopMonitor:
+    """Period, jitter and compute time of a loop running at a nominal rate.
+
+    A deadline is missed if a period is longer than (1 + tolerance) nominal periods,
+    an overrun is an iteration whose compute time exceeds the nominal period.
+    """
+
+    def __init__(self, name, rate, tolerance=0.5, keep_samples=False):
+        self.name = name
+        self.nominal_ns = int(1e9 / rate)
+        self.deadline_ns = int(self.nominal_ns * (1.0 + tolerance))
+        self.period = Histogram(name + "/period", keep_samples)
+        self.jitter = Histogram(name + "/jitter", keep_samples)
+        self.compute = Histogram(name + "/compute", keep_samples)
+        self.missed_deadlines = 0
+        self.overruns = 0
+        self.last_start = None
+        self.start = 0
+
+    def __enter__(self):
+        now = time.perf_counter_ns()
+        if self.last_start is not None:
+            period = now - self.last_start
+            self.period.record(period)
+            self.jitter.record(abs(period - self.nominal_ns))
+            if period > self.deadline_ns:
+                self.missed_deadlines += 1
+        self.last_start = now
+        self.start = now
+        return self
+
+    def __exit__(self, *exc):
+        compute = time.perf_counter_ns() - self.start
+        self.compute.record(compute)
+        if compute > self.nominal_ns:
+            self.overruns += 1
+        return False
+
+    def histograms(self):
+        return (self.period, self.jitter, self.compute)
+
+
+class Instrumentation:
+    """Registry of the timers and loops of one node, publishes their summaries periodically."""
+
+    def __init__(self, name, enabled=True, publish_period=5.0, dump_file="", topic="/diagnostics"):
+        self.name = name
+        self.enabled = enabled
+        self.dump_file = dump_file
+        self.histograms = {}
+        self.loops = {}
+        self.reported_missed = {}
+        self.publisher = None
+        if enabled:
+            self.publisher = rospy.Publisher(topic, DiagnosticArray, queue_size=1)
+            self.publish_timer = rospy.Timer(rospy.Duration(publish_period), self.publish)
+            rospy.on_shutdown(self.dump)
+
+    @classmethod
+    def from_params(cls, name=None):
+        return cls(name or rospy.get_name(),
+                   rospy.get_param("~instrumentation", True),
+                   rospy.get_param("~instrumentation_period", 5.0),
+                   rospy.get_param("~instrumentation_dump", ""))
+
+    def histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = Histogram(name, bool(self.dump_file))
+            self.histograms[name] = histogram
+        return histogram
+
+    def timer(self, name):
+        if not self.enabled:
+            return NULL_TIMER
+        return Timer(self.histogram(name))
+
+    def timed(self, name):
+        """Decorator version of timer()."""
+        def decorate(fn):
+            if not self.enabled:
+                return fn
+            histogram = self.histogram(name)
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter_ns()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    histogram.record(time.perf_counter_ns() - start)
+            return wrapper
+        return decorate
+
+    def loop(self, name, rate, tolerance=0.5):
+        if not self.enabled:
+            return NULL_TIMER
+        loop = self.loops.get(name)
+        if loop is None:
+            loop = LoopMonitor(name, rate, tolerance, bool(self.dump_file))
+            self.loops[name] = loop
+        return loop
+
+    def status(self):
+        status = DiagnosticStatus(name=f"{self.name}: instrumentation", hardware_id=self.name)
+        status.level = DiagnosticStatus.OK
+        status.message = "OK"
+        values = []
+        for loop in list(self.loops.values()):
+            missed = loop.missed_deadlines
+            if missed > self.reported_missed.get(loop.name, 0):
+                status.level = DiagnosticStatus.WARN
+                status.message = f"{loop.name} missed deadlines"
+            self.reported_missed[loop.name] = missed
+            values.append(KeyValue(f"{loop.name}/missed_deadlines", str(missed)))
+            values.append(KeyValue(f"{loop.name}/overruns", str(loop.overruns)))
+            for histogram in loop.histograms():
+                values.extend(KeyValue(f"{histogram.name}/{key}", f"{value:.3f}" if isinstance(value, float) else str(value))
+                              for key, value in histogram.summary())
+        for histogram in list(self.histograms.values()):
+            values.extend(KeyValue(f"{histogram.name}/{key}", f"{value:.3f}" if isinstance(value, float) else str(value))
+                          for key, value in histogram.summary())
+        status.values = values
+        return status
+
+    def publish(self, event=None):
+        msg = DiagnosticArray()
+        msg.header.stamp = rospy.Time.now()
+        msg.status = [self.status()]
+        self.publisher.publish(msg)
+        self.dump()
+
+    def all_histograms(self):
+        for loop in list(self.loops.values()):
+            yield from loop.histograms()
+        yield from list(self.histograms.values())
+
+    def dump(self):
+        if not self.dump_file:
+            return
+        with open(self.dump_file, "a") as f:
+            for histogram in self.all_histograms():
+                f.writelines(f"{histogram.name} {t} {value}\n" for t, value in histogram.take_samples())
@@ -1,5 +0,0 @@
-def mirX():
-    return [51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661093,52.657778,52.654464,52.652500,52.650536,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.648572,52.644520,52.636322,52.554913,52.307996,51.980169,51.700217,51.580274,51.538489,51.515360,51.495102,51.471237,51.418844,51.269999,50.982833,50.669839,50.454389,50.388284,50.384481,50.388100,50.392360,50.396204,50.399040,50.401544,50.405646,50.412346,50.420346,50.427374,50.432350,50.436571,50.442428,50.451736,50.463260,50.473896,50.481623,50.487670,50.494737,50.505942,50.520649,50.535315,50.546399,50.554504,50.561836,50.574265,50.591501,50.610933,50.625894,50.636556,50.645526,50.658814,50.678606,50.701289,50.720320,50.733339,50.743951,50.757899,50.774504,50.787687,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793771,50.793352,50.792928,50.792505,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792500,50.792676,50.797694,50.849454,51.036839,51.337790,51.635924,51.811359,51.875871,51.903151,51.924008,51.944441,51.980065,52.078871,52.320404,52.639883,52.907698,53.026889,53.046278,53.047471,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047500,53.047499,53.047499,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.047498,53.055312,53.196885,53.453074,53.726666,53.868376,53.895521,53.897449,53.897499,53.897500,53.897496,53.896926,53.885281,53.793382,53.552497,53.246298,53.006262,52.915778,52.901682,52.901682,52.901682,52.892070,52.882458,52.872845,52.872845,52.872845,52.872845,52.872845,52.862400,52.851954,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.841508,52.829976,52.818444,52.806912,52.806912,52.806912,52.806912,52.806912,52.806912,52.795557,52.784202,52.772846,52.772846,52.772846,52.766778,52.760711,52.754643,52.754643,52.754643,52.754643,52.748320,52.741997,52.735673,52.731216,52.726759,52.722302,52.722302,52.722302,52.718811,52.715319,52.711828,52.711828,52.711828,52.706762,52.701697,52.696632,52.696632,52.696632,52.696632,52.696632,52.696632,52.689437,52.682242,52.675047,52.675047,52.675047,52.671500,52.667954,52.664407,52.664407,52.664407,52.664407,52.661092,52.657778,52.654463,52.652479,52.650495,52.648511,52.648511,52.648511,52.648511,52.648511,52.648511,52.648511,52.648511,52.645077,52.640662,52.635266]
- 
-def mirY():
-    return [39.752500,39.752500,39.752500,39.752500,39.752500,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850185,40.842972,40.835758,40.830074,40.824390,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.818706,40.801796,40.764149,40.533446,40.211114,39.894221,39.769542,39.753382,39.752521,39.752500,39.752500,39.752538,39.754313,39.780192,39.918941,40.205407,40.534168,40.771772,40.881098,40.940619,40.987800,41.020619,41.043473,41.063544,41.094838,41.138166,41.185131,41.221091,41.244931,41.265043,41.292482,41.332288,41.377860,41.416539,41.442738,41.463036,41.486639,41.522220,41.565700,41.606630,41.635480,41.656250,41.675018,41.706103,41.746452,41.790100,41.821433,41.843283,41.861611,41.888432,41.926288,41.967998,42.001194,42.023099,42.040886,42.064104,42.089037,42.108234,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.115694,42.122721,42.136144,42.156258,42.176024,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.628055,43.703911,43.904016,44.212600,44.503119,44.665849,44.704157,44.707398,44.707498,44.707500,44.707498,44.707045,44.697175,44.614785,44.381102,44.064951,43.792208,43.661028,43.614755,43.590914,43.570575,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310018,43.296585,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.289831,43.270808,43.198938,42.979383,42.674091,42.386195,42.234705,42.180843,42.155747,42.135252,42.114374,42.076727,41.971073,41.719391,41.400540,41.140662,41.033235,41.016429,41.015336,41.015336,41.015336,41.014012,41.012687,41.011362,41.011362,41.011362,41.011362,41.011362,41.009091,41.006820,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.004548,41.000487,40.996426,40.992365,40.992365,40.992365,40.992365,40.992365,40.992365,40.986357,40.980348,40.974340,40.974340,40.974340,40.970507,40.966675,40.962842,40.962842,40.962842,40.962842,40.958043,40.953243,40.948444,40.944311,40.940177,40.936044,40.936044,40.936044,40.932373,40.928702,40.925031,40.925031,40.925031,40.919398,40.913765,40.908132,40.908132,40.908132,40.908132,40.908132,40.908132,40.897465,40.886798,40.876131,40.876131,40.876131,40.869887,40.863642,40.857398,40.857398,40.857398,40.857398,40.850184,40.842970,40.835756,40.830004,40.824253,40.818501,40.818501,40.818501,40.818501,40.818501,40.818501,40.818501,40.818501,40.804751,40.784386,40.757407]
\ No newline at end of file
@@ -0,0 +1,9 @@
+#! /usr/bin/env python3
+import rospy
+from parse_path.cli import main
+
+if __name__ == '__main__':
+    try:
+        main()
+    except rospy.ROSInterruptException:
+        pass
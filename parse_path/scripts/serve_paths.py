@@ -0,0 +1,9 @@
+#! /usr/bin/env python3
+import rospy
+from parse_path.service import run
+
+if __name__ == '__main__':
+    try:
+        run()
+    except rospy.ROSInterruptException:
+        pass
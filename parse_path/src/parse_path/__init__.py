@@ -0,0 +1,14 @@
+"""Loading, preprocessing and publishing of the MiR and UR print paths.
+
+Submodules are imported on first attribute access, so e.g. the numpy only
+parse_path.engine can be used without pulling in rospy and the messages.
+"""
+import importlib
+
+__all__ = ["engine", "node", "path_store", "layers", "preprocess", "geometry", "regions", "shared", "service", "cli"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__} has no attribute {name}")
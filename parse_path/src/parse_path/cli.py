@@ -0,0 +1,90 @@
+"""Entry point of the path publisher node, also usable offline.
+
+    publish_path.py mir                  run the node (parameters from the ROS parameter server)
+    publish_path.py ur --dry-run --path-file ur_path.bin --simplify-tolerance 0.0005
+                                         preprocess and transform without ROS, print sizes and timings
+    publish_path.py mir --dry-run --path-file mir_path.bin --layers ur_path.bin
+                                         the same per layer, layers detected from the tool height of ur_path.bin
+    publish_path.py mir --dry-run --path-file mir_path.bin --heading-lookahead 0.2 --max-lateral-acceleration 0.1
+                                         smoothed headings, print the curvature and speed limits
+"""
+import argparse
+import time
+
+import numpy as np
+
+from parse_path import engine, layers
+
+
+def dry_run(args):
+    profile = engine.PROFILES[args.robot]
+    source = engine.PathSource(args.path_file, profile, args.min_point_distance, args.resample_spacing, args.simplify_tolerance)
+
+    start = time.perf_counter()
+    points = source.points
+    loaded = time.perf_counter()
+    original = engine.original_path(points, profile, heading_lookahead=args.heading_lookahead)
+    transformed = engine.transformed_path(points, profile, *args.transform, args.heading_lookahead)
+    done = time.perf_counter()
+    geometry = engine.path_geometry(points, args.heading_lookahead, args.max_velocity, args.max_lateral_acceleration,
+                                    args.max_angular_velocity)
+    geometry_done = time.perf_counter()
+
+    print(f"{args.path_file}: {source.raw_size} -> {len(points)} points")
+    print(f"original {len(original[0])} poses, transformed {len(transformed[0])} poses")
+    print(f"load + preprocess {(loaded - start) * 1e3:.2f} ms, transform + headings {(done - loaded) * 1e3:.2f} ms, "
+          f"geometry {(geometry_done - done) * 1e3:.2f} ms")
+    limited = geometry.speed_limit < args.max_velocity
+    print(f"max |curvature| {np.abs(geometry.curvature).max():.3f} 1/m, speed limit min {geometry.speed_limit.min():.3f} m/s, "
+          f"below {args.max_velocity} m/s on {100.0 * limited.mean():.1f} % of the poses")
+
+
+def dry_run_layers(args):
+    profile = engine.PROFILES[args.robot]
+    start = time.perf_counter()
+    index = layers.load_index(args.path_file, args.layers, min_step=args.layer_z_step)
+    source = engine.LayerSource(args.path_file, profile, index, args.min_point_distance, args.resample_spacing,
+                                args.simplify_tolerance)
+    print(f"{args.path_file}: {len(index)} layers, index {(time.perf_counter() - start) * 1e3:.2f} ms")
+    for layer in index:
+        start = time.perf_counter()
+        points, lead, trail = source.layer_points(layer.number)
+        original = engine.original_path(points, profile, lead, trail)
+        engine.transformed_path(points, profile, *args.transform)
+        print(f"layer {layer.number:4d} z {layer.z:8.4f}: {layer.count} -> {len(original[0])} poses, "
+              f"{(time.perf_counter() - start) * 1e3:.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("robot", choices=sorted(engine.PROFILES))
+    parser.add_argument("--dry-run", action="store_true", help="no ROS, only preprocess and transform")
+    parser.add_argument("--path-file", help="path store file (dry run)")
+    parser.add_argument("--min-point-distance", type=float, default=1e-6)
+    parser.add_argument("--resample-spacing", type=float, default=0.0)
+    parser.add_argument("--simplify-tolerance", type=float, default=0.0)
+    parser.add_argument("--layers", metavar="LAYER_SOURCE", help="dry run per layer, layers from toolZ of this path store")
+    parser.add_argument("--layer-z-step", type=float, default=1e-4)
+    parser.add_argument("--heading-lookahead", type=float, default=0.0, help="m, 0 = headings to the next point")
+    parser.add_argument("--max-velocity", type=float, default=1.0)
+    parser.add_argument("--max-lateral-acceleration", type=float, default=0.0, help="m/s^2 for the speed limits, 0 = none")
+    parser.add_argument("--max-angular-velocity", type=float, default=0.0, help="rad/s for the speed limits, 0 = none")
+    parser.add_argument("--transform", type=float, nargs=6, default=[0.0] * 6, metavar=("TX", "TY", "TZ", "RX", "RY", "RZ"))
+    # roslaunch appends __name:=... and remappings, they are not ours
+    args, _ = parser.parse_known_args(argv)
+
+    if args.dry_run:
+        if not args.path_file:
+            parser.error("--dry-run needs --path-file")
+        if args.layers:
+            dry_run_layers(args)
+        else:
+            dry_run(args)
+        return
+
+    from parse_path import node
+    node.run(args.robot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Path geometry shared by the MiR and the UR path: loading, transformation and headings.
+
+Only numpy is needed here, so everything can be used and timed without ROS.
+Message construction lives in parse_path.node.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from parse_path import geometry, layers as layer_index, path_store, preprocess
+
+# columns: path store columns (x, y[, z])
+# planar: no z column, the original path gets headings, the transformed one lies at z = tz
+# package / file_name: where the path store lies by default, topic_prefix: <prefix>_original, <prefix>_transformed
+PathProfile = namedtuple("PathProfile", ["columns", "planar", "package", "file_name", "topic_prefix"])
+
+PROFILES = {
+    "mir": PathProfile(("mirX", "mirY"), True, "parse_mir_path", "mir_path.bin", "/mir_path"),
+    "ur": PathProfile(("toolX", "toolY", "toolZ"), False, "parse_ur_path", "ur_path.bin", "/ur_path"),
+}
+
+
+def euler_matrix(rx, ry, rz):
+    """Rotation matrix of static xyz euler angles, like tf.transformations.euler_matrix(rx, ry, rz)."""
+    cx, sx = np.cos(rx), np.sin(rx)
+    cy, sy = np.cos(ry), np.sin(ry)
+    cz, sz = np.cos(rz), np.sin(rz)
+    return np.array([[cz * cy, cz * sy * sx - sz * cx, cz * sy * cx + sz * sx],
+                     [sz * cy, sz * sy * sx + cz * cx, sz * sy * cx - cz * sx],
+                     [-sy, cy * sx, cy * cx]])
+
+
+def transform_positions(positions, tx, ty, tz, rx, ry, rz):
+    # rotated translation is the same for every point, so compute it once
+    return positions + euler_matrix(rx, ry, rz).dot((tx, ty, tz))
+
+
+def yaw_quaternions(yaw):
+    q = np.zeros((len(yaw), 4))
+    q[:, 2] = np.sin(yaw / 2)
+    q[:, 3] = np.cos(yaw / 2)
+    return q
+
+
+def heading_quaternions(x_coords, y_coords):
+    # the path should always face towards the next point -> yaw only quaternions for points 0..n-2
+    return yaw_quaternions(np.arctan2(np.diff(y_coords), np.diff(x_coords)))
+
+
+def inner_headings(points, lookahead=0.0):
+    # orientations of the published points 1..n-2, see geometry.smoothed_headings
+    return yaw_quaternions(geometry.smoothed_headings(points, lookahead)[1:-1])
+
+
+def identity_quaternions(n):
+    q = np.zeros((n, 4))
+    q[:, 3] = 1.0
+    return q
+
+
+class PathSource:
+    """A path store file that is only opened and preprocessed on first access of points."""
+
+    def __init__(self, path_file, profile, min_distance=1e-6, spacing=0.0, tolerance=0.0):
+        self.path_file = path_file
+        self.profile = profile
+        self.min_distance = min_distance
+        self.spacing = spacing
+        self.tolerance = tolerance
+        self.raw_size = None
+        self._points = None
+
+    @property
+    def points(self):
+        if self._points is None:
+            columns = path_store.load(self.path_file)
+            raw = np.column_stack([columns[name] for name in self.profile.columns])
+            self.raw_size = len(raw)
+            self._points = preprocess.preprocess(raw, self.min_distance, self.spacing, self.tolerance)
+        return self._points
+
+
+class LayerSource(PathSource):
+    """A path store that is read and preprocessed one layer at a time, see parse_path.layers."""
+
+    def __init__(self, path_file, profile, layers, min_distance=1e-6, spacing=0.0, tolerance=0.0):
+        super().__init__(path_file, profile, min_distance, spacing, tolerance)
+        self.layers = layers
+
+    def layer_points(self, number):
+        """(points, lead, trail) of one layer.
+
+        One point of each neighbouring layer is included, so the headings at the layer
+        borders and the inner points used by the transformed path match the full path.
+        """
+        columns, lead, trail = layer_index.read_layer(self.path_file, self.layers, number, self.profile.columns, overlap=1)
+        raw = np.column_stack([columns[name] for name in self.profile.columns])
+        return preprocess.preprocess(raw, self.min_distance, self.spacing, self.tolerance), lead, trail
+
+
+def original_path(points, profile, lead=0, trail=0, heading_lookahead=0.0):
+    """(positions, orientations) of the untransformed path.
+
+    lead / trail: points at the start / end that only belong to the neighbouring layers.
+    heading_lookahead: m along the path the headings look ahead, 0 = the next point.
+    """
+    if profile.planar:
+        positions = np.zeros((len(points) - 2, 3))
+        positions[:, :2] = points[1:-1]  # assuming z=0 for 2D path
+        return positions, inner_headings(points, heading_lookahead)
+    points = points[lead:len(points) - trail]
+    return points.copy(), identity_quaternions(len(points))
+
+
+def transformed_path(points, profile, tx, ty, tz, rx, ry, rz, heading_lookahead=0.0):
+    """(positions, orientations) of the path moved by the translation (tx, ty, tz) rotated by (rx, ry, rz)."""
+    positions = np.zeros((len(points) - 2, 3))
+    positions[:, :points.shape[1]] = points[1:-1]
+    positions = transform_positions(positions, tx, ty, tz, rx, ry, rz)
+    if profile.planar:
+        positions[:, 2] = tz
+    return positions, inner_headings(points, heading_lookahead)
+
+
+def path_geometry(points, lookahead, max_velocity, max_lateral_acceleration=0.0, max_angular_velocity=0.0):
+    """geometry.PathGeometry of the poses of the transformed path (and of the planar original path).
+
+    Computed on the whole preprocessed path, so the first and last pose get full windows.
+    The arc length starts at 0 on the first pose.
+    """
+    full = geometry.path_geometry(points, lookahead, max_velocity, max_lateral_acceleration, max_angular_velocity)
+    inner = slice(1, len(points) - 1)
+    return geometry.PathGeometry(full.arc_length[inner] - full.arc_length[1], full.heading[inner],
+                                 full.curvature[inner], full.speed_limit[inner])
@@ -0,0 +1,85 @@
+"""Smoothed headings, curvature and curvature limited speed of a print path.
+
+Facing the next point, the headings flip from point to point on dense, jittery
+stretches. Here a point faces the point lookahead meters further along the path,
+and the curvature is the change of that heading over the same window. Only x, y
+are used, all functions are vectorized.
+
+    geometry = path_geometry(points, lookahead=0.2, max_velocity=1.0, max_lateral_acceleration=0.1)
+    geometry.heading, geometry.curvature, geometry.speed_limit      # one value per point
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from parse_path import preprocess
+
+# arrays with one value per point: arc length (m), yaw (rad), signed curvature (1/m, > 0 turns left), speed (m/s)
+PathGeometry = namedtuple("PathGeometry", ["arc_length", "heading", "curvature", "speed_limit"])
+
+
+def _positions_at(s, arc_length, points):
+    return np.column_stack((np.interp(s, arc_length, points[:, 0]), np.interp(s, arc_length, points[:, 1])))
+
+
+def smoothed_headings(points, lookahead, arc_length=None):
+    """Yaw of every point towards the point lookahead m further along the path.
+
+    The window is moved back at the end of the path, so it always spans lookahead.
+    lookahead <= 0: towards the next point, the last point keeps the heading before it.
+    """
+    points = np.asarray(points, dtype=float)[:, :2]
+    if len(points) < 2:
+        return np.zeros(len(points))
+    if lookahead <= 0.0:
+        yaw = np.arctan2(np.diff(points[:, 1]), np.diff(points[:, 0]))
+        return np.append(yaw, yaw[-1])
+    s = preprocess.arc_length(points) if arc_length is None else arc_length
+    end = np.clip(s + lookahead, min(lookahead, s[-1]), s[-1])
+    chord = _positions_at(end, s, points) - _positions_at(np.maximum(end - lookahead, 0.0), s, points)
+    return np.arctan2(chord[:, 1], chord[:, 0])
+
+
+def signed_curvature(heading, arc_length, lookahead):
+    """dyaw/ds of smoothed_headings, taken over one lookahead window around every point.
+
+    The heading of a point is the direction of the window ahead of it, so the window
+    of the tangent change at s starts lookahead before s.
+    """
+    if len(heading) < 2:
+        return np.zeros(len(heading))
+    yaw = np.unwrap(heading)
+    if lookahead <= 0.0:
+        # next point headings: change between the segments before and after every point
+        ds = 0.5 * (arc_length[2:] - arc_length[:-2])
+        curvature = np.zeros(len(yaw))
+        curvature[1:-1] = np.divide(yaw[1:-1] - yaw[:-2], ds, out=np.zeros(len(ds)), where=ds > 0.0)
+        return curvature
+    # chord starts beyond length - lookahead all have the same window
+    last_start = max(arc_length[-1] - lookahead, 0.0)
+    end = np.clip(arc_length, min(lookahead, last_start), last_start)
+    start = np.maximum(end - lookahead, 0.0)
+    span = end - start
+    change = np.interp(end, arc_length, yaw) - np.interp(start, arc_length, yaw)
+    return np.divide(change, span, out=np.zeros(len(yaw)), where=span > 0.0)
+
+
+def curvature_speed_limits(curvature, max_velocity, max_lateral_acceleration=0.0, max_angular_velocity=0.0):
+    """Highest speed per point with v^2 |k| <= max_lateral_acceleration and v |k| <= max_angular_velocity (0 = no limit)."""
+    k = np.abs(np.asarray(curvature, dtype=float))
+    limit = np.full(len(k), float(max_velocity))
+    with np.errstate(divide="ignore"):
+        if max_lateral_acceleration > 0.0:
+            limit = np.minimum(limit, np.sqrt(max_lateral_acceleration / k))
+        if max_angular_velocity > 0.0:
+            limit = np.minimum(limit, max_angular_velocity / k)
+    return limit
+
+
+def path_geometry(points, lookahead, max_velocity, max_lateral_acceleration=0.0, max_angular_velocity=0.0):
+    points = np.asarray(points, dtype=float)[:, :2]
+    s = preprocess.arc_length(points)
+    heading = smoothed_headings(points, lookahead, s)
+    curvature = signed_curvature(heading, s, lookahead)
+    return PathGeometry(s, heading, curvature,
+                        curvature_speed_limits(curvature, max_velocity, max_lateral_acceleration, max_angular_velocity))
@@ -0,0 +1,127 @@
+"""Layer index of a path store, so one printed layer can be read without loading the whole part.
+
+Layers are detected from the steps of the tool height (toolZ of the UR path). The
+MiR and the UR path have the same number of points, point i of both belongs to the
+same moment of the print, so the layer ranges of the UR path also split the MiR path.
+
+Layout of a layer index file (little endian), written next to the path store as <path store>.layers:
+
+    0   magic        8s   b"MAPLAYER"
+    8   version      u2
+    10  n_columns    u2
+    12  n_layers     u4
+    16  n_points     u8
+    24  min_step     f8   detection parameters the index was built with
+    32  z_column     32s
+    64  layers       n_layers * (start u8, count u8, z f8, n_columns * byte offset u8)
+
+The byte offset of a column is where the first point of the layer lies in the path
+store file, so a layer is read with one seek and one read per column.
+"""
+import os
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+from parse_path import path_store
+
+MAGIC = b"MAPLAYER"
+VERSION = 2
+HEADER = struct.Struct("<8sHHIQd32s")
+ITEM_SIZE = 8
+
+Layer = namedtuple("Layer", ["number", "start", "count", "z", "offsets"])
+
+
+def detect_layers(z, min_step=1e-4):
+    """(starts, counts) of the runs of constant height, a new layer starts where z changes by more than min_step."""
+    z = np.asarray(z, dtype=float)
+    if len(z) == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    starts = np.concatenate(([0], np.flatnonzero(np.abs(np.diff(z)) > min_step) + 1))
+    counts = np.diff(np.append(starts, len(z)))
+    return starts, counts
+
+
+def build_index(path_file, starts, counts, z):
+    """Layers of path_file for the given point ranges, with the byte offsets of its columns."""
+    names, n_points, data_offset = path_store.read_header(path_file)
+    if len(starts) and starts[-1] + counts[-1] != n_points:
+        raise ValueError(f"Layers cover {starts[-1] + counts[-1]} points, {path_file} has {n_points}")
+    column_offsets = data_offset + np.arange(len(names)) * n_points * ITEM_SIZE
+    return [Layer(i, int(start), int(count), float(height), tuple((column_offsets + start * ITEM_SIZE).tolist()))
+            for i, (start, count, height) in enumerate(zip(starts, counts, z))]
+
+
+def write_index(filename, layers, n_points, min_step, z_column):
+    n_columns = len(layers[0].offsets) if layers else 0
+    row = struct.Struct(f"<QQd{n_columns}Q")
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, n_columns, len(layers), n_points, min_step, z_column.encode("ascii")))
+        for layer in layers:
+            f.write(row.pack(layer.start, layer.count, layer.z, *layer.offsets))
+
+
+def read_index(filename):
+    """Return (layers, number of points, (min_step, z_column)) of a layer index file."""
+    with open(filename, "rb") as f:
+        magic, version, n_columns, n_layers, n_points, min_step, z_column = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not a layer index file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported layer index version {version} in {filename}")
+        row = struct.Struct(f"<QQd{n_columns}Q")
+        layers = []
+        for i in range(n_layers):
+            start, count, z, *offsets = row.unpack(f.read(row.size))
+            layers.append(Layer(i, start, count, z, tuple(offsets)))
+    return layers, n_points, (min_step, z_column.rstrip(b"\0").decode("ascii"))
+
+
+def index_file(path_file):
+    return path_file + ".layers"
+
+
+def load_index(path_file, layer_source=None, z_column="toolZ", min_step=1e-4):
+    """Layer index of path_file, with the layers detected from z_column of layer_source (default path_file).
+
+    The index is cached next to the path store and rebuilt if one of the two stores is newer
+    or it was built with another min_step or z_column.
+    """
+    layer_source = layer_source or path_file
+    filename = index_file(path_file)
+    try:
+        if os.path.getmtime(filename) >= max(os.path.getmtime(path_file), os.path.getmtime(layer_source)):
+            layers, _, key = read_index(filename)
+            if key == (float(min_step), z_column):
+                return layers
+    except (OSError, ValueError, struct.error):
+        pass  # no usable cache, e.g. written by an older version
+
+    z = path_store.load(layer_source)[z_column]
+    starts, counts = detect_layers(z, min_step)
+    layers = build_index(path_file, starts, counts, z[starts])
+    try:
+        write_index(filename, layers, len(z), min_step, z_column)
+    except OSError:
+        pass  # installed read only, detection is cheap enough to redo
+    return layers
+
+
+def read_layer(path_file, layers, number, columns, overlap=0):
+    """Read the columns of one layer plus up to overlap points of the neighbouring layers.
+
+    Returns ({column: array}, lead, trail), lead / trail are the numbers of points before
+    and after the layer that were read (less than overlap at the first and last layer).
+    """
+    names, n_points, _ = path_store.read_header(path_file)
+    layer = layers[number]
+    lead = min(overlap, layer.start)
+    trail = min(overlap, n_points - layer.start - layer.count)
+    data = {}
+    with open(path_file, "rb") as f:
+        for name in columns:
+            f.seek(layer.offsets[names.index(name)] - lead * ITEM_SIZE)
+            data[name] = np.fromfile(f, dtype="<f8", count=lead + layer.count + trail)
+    return data, lead, trail
@@ -0,0 +1,230 @@
+import concurrent.futures
+import os
+import threading
+
+import rospy
+import rospkg
+from geometry_msgs.msg import PoseStamped, Pose, Point, Quaternion
+from nav_msgs.msg import Path
+from std_msgs.msg import Header, Int32
+from std_srvs.srv import Trigger, TriggerResponse
+from print_path_msgs.msg import PathGeometry
+from print_path_msgs.path_chunks import PathChunkPublisher
+
+from parse_path import engine, layers, shared
+
+
+def build_poses(positions, orientations, stamp, frame_id="map"):
+    # convert to python floats in one go, message construction is the only remaining per point work
+    header = Header(stamp=stamp, frame_id=frame_id)
+    return [PoseStamped(header, Pose(Point(*p), Quaternion(*q)))
+            for p, q in zip(positions.tolist(), orientations.tolist())]
+
+
+def build_path(positions, orientations, stamp, frame_id="map"):
+    path = Path()
+    path.header.frame_id = frame_id
+    path.header.stamp = stamp
+    path.poses = build_poses(positions, orientations, stamp, frame_id)
+    return path
+
+
+def build_geometry(points, geometry_params, stamp, frame_id="map"):
+    # parallel to the poses of the transformed path, see engine.path_geometry
+    geometry = engine.path_geometry(points, *geometry_params)
+    return PathGeometry(header=Header(stamp=stamp, frame_id=frame_id), heading_lookahead=geometry_params[0],
+                        arc_length=geometry.arc_length.tolist(), heading=geometry.heading.tolist(),
+                        curvature=geometry.curvature.tolist(), speed_limit=geometry.speed_limit.tolist())
+
+
+def publish(paths, publish_mode, chunk_size=500):
+    """Publish {topic: Path} until shutdown.
+
+    latched: publish once, late subscribers get the latched message
+    chunked: stream fixed size windows with a manifest, see print_path_msgs
+    periodic: re-send the full paths every 2 s
+    """
+    if publish_mode == 'chunked':
+        streams = [PathChunkPublisher(topic, path, chunk_size) for topic, path in paths.items()]
+        for stream in streams:
+            stream.publish()
+        rospy.spin()
+        return
+
+    latch = publish_mode == 'latched'
+    publishers = {topic: rospy.Publisher(topic, Path, queue_size=10, latch=latch) for topic in paths}
+
+    if latch:
+        for topic, path in paths.items():
+            publishers[topic].publish(path)
+        rospy.spin()
+        return
+
+    rate = rospy.Rate(0.5)  # Publish every 2 s
+    while not rospy.is_shutdown():
+        stamp = rospy.Time.now()
+        for topic, path in paths.items():
+            path.header.stamp = stamp
+            publishers[topic].publish(path)
+        rate.sleep()
+
+
+class LayerPublisher:
+    """Publishes one layer of the path at a time and prepares the next one in the background.
+
+    ~layer (std_msgs/Int32): publish this layer
+    ~next_layer (std_srvs/Trigger): publish the layer after the current one
+    ~current_layer, ~layer_count (std_msgs/Int32, latched)
+
+    Only the published and the prefetched layer are held, in memory and as messages.
+    The heading and curvature windows end at the layer borders.
+    """
+
+    def __init__(self, source, profile, transform, geometry_params, frame_id="map"):
+        self.source = source
+        self.profile = profile
+        self.transform = transform
+        self.geometry_params = geometry_params
+        self.frame_id = frame_id
+        self.original_topic = f'{profile.topic_prefix}_original'
+        self.transformed_topic = f'{profile.topic_prefix}_transformed'
+        self.geometry_topic = f'{profile.topic_prefix}_geometry'
+        self.publishers = {topic: rospy.Publisher(topic, Path, queue_size=1, latch=True)
+                           for topic in (self.original_topic, self.transformed_topic)}
+        self.publishers[self.geometry_topic] = rospy.Publisher(self.geometry_topic, PathGeometry, queue_size=1, latch=True)
+        self.current_layer_pub = rospy.Publisher('~current_layer', Int32, queue_size=1, latch=True)
+        rospy.Publisher('~layer_count', Int32, queue_size=1, latch=True).publish(Int32(len(source.layers)))
+
+        # the topic and the service callbacks run in different threads
+        self.lock = threading.Lock()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.prefetched = {}  # layer number -> future of its paths
+        self.current = None
+
+        rospy.Subscriber('~layer', Int32, self.layer_callback)
+        rospy.Service('~next_layer', Trigger, self.next_layer_service)
+        rospy.on_shutdown(lambda: self.executor.shutdown(wait=False))
+
+    def build(self, number):
+        points, lead, trail = self.source.layer_points(number)
+        stamp = rospy.Time.now()
+        lookahead = self.geometry_params[0]
+        return {
+            self.original_topic: build_path(*engine.original_path(points, self.profile, lead, trail, lookahead),
+                                            stamp, self.frame_id),
+            self.transformed_topic: build_path(*engine.transformed_path(points, self.profile, *self.transform, lookahead),
+                                               stamp, self.frame_id),
+            self.geometry_topic: build_geometry(points, self.geometry_params, stamp, self.frame_id),
+        }
+
+    def prefetch(self, number):
+        if number < len(self.source.layers) and number not in self.prefetched:
+            self.prefetched[number] = self.executor.submit(self.build, number)
+
+    def publish_layer(self, number):
+        if not 0 <= number < len(self.source.layers):
+            rospy.logwarn(f"Layer {number} does not exist, the path has {len(self.source.layers)} layers")
+            return False
+        with self.lock:
+            self.prefetch(number)
+            paths = self.prefetched.pop(number).result()
+            # drop prefetches that are not the next layer any more
+            for future in self.prefetched.values():
+                future.cancel()
+            self.prefetched.clear()
+
+            stamp = rospy.Time.now()
+            for topic, path in paths.items():
+                path.header.stamp = stamp
+                self.publishers[topic].publish(path)
+            self.current = number
+            self.current_layer_pub.publish(Int32(number))
+            self.prefetch(number + 1)
+        layer = self.source.layers[number]
+        rospy.loginfo(f"Published layer {number} (z = {layer.z:.4f}, {layer.count} points)")
+        return True
+
+    def layer_callback(self, msg):
+        self.publish_layer(msg.data)
+
+    def next_layer_service(self, req):
+        number = 0 if self.current is None else self.current + 1
+        if number >= len(self.source.layers):
+            return TriggerResponse(success=False, message="Last layer already published")
+        return TriggerResponse(success=self.publish_layer(number), message=f"Layer {number}")
+
+
+def default_path_file(profile):
+    return os.path.join(rospkg.RosPack().get_path(profile.package), 'path', profile.file_name)
+
+
+def source_from_params(profile, prefix=''):
+    # prefix: e.g. 'mir_' for ~mir_path_file, ~mir_simplify_tolerance, ... of the path service
+    path_file = rospy.get_param(f'~{prefix}path_file', '') or default_path_file(profile)
+    # dedup (always), resample to ~resample_spacing and simplify with ~simplify_tolerance (0 = off), all in m
+    return engine.PathSource(path_file, profile,
+                             rospy.get_param(f'~{prefix}min_point_distance', 1e-6),
+                             rospy.get_param(f'~{prefix}resample_spacing', 0.0),
+                             rospy.get_param(f'~{prefix}simplify_tolerance', 0.0))
+
+
+def layer_source_from_params(profile):
+    source = source_from_params(profile)
+    # layers are detected from the tool height of the UR path, the MiR path is split at the same points
+    layer_source = rospy.get_param('~layer_source', '') or default_path_file(engine.PROFILES['ur'])
+    index = layers.load_index(source.path_file, layer_source, rospy.get_param('~layer_z_column', 'toolZ'),
+                              rospy.get_param('~layer_z_step', 1e-4))
+    return engine.LayerSource(source.path_file, profile, index, source.min_distance, source.spacing, source.tolerance)
+
+
+def geometry_params(prefix=''):
+    # headings look ~heading_lookahead m ahead (0 = next point), speed limits from the curvature (0 = no limit)
+    return (rospy.get_param(f'~{prefix}heading_lookahead', 0.0), rospy.get_param(f'~{prefix}max_velocity', 1.0),
+            rospy.get_param(f'~{prefix}max_lateral_acceleration', 0.0),
+            rospy.get_param(f'~{prefix}max_angular_velocity', 0.0))
+
+
+def transform_params():
+    return [rospy.get_param(f'~{name}', 0.0) for name in ('tx', 'ty', 'tz', 'rx', 'ry', 'rz')]
+
+
+def run(robot):
+    rospy.init_node('path_transformer')
+    # relative prefix (e.g. mir_path) to publish in the namespace of the node, one per robot
+    profile = engine.PROFILES[robot]
+    profile = profile._replace(topic_prefix=rospy.get_param('~topic_prefix', profile.topic_prefix))
+
+    # Get transformation parameters from ROS params
+    transform = transform_params()
+    publish_mode = rospy.get_param('~publish_mode', 'latched')
+    geometry = geometry_params()
+
+    if publish_mode == 'layered':
+        source = layer_source_from_params(profile)
+        rospy.loginfo(f"Path split into {len(source.layers)} layers")
+        layer_publisher = LayerPublisher(source, profile, transform, geometry)
+        layer_publisher.publish_layer(rospy.get_param('~first_layer', 0))
+        rospy.spin()
+        return
+
+    shared_memory = rospy.get_param('~shared_memory', '')
+    if shared_memory:
+        # the region of this robot, already preprocessed by the path service (parse_path.service)
+        shared_paths = shared.SharedPaths.attach(shared_memory)
+        rospy.on_shutdown(shared_paths.close)
+        points = shared_paths[rospy.get_param('~shared_array')]
+        rospy.loginfo(f"Path from shared memory {shared_memory}: {len(points)} points")
+    else:
+        source = source_from_params(profile)
+        points = source.points
+        rospy.loginfo(f"Path preprocessing: {source.raw_size} -> {len(points)} points")
+
+    stamp = rospy.Time.now()
+    paths = {
+        f'{profile.topic_prefix}_original': build_path(*engine.original_path(points, profile, heading_lookahead=geometry[0]), stamp),
+        f'{profile.topic_prefix}_transformed': build_path(*engine.transformed_path(points, profile, *transform, geometry[0]), stamp),
+    }
+    # small enough for one message in every publish mode
+    geometry_pub = rospy.Publisher(f'{profile.topic_prefix}_geometry', PathGeometry, queue_size=1, latch=True)
+    geometry_pub.publish(build_geometry(points, geometry, stamp))
+    publish(paths, publish_mode, rospy.get_param('~chunk_size', 500))
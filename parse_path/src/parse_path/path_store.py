@@ -0,0 +1,107 @@
+#! /usr/bin/env python3
+"""Compact binary storage for print paths.
+
+Layout of a path store file (little endian):
+
+    0   magic        8s   b"MAPSTORE"
+    8   version      u2
+    10  n_columns    u2
+    12  reserved     u4
+    16  n_points     u8
+    24  data_offset  u8
+    32  column names n_columns * 32s (ascii, zero padded)
+    data_offset     n_columns * n_points float64, one contiguous block per column
+
+The data block is 64 byte aligned so the columns can be memory mapped
+directly as numpy arrays without copying.
+
+Convert one of the old python literal path modules with:
+
+    python3 -m parse_path.path_store mir_path.py mir_path.bin
+"""
+import importlib.util
+import inspect
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"MAPSTORE"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQQ")
+NAME_SIZE = 32
+ALIGNMENT = 64
+
+
+def _data_offset(n_columns):
+    offset = HEADER.size + n_columns * NAME_SIZE
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write(filename, columns):
+    """Write an ordered mapping of column name -> 1d sequence of floats."""
+    names = list(columns.keys())
+    data = [np.ascontiguousarray(columns[name], dtype="<f8") for name in names]
+    n_points = len(data[0]) if data else 0
+    for name, column in zip(names, data):
+        if column.ndim != 1 or len(column) != n_points:
+            raise ValueError(f"Column {name} has shape {column.shape}, expected ({n_points},)")
+        if len(name.encode("ascii")) > NAME_SIZE:
+            raise ValueError(f"Column name {name} is longer than {NAME_SIZE} bytes")
+
+    data_offset = _data_offset(len(names))
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(names), 0, n_points, data_offset))
+        for name in names:
+            f.write(struct.pack(f"{NAME_SIZE}s", name.encode("ascii")))
+        f.write(b"\0" * (data_offset - f.tell()))
+        for column in data:
+            f.write(column.tobytes())
+
+
+def read_header(filename):
+    """Return (column names, number of points, data offset) of a path store."""
+    with open(filename, "rb") as f:
+        magic, version, n_columns, _, n_points, data_offset = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not a path store file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported path store version {version} in {filename}")
+        names = [f.read(NAME_SIZE).rstrip(b"\0").decode("ascii") for _ in range(n_columns)]
+    return names, n_points, data_offset
+
+
+def load(filename):
+    """Memory map a path store. Returns a dict of column name -> read only numpy array.
+
+    The arrays are views into the mapped file, nothing is copied or parsed.
+    """
+    names, n_points, data_offset = read_header(filename)
+    if n_points == 0:
+        return {name: np.empty(0) for name in names}
+    data = np.memmap(filename, dtype="<f8", mode="r", offset=data_offset, shape=(len(names), n_points))
+    return {name: data[i] for i, name in enumerate(names)}
+
+
+def convert_module(module_file, filename):
+    """Convert a path module with functions returning float lists (e.g. mirX(), mirY()) to a path store.
+
+    Every public function of the module becomes one column, named like the function.
+    """
+    module_name = os.path.splitext(os.path.basename(module_file))[0]
+    spec = importlib.util.spec_from_file_location(module_name, module_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    functions = [f for name, f in inspect.getmembers(module, inspect.isfunction)
+                 if not name.startswith("_") and f.__module__ == module_name]
+    functions.sort(key=lambda f: f.__code__.co_firstlineno)
+    write(filename, {f.__name__: f() for f in functions})
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: path_store.py <path_module.py> <output.bin>")
+        sys.exit(1)
+    convert_module(sys.argv[1], sys.argv[2])
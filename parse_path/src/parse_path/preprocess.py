@@ -0,0 +1,120 @@
+#! /usr/bin/env python3
+"""Vectorized clean up of print paths before they are published.
+
+All functions take an (n, d) array of points (d = 2 for the MiR, 3 for the UR)
+and return a new (m, d) array with m <= n (resample may also add points).
+
+    remove_duplicates  drop zero length segments (they give atan2(0, 0) headings)
+    resample           uniform arc length spacing, linear interpolation
+    simplify           Ramer-Douglas-Peucker, every removed point stays within tolerance
+"""
+import numpy as np
+
+# points per window of simplify, bounds its cost to O(n * window) on paths that revisit their start
+SIMPLIFY_WINDOW = 512
+
+
+def remove_duplicates(points, min_distance=1e-6):
+    """Keep a point only if it is further than min_distance from the last kept point."""
+    points = np.asarray(points, dtype=float)
+    if len(points) < 2:
+        return points.copy()
+    keep = np.ones(len(points), dtype=bool)
+    # a point far from its predecessor is far from the last kept point unless the predecessor was
+    # dropped, so only the points after short steps and after dropped points are walked in python
+    candidates = (np.flatnonzero(np.linalg.norm(np.diff(points, axis=0), axis=1) <= min_distance) + 1).tolist()
+    min_distance_sq = min_distance * min_distance
+    c = 0
+    while c < len(candidates):
+        i = candidates[c]
+        last = i - 1
+        while i < len(points):
+            delta = points[i] - points[last]
+            if delta.dot(delta) > min_distance_sq:
+                break
+            keep[i] = False
+            i += 1
+        while c < len(candidates) and candidates[c] <= i:
+            c += 1
+    return points[keep]
+
+
+def arc_length(points):
+    if len(points) == 0:
+        return np.zeros(0)
+    return np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))))
+
+
+def resample(points, spacing):
+    """Points every spacing meters along the polyline, first and last point are kept.
+
+    Corners are cut by at most spacing / 2, expects a path without duplicates.
+    """
+    points = np.asarray(points, dtype=float)
+    s = arc_length(points)
+    if len(points) < 2 or spacing <= 0.0 or s[-1] <= spacing:
+        return points.copy()
+    samples = np.linspace(0.0, s[-1], int(np.ceil(s[-1] / spacing)) + 1)
+    return np.column_stack([np.interp(samples, s, points[:, i]) for i in range(points.shape[1])])
+
+
+def _segment_distances(points, interior, start, end):
+    # distance of points[interior] to the segments points[start]-points[end] (not the infinite lines,
+    # so backtracking paths are kept), one segment per interior point
+    direction = points[end] - points[start]
+    rel = points[interior] - points[start]
+    length_sq = np.einsum("ij,ij->i", direction, direction)
+    t = np.einsum("ij,ij->i", rel, direction)
+    np.divide(t, length_sq, out=t, where=length_sq > 0.0)
+    t[length_sq == 0.0] = 0.0
+    np.clip(t, 0.0, 1.0, out=t)
+    rel -= t[:, None] * direction
+    return np.sqrt(np.einsum("ij,ij->i", rel, rel))
+
+
+def simplify(points, tolerance, window=SIMPLIFY_WINDOW):
+    """Ramer-Douglas-Peucker, every removed point stays within tolerance of the kept polyline.
+
+    The path is simplified in windows of at most window points whose ends are kept. On layered
+    paths a range comes back to its start in every layer, so the splits are unbalanced and one
+    RDP over the whole path costs O(n^2). All open ranges are split together, one set of numpy
+    calls per level of the recursion instead of one per range.
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) < 3 or tolerance <= 0.0:
+        return points.copy()
+    keep = np.zeros(len(points), dtype=bool)
+    ends = np.append(np.arange(0, len(points) - 1, max(window - 1, 2)), len(points) - 1)
+    keep[ends] = True
+    first, last = ends[:-1], ends[1:]
+    while True:
+        open_ranges = last - first >= 2
+        first, last = first[open_ranges], last[open_ranges]
+        if len(first) == 0:
+            break
+        # interior points of all ranges, owner: the range of every interior point
+        counts = last - first - 1
+        owner = np.repeat(np.arange(len(first)), counts)
+        offsets = np.cumsum(counts) - counts
+        interior = np.arange(len(owner)) - offsets[owner] + first[owner] + 1
+        distances = _segment_distances(points, interior, first[owner], last[owner])
+        worst = np.maximum.reduceat(distances, offsets)
+        # first point of every range at its maximum, like argmax
+        at_max = np.flatnonzero(distances == worst[owner])
+        _, first_at_max = np.unique(owner[at_max], return_index=True)
+        split = interior[at_max[first_at_max]]
+        splits = worst > tolerance
+        split = split[splits]
+        keep[split] = True
+        first, last = np.concatenate((first[splits], split)), np.concatenate((split, last[splits]))
+    return points[keep]
+
+
+def preprocess(points, min_distance=1e-6, spacing=0.0, tolerance=0.0):
+    """remove_duplicates -> resample (spacing > 0) -> simplify (tolerance > 0)."""
+    points = remove_duplicates(points, min_distance)
+    if spacing > 0.0:
+        points = resample(points, spacing)
+    if tolerance > 0.0:
+        points = simplify(points, tolerance)
+    return points
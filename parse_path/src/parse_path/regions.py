@@ -0,0 +1,56 @@
+"""Partition of a print into the work regions of several robots.
+
+A region is a list of (start, stop) row ranges of the path stores. The MiR and the UR
+path have the same rows, so one partition holds for both. The parts have about the
+same UR arc length, i.e. the same print time.
+
+In per_layer mode the part of a robot in layer k ends far from its part in layer k + 1.
+The step from one part to the next is a travel move, not printed path, so the parts are
+preprocessed on their own and joined with their bounds (join).
+
+    per_layer    every layer is split into n parts, robot i prints part i of every
+                 layer, so all robots build up the part together
+    contiguous   the whole path is split into n parts, e.g. several separate parts
+"""
+import numpy as np
+
+from parse_path import preprocess
+
+MODES = ("per_layer", "contiguous")
+
+
+def split_rows(points, start, stop, n):
+    """n + 1 row boundaries in [start, stop] with about equal arc length between them."""
+    s = preprocess.arc_length(points[start:stop])
+    if len(s) < 2 or s[-1] <= 0.0:
+        bounds = np.linspace(start, stop, n + 1).round().astype(int)
+    else:
+        bounds = start + np.searchsorted(s, np.linspace(0.0, s[-1], n + 1))
+    bounds[0], bounds[-1] = start, stop
+    return bounds
+
+
+def partition(ur_points, n_robots, mode="per_layer", layers=None):
+    """One region per robot, layers of parse_path.layers (per_layer mode, None = one layer)."""
+    if mode not in MODES:
+        raise ValueError(f"Unknown partition mode {mode}, one of {', '.join(MODES)}")
+    ur_points = np.asarray(ur_points, dtype=float)
+    if mode == "contiguous" or not layers:
+        ranges = [(0, len(ur_points))]
+    else:
+        ranges = [(layer.start, layer.start + layer.count) for layer in layers]
+    regions = [[] for _ in range(n_robots)]
+    for start, stop in ranges:
+        bounds = split_rows(ur_points, start, stop, n_robots)
+        for region, first, last in zip(regions, bounds[:-1].tolist(), bounds[1:].tolist()):
+            if last > first:
+                region.append((first, last))
+    return regions
+
+
+def join(parts, empty):
+    """Concatenated parts and their (start, stop) rows in the result, empty is returned without parts."""
+    if not parts:
+        return empty.copy(), []
+    stops = np.cumsum([len(part) for part in parts]).tolist()
+    return np.concatenate(parts), list(zip([0] + stops[:-1], stops))
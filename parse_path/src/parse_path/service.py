@@ -0,0 +1,96 @@
+"""Path service for several MiR/UR pairs: one node loads the print once, splits it into one
+region per robot (parse_path.regions) and publishes the paths of every robot in its namespace.
+
+    /<robot>/mir_path_original, /<robot>/mir_path_transformed, /<robot>/mir_path_geometry
+    /<robot>/ur_path_original, /<robot>/ur_path_transformed, /<robot>/ur_path_geometry
+    /<robot>/print_region      (param) [[start, stop], ...] rows of the path stores
+    /<robot>/mir_path_parts, /<robot>/ur_path_parts
+                               (param) [[start, stop], ...] poses of *_path_original that are printed,
+                               the step from one part to the next is a travel move
+
+The preprocessed regions also lie in the shared memory block ~shared_memory as
+<robot>/mir and <robot>/ur, see parse_path.shared, so further processes on the host
+(e.g. a publish_path.py with ~shared_memory in chunked or periodic mode) map them
+instead of loading and preprocessing the stores again.
+"""
+import numpy as np
+import rospy
+from print_path_msgs.msg import PathGeometry
+
+from parse_path import engine, layers, node, path_store, preprocess, regions, shared
+
+
+def raw_points(source):
+    # path stores are memory mapped, only the columns of the profile are read
+    columns = path_store.load(source.path_file)
+    return np.column_stack([columns[name] for name in source.profile.columns])
+
+
+def region_points(source, raw, region):
+    """Preprocessed points of a region and the (start, stop) rows of its parts.
+
+    Every part is preprocessed on its own, so the travel from one part to the next is not
+    resampled or simplified as if it was printed.
+    """
+    parts = [preprocess.preprocess(raw[start:stop], source.min_distance, source.spacing, source.tolerance)
+             for start, stop in region]
+    return regions.join(parts, raw[:0])
+
+
+def pose_ranges(part_rows, profile, n_points):
+    # rows of the preprocessed points -> poses of the original path, the planar one drops the first and last point
+    lead = 1 if profile.planar else 0
+    n_poses = n_points - 2 * lead
+    return [[min(max(start - lead, 0), n_poses), min(max(stop - lead, 0), n_poses)] for start, stop in part_rows]
+
+
+def run():
+    rospy.init_node('path_service')
+    robots = rospy.get_param('~robots', ['mur620a'])
+    mode = rospy.get_param('~partition', 'per_layer')
+    transform = node.transform_params()
+    publish_mode = rospy.get_param('~publish_mode', 'latched')
+    if publish_mode == 'layered':
+        raise ValueError("The path service publishes whole regions, layered is not supported")
+
+    # ~mir_path_file, ~mir_simplify_tolerance, ~mir_heading_lookahead, ... and the same with ur_
+    sources = {robot_type: node.source_from_params(engine.PROFILES[robot_type], f'{robot_type}_')
+               for robot_type in ('mir', 'ur')}
+    raw = {robot_type: raw_points(source) for robot_type, source in sources.items()}
+    if len(raw['mir']) != len(raw['ur']):
+        raise ValueError(f"MiR path has {len(raw['mir'])} points, UR path {len(raw['ur'])}")
+
+    index = None
+    if mode == 'per_layer':
+        index = layers.load_index(sources['ur'].path_file, min_step=rospy.get_param('~layer_z_step', 1e-4))
+    robot_regions = regions.partition(raw['ur'], len(robots), mode, index)
+
+    arrays = {}
+    for robot, region in zip(robots, robot_regions):
+        rospy.set_param(f'/{robot}/print_region', [list(rows) for rows in region])
+        for robot_type, source in sources.items():
+            points, part_rows = region_points(source, raw[robot_type], region)
+            arrays[f'{robot}/{robot_type}'] = points
+            rospy.set_param(f'/{robot}/{robot_type}_path_parts', pose_ranges(part_rows, source.profile, len(points)))
+        rospy.loginfo(f"{robot}: {sum(stop - start for start, stop in region)} of {len(raw['ur'])} points "
+                      f"in {len(region)} ranges")
+
+    shared_paths = shared.SharedPaths.create(rospy.get_param('~shared_memory', 'print_paths'), arrays)
+    rospy.on_shutdown(shared_paths.unlink)
+
+    stamp = rospy.Time.now()
+    paths = {}
+    for robot in robots:
+        for robot_type, source in sources.items():
+            profile = source.profile
+            points = shared_paths[f'{robot}/{robot_type}']
+            prefix = f'/{robot}{profile.topic_prefix}'
+            geometry = node.geometry_params(f'{robot_type}_')
+            paths[f'{prefix}_original'] = node.build_path(
+                *engine.original_path(points, profile, heading_lookahead=geometry[0]), stamp)
+            paths[f'{prefix}_transformed'] = node.build_path(
+                *engine.transformed_path(points, profile, *transform, geometry[0]), stamp)
+            rospy.Publisher(f'{prefix}_geometry', PathGeometry, queue_size=1, latch=True).publish(
+                node.build_geometry(points, geometry, stamp))
+    rospy.loginfo(f"Serving the paths of {', '.join(robots)} ({mode})")
+    node.publish(paths, publish_mode, rospy.get_param('~chunk_size', 500))
@@ -0,0 +1,108 @@
+"""Preprocessed print paths in named shared memory, mapped by every process that needs them.
+
+Layout of the block (little endian), like a path store:
+
+    0   magic       8s  b"MAPSHARE"
+    8   version     u2
+    10  n_arrays    u2
+    12  reserved    u4
+    16  table       n_arrays * (name 32s, offset u8, rows u8, columns u8)
+    ...             float64 arrays, row major, 64 byte aligned
+
+    paths = SharedPaths.create("print_paths", {"mur620a/mir": mir_points, ...})    # once
+    SharedPaths.attach("print_paths")["mur620a/mir"]                              # (n, 2) view, no copy
+"""
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+MAGIC = b"MAPSHARE"
+VERSION = 1
+HEADER = struct.Struct("<8sHHI")
+ENTRY = struct.Struct("<32sQQQ")
+NAME_SIZE = 32
+ALIGNMENT = 64
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class SharedPaths:
+    """Read only (n, d) float64 arrays by name in one shared memory block.
+
+    The creating process owns the block and removes it on unlink(), attached processes
+    only close their mapping.
+    """
+
+    def __init__(self, block, owner):
+        self.block = block
+        self.owner = owner
+        magic, version, n_arrays, _ = HEADER.unpack_from(block.buf, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Shared memory {block.name} holds no print paths")
+        if version != VERSION:
+            raise ValueError(f"Unsupported shared paths version {version} in {block.name}")
+        self.arrays = {}
+        for i in range(n_arrays):
+            name, offset, rows, columns = ENTRY.unpack_from(block.buf, HEADER.size + i * ENTRY.size)
+            array = np.ndarray((rows, columns), dtype="<f8", buffer=block.buf, offset=offset)
+            array.flags.writeable = False
+            self.arrays[name.rstrip(b"\0").decode("ascii")] = array
+
+    @classmethod
+    def create(cls, name, arrays):
+        """Copy {name: (n, d) array} into a new block, a stale block of the same name is replaced."""
+        arrays = {key: np.ascontiguousarray(value, dtype="<f8").reshape(len(value), -1) for key, value in arrays.items()}
+        layout = []
+        offset = _align(HEADER.size + len(arrays) * ENTRY.size)
+        for key, array in arrays.items():
+            if len(key.encode("ascii")) > NAME_SIZE:
+                raise ValueError(f"Array name {key} is longer than {NAME_SIZE} bytes")
+            layout.append((key, offset, array))
+            offset = _align(offset + array.nbytes)
+        try:
+            block = shared_memory.SharedMemory(name, create=True, size=offset)
+        except FileExistsError:
+            # left behind by a service that did not shut down
+            stale = shared_memory.SharedMemory(name)
+            stale.close()
+            stale.unlink()
+            block = shared_memory.SharedMemory(name, create=True, size=offset)
+        HEADER.pack_into(block.buf, 0, MAGIC, VERSION, len(layout), 0)
+        for i, (key, array_offset, array) in enumerate(layout):
+            ENTRY.pack_into(block.buf, HEADER.size + i * ENTRY.size, key.encode("ascii"), array_offset, *array.shape)
+            np.ndarray(array.shape, dtype="<f8", buffer=block.buf, offset=array_offset)[:] = array
+        return cls(block, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        block = shared_memory.SharedMemory(name)
+        # the resource tracker would remove the block when this process exits, it belongs to the creator
+        resource_tracker.unregister(block._name, "shared_memory")
+        return cls(block, owner=False)
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def __contains__(self, name):
+        return name in self.arrays
+
+    @property
+    def names(self):
+        return list(self.arrays)
+
+    def close(self):
+        # views into the buffer have to be gone before it can be unmapped
+        self.arrays = {}
+        try:
+            self.block.close()
+        except BufferError:
+            # arrays handed out are still referenced, the mapping goes with the process
+            return
+
+    def unlink(self):
+        self.close()
+        if self.owner:
+            self.block.unlink()
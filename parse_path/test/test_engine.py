@@ -0,0 +1,89 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from parse_path import engine, path_store  # noqa: E402
+
+MIR = engine.PROFILES["mir"]
+UR = engine.PROFILES["ur"]
+
+
+def rotation(rx, ry, rz):
+    # static xyz: rotate about x, then y, then z
+    cx, sx, cy, sy, cz, sz = np.cos(rx), np.sin(rx), np.cos(ry), np.sin(ry), np.cos(rz), np.sin(rz)
+    rot_x = np.array([[1.0, 0.0, 0.0], [0.0, cx, -sx], [0.0, sx, cx]])
+    rot_y = np.array([[cy, 0.0, sy], [0.0, 1.0, 0.0], [-sy, 0.0, cy]])
+    rot_z = np.array([[cz, -sz, 0.0], [sz, cz, 0.0], [0.0, 0.0, 1.0]])
+    return rot_z @ rot_y @ rot_x
+
+
+def square(n=40):
+    s = np.linspace(0.0, 4.0, n, endpoint=False)
+    side, t = np.floor(s), s - np.floor(s)
+    corners = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]])
+    side = side.astype(int)
+    return corners[side] + t[:, None] * (corners[side + 1] - corners[side])
+
+
+def test_euler_matrix():
+    for angles in [(0.0, 0.0, 0.0), (0.3, -0.2, 1.1), (np.pi, 0.5, -2.0)]:
+        matrix = engine.euler_matrix(*angles)
+        np.testing.assert_allclose(matrix, rotation(*angles), atol=1e-12)
+        np.testing.assert_allclose(matrix @ matrix.T, np.identity(3), atol=1e-12)
+
+
+def test_transform_positions():
+    positions = np.random.default_rng(4).random((10, 3))
+    moved = engine.transform_positions(positions, 1.0, 2.0, 3.0, 0.1, 0.2, 0.3)
+    np.testing.assert_allclose(moved, positions + rotation(0.1, 0.2, 0.3) @ (1.0, 2.0, 3.0))
+    np.testing.assert_allclose(engine.transform_positions(positions, -51.6, -39.75, 0.0, 0.0, 0.0, 0.0),
+                               positions + (-51.6, -39.75, 0.0))
+
+
+def test_original_path_planar():
+    points = square()
+    positions, orientations = engine.original_path(points, MIR)
+    # first and last point only give the headings of their neighbours
+    assert positions.shape == (len(points) - 2, 3) and orientations.shape == (len(points) - 2, 4)
+    np.testing.assert_array_equal(positions[:, :2], points[1:-1])
+    assert not positions[:, 2].any()
+    np.testing.assert_allclose(np.linalg.norm(orientations, axis=1), 1.0)
+    # on the first side the path faces +x
+    np.testing.assert_allclose(orientations[2], [0.0, 0.0, 0.0, 1.0], atol=1e-12)
+
+
+def test_original_path_layers():
+    points = np.random.default_rng(5).random((20, 3))
+    positions, orientations = engine.original_path(points, UR, lead=1, trail=2)
+    np.testing.assert_array_equal(positions, points[1:18])
+    np.testing.assert_array_equal(orientations, np.tile((0.0, 0.0, 0.0, 1.0), (17, 1)))
+
+
+def test_transformed_path():
+    points = square()
+    positions, orientations = engine.transformed_path(points, MIR, -51.6, -39.75, 0.2, 0.0, 0.0, 0.0)
+    np.testing.assert_allclose(positions[:, :2], points[1:-1] + (-51.6, -39.75))
+    np.testing.assert_array_equal(positions[:, 2], 0.2)
+    np.testing.assert_array_equal(orientations, engine.original_path(points, MIR)[1])
+
+    points = np.random.default_rng(6).random((30, 3))
+    positions, _ = engine.transformed_path(points, UR, 1.0, 0.0, 0.5, 0.0, 0.0, np.pi / 2)
+    np.testing.assert_allclose(positions, points[1:-1] + (0.0, 1.0, 0.5), atol=1e-12)
+
+
+def test_path_source(tmp_path):
+    filename = str(tmp_path / "mir_path.bin")
+    points = square()
+    # every point twice, the duplicates are removed on load
+    path_store.write(filename, {"mirX": np.repeat(points[:, 0], 2), "mirY": np.repeat(points[:, 1], 2)})
+    source = engine.PathSource(filename, MIR)
+    assert source.raw_size is None
+    np.testing.assert_array_equal(source.points, points)
+    assert source.raw_size == 2 * len(points)
+    assert source.points is source.points
+
+    resampled = engine.PathSource(filename, MIR, spacing=0.05).points
+    np.testing.assert_allclose(np.linalg.norm(np.diff(resampled, axis=0), axis=1), 0.05, rtol=0.05)
@@ -0,0 +1,48 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from parse_path import layers, path_store  # noqa: E402
+
+
+def write_store(filename, n_layers=5, points_per_layer=100, layer_height=0.002):
+    z = np.repeat(np.arange(n_layers) * layer_height, points_per_layer)
+    # small steps inside a layer, seen as layer changes with a fine min_step
+    z[::10] += 5e-4
+    x = np.arange(len(z), dtype=float)
+    path_store.write(filename, {"toolX": x, "toolY": -x, "toolZ": z})
+    return x, z
+
+
+def test_detect_layers():
+    starts, counts = layers.detect_layers([0.0, 0.0, 0.1, 0.1, 0.1, 0.2], min_step=0.05)
+    assert starts.tolist() == [0, 2, 5] and counts.tolist() == [2, 3, 1]
+    assert len(layers.detect_layers([])[0]) == 0
+
+
+def test_index_round_trip(tmp_path):
+    filename = str(tmp_path / "ur_path.bin")
+    x, z = write_store(filename)
+    index = layers.load_index(filename, min_step=1e-3)
+    assert len(index) == 5
+    assert os.path.exists(layers.index_file(filename))
+    assert layers.read_index(layers.index_file(filename))[0] == index
+    assert layers.load_index(filename, min_step=1e-3) == index
+
+    data, lead, trail = layers.read_layer(filename, index, 2, ["toolX", "toolZ"], overlap=3)
+    assert (lead, trail) == (3, 3)
+    np.testing.assert_array_equal(data["toolX"], x[197:303])
+    np.testing.assert_array_equal(data["toolZ"], z[197:303])
+
+
+def test_cache_keyed_on_parameters(tmp_path):
+    filename = str(tmp_path / "ur_path.bin")
+    write_store(filename)
+    assert len(layers.load_index(filename, min_step=1e-3)) == 5
+    # the cached index is newer than the store, but was built with another min_step
+    assert len(layers.load_index(filename, min_step=1e-4)) > 5
+    assert layers.read_index(layers.index_file(filename))[2] == (1e-4, "toolZ")
+    assert len(layers.load_index(filename, z_column="toolY", min_step=1e-4)) == 500
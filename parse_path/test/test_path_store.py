@@ -0,0 +1,58 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from parse_path import path_store  # noqa: E402
+
+
+def test_round_trip(tmp_path):
+    filename = str(tmp_path / "ur_path.bin")
+    rng = np.random.default_rng(3)
+    columns = {"toolX": rng.random(1000), "toolY": rng.random(1000), "toolZ": np.arange(1000) * 0.002}
+    path_store.write(filename, columns)
+
+    names, n_points, data_offset = path_store.read_header(filename)
+    assert names == ["toolX", "toolY", "toolZ"] and n_points == 1000
+    assert data_offset % path_store.ALIGNMENT == 0
+    loaded = path_store.load(filename)
+    assert list(loaded) == names
+    for name, values in columns.items():
+        np.testing.assert_array_equal(loaded[name], values)
+    # memory mapped, not copied
+    assert not loaded["toolX"].flags.writeable
+
+
+def test_empty_store(tmp_path):
+    filename = str(tmp_path / "empty.bin")
+    path_store.write(filename, {"mirX": [], "mirY": []})
+    loaded = path_store.load(filename)
+    assert list(loaded) == ["mirX", "mirY"] and len(loaded["mirX"]) == 0
+
+
+def test_invalid_columns(tmp_path):
+    filename = str(tmp_path / "path.bin")
+    with pytest.raises(ValueError):
+        path_store.write(filename, {"mirX": [0.0, 1.0], "mirY": [0.0]})
+    with pytest.raises(ValueError):
+        path_store.write(filename, {"x" * (path_store.NAME_SIZE + 1): [0.0]})
+
+
+def test_foreign_file(tmp_path):
+    filename = tmp_path / "foreign.bin"
+    filename.write_bytes(b"x" * 200)
+    with pytest.raises(ValueError):
+        path_store.load(str(filename))
+
+
+def test_convert_module(tmp_path):
+    module = tmp_path / "mir_path.py"
+    module.write_text("def mirX():\n    return [0.0, 1.0, 2.0]\n\n\ndef mirY():\n    return [0.0, 0.5, 1.0]\n")
+    filename = str(tmp_path / "mir_path.bin")
+    path_store.convert_module(str(module), filename)
+    loaded = path_store.load(filename)
+    assert list(loaded) == ["mirX", "mirY"]
+    np.testing.assert_array_equal(loaded["mirY"], [0.0, 0.5, 1.0])
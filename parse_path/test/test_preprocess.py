@@ -0,0 +1,133 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from parse_path import preprocess  # noqa: E402
+
+
+def layered_path(n_layers, points_per_layer, radius=0.5, layer_height=0.002, ripple=0.002):
+    # closed contours with a small ripple, every layer comes back to its start
+    angle = np.linspace(0.0, 2.0 * np.pi, points_per_layer, endpoint=False)
+    r = radius + ripple * np.sin(7.0 * angle)
+    layer = np.column_stack((r * np.cos(angle), r * np.sin(angle), np.zeros(points_per_layer)))
+    return np.concatenate([layer + (0.0, 0.0, i * layer_height) for i in range(n_layers)])
+
+
+def reference_rdp(points, tolerance):
+    # recursive textbook version
+    if len(points) < 3:
+        return [0, len(points) - 1][:len(points)]
+    start, end = points[0], points[-1]
+    direction = end - start
+    rel = points[1:-1] - start
+    length_sq = direction.dot(direction)
+    t = np.clip(rel.dot(direction) / length_sq, 0.0, 1.0) if length_sq > 0.0 else np.zeros(len(rel))
+    distances = np.linalg.norm(rel - t[:, None] * direction, axis=1)
+    worst = int(np.argmax(distances))
+    if distances[worst] <= tolerance:
+        return [0, len(points) - 1]
+    split = worst + 1
+    left = reference_rdp(points[:split + 1], tolerance)
+    right = reference_rdp(points[split:], tolerance)
+    return left[:-1] + [split + i for i in right]
+
+
+def max_deviation(points, simplified_rows):
+    # distance of every point to the kept segment it was replaced by
+    rows = np.asarray(simplified_rows)
+    segment = np.clip(np.searchsorted(rows, np.arange(len(points)), side="right") - 1, 0, len(rows) - 2)
+    start, end = points[rows[segment]], points[rows[segment + 1]]
+    direction = end - start
+    rel = points - start
+    length_sq = np.einsum("ij,ij->i", direction, direction)
+    t = np.clip(np.einsum("ij,ij->i", rel, direction) / np.where(length_sq > 0.0, length_sq, 1.0), 0.0, 1.0)
+    return np.linalg.norm(rel - t[:, None] * direction, axis=1).max()
+
+
+def kept_rows(points, simplified):
+    # simplify keeps a subset in order, so the rows can be found by matching
+    rows = []
+    i = 0
+    for point in simplified:
+        while not np.array_equal(points[i], point):
+            i += 1
+        rows.append(i)
+    return rows
+
+
+def test_simplify_matches_rdp():
+    rng = np.random.default_rng(1)
+    points = np.cumsum(rng.normal(size=(400, 2)) * 0.01, axis=0)
+    simplified = preprocess.simplify(points, 0.005, window=len(points))
+    np.testing.assert_array_equal(simplified, points[reference_rdp(points, 0.005)])
+
+
+def test_simplify_tolerance():
+    points = layered_path(5, 2000)
+    for window in (3, 64, preprocess.SIMPLIFY_WINDOW, len(points)):
+        simplified = preprocess.simplify(points, 0.0005, window)
+        assert len(simplified) < len(points)
+        np.testing.assert_array_equal(simplified[[0, -1]], points[[0, -1]])
+        assert max_deviation(points, kept_rows(points, simplified)) <= 0.0005 + 1e-12
+
+
+def test_simplify_layered_size():
+    # 200 stacked layers, a single RDP over the whole path takes minutes on this
+    points = layered_path(200, 2500)
+    start = time.perf_counter()
+    simplified = preprocess.simplify(points, 0.0005)
+    assert time.perf_counter() - start < 10.0
+    assert max_deviation(points, kept_rows(points, simplified)) <= 0.0005 + 1e-12
+
+
+def test_simplify_short_paths():
+    for n in (0, 1, 2):
+        assert len(preprocess.simplify(np.zeros((n, 2)), 0.001)) == n
+    line = np.column_stack((np.linspace(0.0, 1.0, 50), np.zeros(50)))
+    np.testing.assert_array_equal(preprocess.simplify(line, 0.001, window=len(line)), line[[0, -1]])
+
+
+def test_remove_duplicates_creep():
+    # steps below min_distance add up, the distance to the last kept point decides
+    points = np.column_stack((np.arange(10) * 0.4e-6, np.zeros(10)))
+    kept = preprocess.remove_duplicates(points, 1e-6)
+    np.testing.assert_allclose(kept[:, 0], [0.0, 1.2e-6, 2.4e-6, 3.6e-6])
+
+
+def test_remove_duplicates_reference():
+    rng = np.random.default_rng(2)
+    steps = rng.random((5000, 3)) * np.where(rng.random((5000, 1)) < 0.5, 1e-7, 1e-3)
+    points = np.cumsum(steps, axis=0)
+    keep = [0]
+    for i in range(1, len(points)):
+        if np.linalg.norm(points[i] - points[keep[-1]]) > 1e-6:
+            keep.append(i)
+    np.testing.assert_array_equal(preprocess.remove_duplicates(points, 1e-6), points[keep])
+
+
+def test_resample():
+    points = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 0.5]])
+    resampled = preprocess.resample(points, 0.1)
+    np.testing.assert_array_equal(resampled[[0, -1]], points[[0, -1]])
+    steps = np.linalg.norm(np.diff(resampled, axis=0), axis=1)
+    assert len(resampled) == 16
+    # uniform along the path, only the step over the corner is shorter
+    np.testing.assert_allclose(np.delete(steps, 9), 0.1)
+    np.testing.assert_allclose(preprocess.arc_length(resampled)[-1], 1.5, atol=0.01)
+    np.testing.assert_array_equal(preprocess.resample(points, 0.0), points)
+    np.testing.assert_array_equal(preprocess.resample(points, 2.0), points)
+
+
+def test_preprocess_steps():
+    rng = np.random.default_rng(7)
+    points = np.repeat(np.cumsum(rng.random((200, 3)) * 0.01, axis=0), 2, axis=0)
+    np.testing.assert_array_equal(preprocess.preprocess(points), points[::2])
+    resampled = preprocess.preprocess(points, spacing=0.002)
+    np.testing.assert_allclose(preprocess.arc_length(resampled)[-1], preprocess.arc_length(points)[-1], rtol=0.01)
+    simplified = preprocess.preprocess(points, spacing=0.002, tolerance=0.001)
+    assert len(simplified) < len(resampled)
+    assert max_deviation(resampled, kept_rows(resampled, simplified)) <= 0.001 + 1e-12
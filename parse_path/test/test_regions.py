@@ -0,0 +1,41 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from parse_path import layers, preprocess, regions  # noqa: E402
+
+
+def layered_path(n_layers=4, points_per_layer=300, layer_height=0.002):
+    angle = np.linspace(0.0, 2.0 * np.pi, points_per_layer, endpoint=False)
+    layer = np.column_stack((np.cos(angle), np.sin(angle), np.zeros(points_per_layer)))
+    return np.concatenate([layer + (0.0, 0.0, i * layer_height) for i in range(n_layers)])
+
+
+def test_partition_per_layer():
+    points = layered_path()
+    starts, counts = layers.detect_layers(points[:, 2])
+    index = [layers.Layer(i, start, count, 0.0, ()) for i, (start, count) in enumerate(zip(starts, counts))]
+    robot_regions = regions.partition(points, 3, "per_layer", index)
+    # one part per robot and layer, together they cover every row once
+    assert [len(region) for region in robot_regions] == [4, 4, 4]
+    rows = sorted(row for region in robot_regions for start, stop in region for row in range(start, stop))
+    assert rows == list(range(len(points)))
+    lengths = [preprocess.arc_length(points[start:stop])[-1] for start, stop in robot_regions[1]]
+    np.testing.assert_allclose(lengths, lengths[0], rtol=0.05)
+
+
+def test_join():
+    points = layered_path()
+    region = regions.partition(points, 3, "per_layer", [layers.Layer(i, i * 300, 300, 0.0, ()) for i in range(4)])[2]
+    joined, part_rows = regions.join([points[start:stop] for start, stop in region], points[:0])
+    assert part_rows[0][0] == 0 and part_rows[-1][1] == len(joined)
+    for (start, stop), (row_start, row_stop) in zip(part_rows, region):
+        np.testing.assert_array_equal(joined[start:stop], points[row_start:row_stop])
+    # the parts of neighbouring layers are far apart, the step between them is travel
+    assert np.linalg.norm(joined[part_rows[1][0]] - joined[part_rows[0][1] - 1]) > 1.0
+
+    empty, part_rows = regions.join([], points[:0])
+    assert empty.shape == (0, 3) and part_rows == []
@@ -1,8 +0,0 @@
-def toolX():
- return [51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982,51.615323,51.595286,51.575249,51.555212,51.535175,51.515138,51.495101,51.475064,51.455028,51.434991,51.414954,51.400296,51.401125,51.401954,51.402783,51.403773,51.406253,51.408734,51.411215,51.413696,51.416177,51.418657,51.422469,51.426585,51.430702,51.434818,51.438934,51.443050,51.448019,51.453742,51.459465,51.465188,51.470911,51.476634,51.482745,51.490036,51.497327,51.504618,51.511909,51.519200,51.526491,51.535245,51.544054,51.552863,51.561671,51.570480,51.579289,51.589090,51.599356,51.609623,51.619889,51.630156,51.640422,51.651240,51.662893,51.674547,51.686200,51.697854,51.709507,51.721310,51.734271,51.747232,51.760193,51.773154,51.786115,51.799076,51.809872,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.812500,51.823838,51.843874,51.863911,51.883948,51.903985,51.924022,51.944059,51.964096,51.984132,52.004169,52.024206,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.027500,52.030255,52.041428,52.058831,52.078673,52.096865,52.114118,52.131371,52.148624,52.165877,52.183130,52.200382,52.218402,52.236432,52.254462,52.272493,52.290523,52.308553,52.327079,52.345764,52.364450,52.383136,52.401822,52.420508,52.439471,52.458687,52.477903,52.497119,52.516335,52.535551,52.554885,52.574501,52.594118,52.613735,52.633351,52.652968,52.672601,52.692486,52.712372,52.732257,52.752142,52.772027,52.791913,52.811910,52.831930,52.851950,52.871970,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.877500,52.857872,52.837860,52.817847,52.797834,52.777954,52.758134,52.738314,52.718494,52.698674,52.678854,52.659147,52.639710,52.620274,52.600838,52.581401,52.561965,52.542529,52.523605,52.504739,52.485874,52.467008,52.448143,52.429277,52.410788,52.392674,52.374561,52.356448,52.338335,52.320222,52.302202,52.285016,52.267830,52.250643,52.233457,52.216271,52.199085,52.182665,52.166571,52.150478,52.134384,52.118290,52.102197,52.086480,52.071634,52.056787,52.041941,52.027094,52.012248,51.997403,51.983810,51.970354,51.956898,51.943442,51.929986,51.916531,51.903839,51.891902,51.879966,51.868030,51.856094,51.844158,51.832390,51.822089,51.811788,51.801487,51.791186,51.780886,51.770585,51.761503,51.752936,51.744370,51.735803,51.727236,51.718669,51.710654,51.703903,51.697153,51.690403,51.683653,51.676902,51.670154,51.665102,51.660233,51.655365,51.650496,51.645628,51.640759,51.636862,51.633922,51.630982]
-
-def toolY():
- return [40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.772500,40.777660,40.797680,40.817700,40.837719,40.857726,40.877609,40.897491,40.917374,40.937257,40.957139,40.977022,40.996682,41.016292,41.035901,41.055511,41.075120,41.094730,41.114123,41.133326,41.152528,41.171730,41.190932,41.210134,41.229203,41.247866,41.266530,41.285193,41.303856,41.322519,41.341183,41.359203,41.377200,41.395197,41.413193,41.431190,41.449187,41.466646,41.483853,41.501060,41.518266,41.535473,41.552680,41.569527,41.585826,41.602125,41.618425,41.634724,41.651024,41.667207,41.682487,41.697768,41.713048,41.728328,41.743609,41.758889,41.775609,41.795335,41.815372,41.835409,41.855446,41.875482,41.895519,41.915556,41.935593,41.955630,41.975667,41.995704,42.015741,42.035777,42.055814,42.075851,42.095888,42.115925,42.135962,42.155999,42.176036,42.196072,42.216109,42.236146,42.256183,42.276220,42.296257,42.316294,42.336330,42.356367,42.376404,42.396441,42.416478,42.436515,42.456552,42.476589,42.496625,42.516662,42.536699,42.556736,42.576773,42.596810,42.616847,42.636883,42.656920,42.676957,42.696994,42.717031,42.737068,42.757105,42.777142,42.797178,42.817215,42.837252,42.857289,42.877326,42.897363,42.917400,42.937437,42.957473,42.977510,42.997547,43.017584,43.037621,43.057658,43.077695,43.097731,43.117768,43.137805,43.157842,43.177879,43.197916,43.217953,43.237990,43.258026,43.278063,43.298100,43.318137,43.338174,43.358211,43.378248,43.398285,43.418321,43.438358,43.458395,43.478432,43.498469,43.518506,43.538543,43.558579,43.578616,43.598653,43.618690,43.638727,43.658764,43.678801,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.687500,43.670757,43.650720,43.630683,43.610646,43.590609,43.570573,43.550536,43.530499,43.510462,43.490425,43.470388,43.450351,43.430314,43.410278,43.390241,43.370204,43.350167,43.330130,43.310093,43.290056,43.270020,43.249983,43.229946,43.209909,43.189872,43.169835,43.149798,43.129761,43.109725,43.089688,43.069651,43.049614,43.029577,43.009540,42.989503,42.969466,42.949430,42.929393,42.909356,42.889319,42.869282,42.849245,42.829208,42.809172,42.789135,42.769098,42.749061,42.729024,42.708987,42.688950,42.668913,42.648877,42.628840,42.608803,42.588766,42.568729,42.548692,42.528655,42.508619,42.488582,42.468545,42.448508,42.428471,42.408434,42.388397,42.368360,42.348324,42.328287,42.308250,42.288213,42.268176,42.248139,42.228102,42.208065,42.188029,42.167992,42.147955,42.127918,42.107881,42.087844,42.067807,42.047771,42.028067,42.011659,42.002110,42.001514,42.009621,42.019810,42.029999,42.040188,42.050376,42.060565,42.070754,42.079514,42.088254,42.096994,42.105734,42.114474,42.123214,42.130816,42.138049,42.145282,42.152515,42.159748,42.166981,42.173397,42.179074,42.184750,42.190427,42.196104,42.201780,42.206989,42.211071,42.215154,42.219236,42.223319,42.227401,42.231382,42.233842,42.236302,42.238762,42.241222,42.243683,42.246143,42.247240,42.248063,42.248885,42.249707,42.235432,42.215395,42.195358,42.175321,42.155284,42.135247,42.115210,42.095174,42.075137,42.055100,42.035063,42.033713,42.032729,42.031746,42.030762,42.028400,42.025461,42.022521,42.019581,42.016641,42.013701,42.010174,42.005305,42.000437,41.995568,41.990700,41.985831,41.980960,41.974391,41.967641,41.960891,41.954140,41.947390,41.940640,41.932972,41.924405,41.915838,41.907272,41.898705,41.890138,41.881389,41.871088,41.860787,41.850486,41.840185,41.829885,41.819584,41.808129,41.796193,41.784257,41.772321,41.760385,41.748448,41.736048,41.722592,41.709136,41.695680,41.682224,41.668768,41.655310,41.640596,41.625750,41.610904,41.596057,41.581211,41.566365,41.550887,41.534793,41.518700,41.502606,41.486512,41.470419,41.454208,41.437022,41.419836,41.402650,41.385463,41.368277,41.351091,41.333249,41.315136,41.297022,41.278909,41.260796,41.242683,41.224338,41.205472,41.186606,41.167741,41.148875,41.130010,41.111143,41.091759,41.072323,41.052886,41.033450,41.014014,40.994577,40.974944,40.955124,40.935304]
-
-def toolZ():
- return [0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.817469,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.837473,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.857477,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.877481,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.897485,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.917489,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.937493,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.957497,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.977501,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,0.997505,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.017509,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.037513,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.057517,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521,1.077521]
\ No newline at end of file
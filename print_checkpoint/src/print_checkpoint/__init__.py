@@ -0,0 +1,2 @@
+from print_checkpoint.checkpoint import (ABORTED, COMPLETE, PAUSED, RUNNING, STATUS_NAMES, Checkpoint, CheckpointWriter,
+                                         default_checkpoint_file, read_all, read_last)
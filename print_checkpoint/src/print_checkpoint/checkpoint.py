@@ -0,0 +1,149 @@
+"""Append only checkpoints of the print progress.
+
+    writer = CheckpointWriter.from_params()              # ~checkpoint_file, ~checkpoint_period
+    writer.update(stamp, RUNNING, idx, len(poses), arc_length, mir_pose, ur_position)    # every control cycle
+    writer.update(stamp, PAUSED, ..., force=True)        # state changes are always written
+
+    checkpoint = read_last(default_checkpoint_file())    # None if nothing was written yet
+
+A checkpoint file is a 16 byte header followed by fixed size records (little endian):
+
+    0   stamp       f8   ROS time in s
+    8   status      u1   RUNNING, PAUSED, ABORTED or COMPLETE
+    12  index       u4   MiR path index (target waypoint)
+    16  n_poses     u4   length of the MiR path, to detect a checkpoint of another path
+    20  arc_length  f8   MiR arc length at index, nan if unknown
+    28  mir pose    3 f8 x, y, yaw in map
+    52  ur position 3 f8 x, y, z of the TCP in map, nan if unknown
+    76  crc32       u4   of bytes 0..75
+
+Writing a record is one pack and one write of 80 bytes into the page cache, there is
+no fsync per record. A record that was cut off by a crash fails its crc or is
+incomplete, it is skipped on reading and cut off before the next append.
+"""
+import math
+import os
+import struct
+import zlib
+from collections import namedtuple
+
+MAGIC = b"MAPCHKPT"
+VERSION = 1
+HEADER = struct.Struct("<8sHxxxxxx")
+RECORD = struct.Struct("<dB3xIIdddddddI")
+
+RUNNING, PAUSED, ABORTED, COMPLETE = range(4)
+STATUS_NAMES = ("running", "paused", "aborted", "complete")
+
+Checkpoint = namedtuple("Checkpoint", ["stamp", "status", "index", "n_poses", "arc_length", "mir_pose", "ur_position"])
+
+_NAN3 = (math.nan, math.nan, math.nan)
+
+
+def default_checkpoint_file(namespace=None):
+    """$ROS_HOME/print_checkpoint.bin, print_checkpoint_<robot>.bin for nodes in a robot namespace.
+
+    namespace: default the namespace of this node, so the MiR and UR nodes of one robot share the file.
+    """
+    # rospy only where the node is needed, reading and writing checkpoints works without ROS
+    import rospy
+    namespace = (rospy.get_namespace() if namespace is None else namespace).strip("/").replace("/", "_")
+    name = f"print_checkpoint_{namespace}.bin" if namespace else "print_checkpoint.bin"
+    return os.path.join(os.environ.get("ROS_HOME", os.path.expanduser("~/.ros")), name)
+
+
+def _record_count(size):
+    return max(size - HEADER.size, 0) // RECORD.size
+
+
+def _unpack(buffer, offset=0):
+    values = RECORD.unpack_from(buffer, offset)
+    if zlib.crc32(buffer[offset:offset + RECORD.size - 4]) != values[-1]:
+        return None
+    stamp, status, index, n_poses, arc_length = values[:5]
+    return Checkpoint(stamp, status, index, n_poses, arc_length, values[5:8], values[8:11])
+
+
+def read_last(filename):
+    """Newest valid checkpoint of the file, None if there is none."""
+    try:
+        with open(filename, "rb") as f:
+            magic, version = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{filename} is not a checkpoint file")
+            # only the tail is read, the file grows with every print
+            count = _record_count(os.fstat(f.fileno()).st_size)
+            for i in range(count - 1, -1, -1):
+                f.seek(HEADER.size + i * RECORD.size)
+                checkpoint = _unpack(f.read(RECORD.size))
+                if checkpoint is not None:
+                    return checkpoint
+    except (FileNotFoundError, struct.error):
+        pass
+    return None
+
+
+def read_all(filename):
+    """All valid checkpoints of the file, oldest first."""
+    with open(filename, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size or HEADER.unpack_from(data)[0] != MAGIC:
+        raise ValueError(f"{filename} is not a checkpoint file")
+    checkpoints = (_unpack(data, HEADER.size + i * RECORD.size) for i in range(_record_count(len(data))))
+    return [checkpoint for checkpoint in checkpoints if checkpoint is not None]
+
+
+class CheckpointWriter:
+    """Appends a checkpoint at most every period seconds (ROS time), period <= 0 disables writing."""
+
+    def __init__(self, filename, period=1.0):
+        self.filename = filename
+        self.enabled = bool(filename) and period > 0
+        self.period = period
+        self.last_stamp = -math.inf
+        self.last_status = None
+        self.buffer = bytearray(RECORD.size)
+        self.file = None
+
+    @classmethod
+    def from_params(cls):
+        import rospy
+        return cls(rospy.get_param("~checkpoint_file", "") or default_checkpoint_file(),
+                   rospy.get_param("~checkpoint_period", 1.0))
+
+    def open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
+        self.file = open(self.filename, "a+b")
+        size = self.file.seek(0, os.SEEK_END)
+        self.file.seek(0)
+        header = self.file.read(HEADER.size)
+        if size < HEADER.size or HEADER.unpack(header) != (MAGIC, VERSION):
+            # nothing written yet, or not a checkpoint file of this version: start a new one
+            self.file.truncate(0)
+            self.file.write(HEADER.pack(MAGIC, VERSION))
+        else:
+            # drop a record that was cut off by a crash, so the next ones stay aligned
+            self.file.truncate(HEADER.size + _record_count(size) * RECORD.size)
+
+    def update(self, stamp, status, index, n_poses, arc_length=None, mir_pose=None, ur_position=None, force=False):
+        """Write a checkpoint if the period passed, the status changed or force is set. Returns True if written."""
+        if not self.enabled:
+            return False
+        if not force and status == self.last_status and stamp - self.last_stamp < self.period:
+            return False
+        if self.file is None:
+            self.open()
+        RECORD.pack_into(self.buffer, 0, stamp, status, index, n_poses,
+                         math.nan if arc_length is None else arc_length,
+                         *(mir_pose or _NAN3), *(ur_position or _NAN3), 0)
+        struct.pack_into("<I", self.buffer, RECORD.size - 4, zlib.crc32(memoryview(self.buffer)[:RECORD.size - 4]))
+        self.file.write(self.buffer)
+        self.file.flush()
+        self.last_stamp = stamp
+        self.last_status = status
+        return True
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
@@ -0,0 +1,98 @@
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from print_checkpoint.checkpoint import (HEADER, PAUSED, RECORD, RUNNING, CheckpointWriter,  # noqa: E402
+                                         read_all, read_last)
+
+
+def write(filename, n, period=1.0):
+    writer = CheckpointWriter(str(filename), period)
+    for i in range(n):
+        assert writer.update(float(i), RUNNING, i, 100, 0.5 * i, (i, -i, 0.1 * i), (i, i, 0.25))
+    writer.close()
+
+
+def test_round_trip(tmp_path):
+    filename = tmp_path / "checkpoint.bin"
+    write(filename, 3)
+    checkpoints = read_all(str(filename))
+    assert [c.index for c in checkpoints] == [0, 1, 2]
+    last = read_last(str(filename))
+    assert last == checkpoints[-1]
+    assert (last.stamp, last.status, last.index, last.n_poses, last.arc_length) == (2.0, RUNNING, 2, 100, 1.0)
+    assert last.mir_pose == (2.0, -2.0, 0.2) and last.ur_position == (2.0, 2.0, 0.25)
+
+
+def test_unknown_values(tmp_path):
+    filename = tmp_path / "checkpoint.bin"
+    writer = CheckpointWriter(str(filename))
+    writer.update(1.0, PAUSED, 5, 10)
+    writer.close()
+    checkpoint = read_last(str(filename))
+    assert checkpoint.status == PAUSED
+    assert math.isnan(checkpoint.arc_length)
+    assert all(math.isnan(v) for v in checkpoint.mir_pose + checkpoint.ur_position)
+
+
+def test_period(tmp_path):
+    writer = CheckpointWriter(str(tmp_path / "checkpoint.bin"), period=1.0)
+    assert writer.update(0.0, RUNNING, 0, 10)
+    assert not writer.update(0.5, RUNNING, 1, 10)
+    # state changes and forced updates are always written
+    assert writer.update(0.6, PAUSED, 1, 10)
+    assert writer.update(0.7, PAUSED, 1, 10, force=True)
+    assert writer.update(1.7, PAUSED, 2, 10)
+    writer.close()
+    assert not CheckpointWriter(str(tmp_path / "disabled.bin"), period=0.0).update(0.0, RUNNING, 0, 10)
+    assert not os.path.exists(tmp_path / "disabled.bin")
+
+
+def test_truncated_tail(tmp_path):
+    filename = tmp_path / "checkpoint.bin"
+    write(filename, 3)
+    # record cut off by a crash
+    with open(filename, "ab") as f:
+        f.write(b"\x01" * (RECORD.size // 2))
+    assert read_last(str(filename)).index == 2
+    assert len(read_all(str(filename))) == 3
+
+    # the next writer cuts it off, so its records stay aligned
+    writer = CheckpointWriter(str(filename))
+    writer.update(10.0, PAUSED, 7, 100)
+    writer.close()
+    assert os.path.getsize(filename) == HEADER.size + 4 * RECORD.size
+    assert [c.index for c in read_all(str(filename))] == [0, 1, 2, 7]
+
+
+def test_corrupted_record(tmp_path):
+    filename = tmp_path / "checkpoint.bin"
+    write(filename, 3)
+    with open(filename, "r+b") as f:
+        f.seek(HEADER.size + 2 * RECORD.size + 12)
+        f.write(b"\xff")
+    assert read_last(str(filename)).index == 1
+    assert [c.index for c in read_all(str(filename))] == [0, 1]
+
+
+def test_missing_and_foreign_files(tmp_path):
+    assert read_last(str(tmp_path / "missing.bin")) is None
+    foreign = tmp_path / "foreign.bin"
+    foreign.write_bytes(b"x" * 200)
+    with pytest.raises(ValueError):
+        read_last(str(foreign))
+    with pytest.raises(ValueError):
+        read_all(str(foreign))
+
+
+def test_writer_replaces_foreign_file(tmp_path):
+    filename = tmp_path / "checkpoint.bin"
+    filename.write_bytes(b"x" * 200)
+    writer = CheckpointWriter(str(filename))
+    writer.update(1.0, RUNNING, 3, 10)
+    writer.close()
+    assert [c.index for c in read_all(str(filename))] == [3]
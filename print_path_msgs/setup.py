@@ -0,0 +1,9 @@
+from distutils.core import setup
+from catkin_pkg.python_setup import generate_distutils_setup
+
+setup_args = generate_distutils_setup(
+    packages=['print_path_msgs'],
+    package_dir={'': 'src'},
+)
+
+setup(**setup_args)
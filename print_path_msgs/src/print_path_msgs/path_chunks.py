@@ -0,0 +1,90 @@
+import rospy
+from print_path_msgs.msg import PathChunk, PathManifest
+
+
+def manifest_topic(path_topic):
+    return path_topic.rstrip("/") + "/manifest"
+
+
+def chunk_topic(path_topic):
+    return path_topic.rstrip("/") + "/chunks"
+
+
+class PathChunkPublisher(rospy.SubscribeListener):
+    """Streams a nav_msgs/Path as fixed size PathChunk messages plus a latched PathManifest.
+
+    The chunks are sent once on publish() and again to every subscriber that connects later,
+    so nobody has to re-send the full path periodically.
+    """
+
+    def __init__(self, path_topic, path, chunk_size=500):
+        super().__init__()
+        chunk_size = max(1, int(chunk_size))
+        total_poses = len(path.poses)
+        num_chunks = (total_poses + chunk_size - 1) // chunk_size
+
+        self.manifest = PathManifest(header=path.header, total_poses=total_poses,
+                                     chunk_size=chunk_size, num_chunks=num_chunks)
+        self.chunks = [PathChunk(header=path.header, chunk_seq=seq, num_chunks=num_chunks,
+                                 start_index=start, total_poses=total_poses,
+                                 poses=path.poses[start:start + chunk_size])
+                       for seq, start in enumerate(range(0, total_poses, chunk_size))]
+
+        self.manifest_pub = rospy.Publisher(manifest_topic(path_topic), PathManifest, queue_size=1, latch=True)
+        # queue has to hold a whole stream, otherwise late chunks would drop early ones
+        self.chunk_pub = rospy.Publisher(chunk_topic(path_topic), PathChunk, queue_size=max(1, num_chunks),
+                                         subscriber_listener=self)
+
+    def publish(self):
+        self.manifest_pub.publish(self.manifest)
+        for chunk in self.chunks:
+            self.chunk_pub.publish(chunk)
+
+    def peer_subscribe(self, topic_name, topic_publish, peer_publish):
+        # replay the stream only to the new subscriber
+        for chunk in self.chunks:
+            peer_publish(chunk)
+
+
+class PathChunkAssembler:
+    """Rebuilds a path from PathChunk messages that may arrive out of order.
+
+    on_update(poses, complete) is called whenever the contiguous prefix of the path grows.
+    poses is the same list object for the whole path, it is only ever extended.
+    """
+
+    def __init__(self, on_update=None):
+        self.on_update = on_update
+        self.stamp = None
+        self.total_poses = 0
+        self.poses = []
+        self.pending = {}
+
+    @property
+    def complete(self):
+        return self.stamp is not None and len(self.poses) == self.total_poses
+
+    def reset(self, stamp, total_poses):
+        self.stamp = stamp
+        self.total_poses = total_poses
+        self.poses = []
+        self.pending = {}
+
+    def manifest_callback(self, msg):
+        if msg.header.stamp != self.stamp:
+            self.reset(msg.header.stamp, msg.total_poses)
+
+    def chunk_callback(self, msg):
+        if msg.header.stamp != self.stamp:
+            self.reset(msg.header.stamp, msg.total_poses)
+        if msg.start_index < len(self.poses):
+            return  # duplicate, e.g. replayed stream
+        self.pending[msg.start_index] = msg.poses
+
+        grown = False
+        while len(self.poses) in self.pending:
+            self.poses.extend(self.pending.pop(len(self.poses)))
+            grown = True
+        if grown and self.on_update is not None:
+            self.on_update(self.poses, self.complete)
+
@@ -0,0 +1,92 @@
+import os
+import sys
+
+import pytest
+
+# the helpers come with the generated messages, only available in a built workspace
+pytest.importorskip("rospy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+msg = pytest.importorskip("print_path_msgs.msg")
+
+import rospy  # noqa: E402
+from geometry_msgs.msg import PoseStamped  # noqa: E402
+from std_msgs.msg import Header  # noqa: E402
+
+from print_path_msgs.path_chunks import PathChunkAssembler  # noqa: E402
+
+
+def stream(total_poses, chunk_size, stamp=1.0):
+    # what PathChunkPublisher sends, poses numbered by their seq
+    header = Header(stamp=rospy.Time.from_sec(stamp))
+    poses = [PoseStamped() for _ in range(total_poses)]
+    for i, pose in enumerate(poses):
+        pose.header.seq = i
+    num_chunks = (total_poses + chunk_size - 1) // chunk_size
+    manifest = msg.PathManifest(header=header, total_poses=total_poses, chunk_size=chunk_size, num_chunks=num_chunks)
+    chunks = [msg.PathChunk(header=header, chunk_seq=seq, num_chunks=num_chunks, start_index=start,
+                            total_poses=total_poses, poses=poses[start:start + chunk_size])
+              for seq, start in enumerate(range(0, total_poses, chunk_size))]
+    return manifest, chunks
+
+
+class Updates:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, poses, complete):
+        self.calls.append(([pose.header.seq for pose in poses], complete))
+
+
+def test_in_order():
+    updates = Updates()
+    assembler = PathChunkAssembler(updates)
+    manifest, chunks = stream(10, 4)
+    assembler.manifest_callback(manifest)
+    for chunk in chunks:
+        assembler.chunk_callback(chunk)
+    assert assembler.complete
+    assert [len(seqs) for seqs, _ in updates.calls] == [4, 8, 10]
+    assert [complete for _, complete in updates.calls] == [False, False, True]
+    assert updates.calls[-1][0] == list(range(10))
+
+
+def test_out_of_order_and_duplicates():
+    updates = Updates()
+    assembler = PathChunkAssembler(updates)
+    _, chunks = stream(10, 3)
+    # no manifest, the first chunk starts the path
+    for i in (2, 1, 3, 1, 0):
+        assembler.chunk_callback(chunks[i])
+    assert assembler.complete
+    # the prefix only grows once everything before it arrived
+    assert updates.calls == [(list(range(10)), True)]
+    assert [pose.header.seq for pose in assembler.poses] == list(range(10))
+
+
+def test_missing_chunk():
+    updates = Updates()
+    assembler = PathChunkAssembler(updates)
+    manifest, chunks = stream(10, 3)
+    assembler.manifest_callback(manifest)
+    for i in (0, 2, 3):
+        assembler.chunk_callback(chunks[i])
+    assert not assembler.complete
+    assert [pose.header.seq for pose in assembler.poses] == [0, 1, 2]
+    assert len(updates.calls) == 1
+    # the replayed stream of a reconnect fills the gap
+    for chunk in chunks:
+        assembler.chunk_callback(chunk)
+    assert assembler.complete and updates.calls[-1] == (list(range(10)), True)
+
+
+def test_new_path_resets():
+    assembler = PathChunkAssembler()
+    _, chunks = stream(10, 3)
+    for chunk in chunks[:2]:
+        assembler.chunk_callback(chunk)
+    manifest, chunks = stream(4, 3, stamp=2.0)
+    assembler.manifest_callback(manifest)
+    assert assembler.poses == [] and assembler.total_poses == 4
+    for chunk in chunks:
+        assembler.chunk_callback(chunk)
+    assert assembler.complete and len(assembler.poses) == 4
@@ -0,0 +1,82 @@
+#! /usr/bin/env python3
+"""Score a recorded run against the reference paths: cross-track error, deposition speed
+uniformity, MiR/UR synchronization lag, per layer.
+
+    analyze_trace.py ~/.ros/traces/20240501-101500
+    analyze_trace.py <trace> --gate ur_cross_track_p95=0.002 --gate speed_cv=0.1     exit 1 if exceeded
+
+The reference paths are the path stores of parse_mir_path / parse_ur_path as published
+on /mir_path_original and /ur_path_original, in map like the recorded poses and the paths
+the followers track. --transform moves them like the path parsers do for *_transformed.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import rospkg
+
+from parse_path import engine
+from print_recorder.analytics import LAYER_COLUMNS, ReferencePath, analyze, format_table
+from print_recorder.trace import Trace
+
+
+def reference(robot, path_file, transform):
+    profile = engine.PROFILES[robot]
+    if not path_file:
+        path_file = os.path.join(rospkg.RosPack().get_path(profile.package), "path", profile.file_name)
+    points = engine.PathSource(path_file, profile).points
+    if transform is None:
+        positions, _ = engine.original_path(points, profile)
+    else:
+        positions, _ = engine.transformed_path(points, profile, *transform)
+    return ReferencePath(positions[:, :2] if profile.planar else positions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("trace", help="trace directory of record_trace.py")
+    parser.add_argument("--mir-path", help="MiR path store, default the one of parse_mir_path")
+    parser.add_argument("--ur-path", help="UR path store, default the one of parse_ur_path")
+    parser.add_argument("--transform", type=float, nargs=6, metavar=("TX", "TY", "TZ", "RX", "RY", "RZ"),
+                        help="compare against the transformed paths instead of the original ones")
+    parser.add_argument("--min-speed", type=float, default=0.005, help="m/s along the UR path that count as printing")
+    parser.add_argument("--gate", action="append", default=[], metavar="METRIC=MAX",
+                        help="fail if a summary metric is above MAX")
+    parser.add_argument("--layers-csv", help="write the per layer table to this file")
+    parser.add_argument("--json", action="store_true", help="print summary and layers as json")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    report = analyze(Trace(args.trace), reference("mir", args.mir_path, args.transform),
+                     reference("ur", args.ur_path, args.transform), args.min_speed)
+    elapsed = time.perf_counter() - start
+
+    if args.layers_csv:
+        np.savetxt(args.layers_csv, np.array(report.layers, dtype=float).reshape(-1, len(LAYER_COLUMNS)),
+                   delimiter=",", header=",".join(LAYER_COLUMNS), comments="")
+    if args.json:
+        print(json.dumps({"summary": report.summary, "layers": [dict(zip(LAYER_COLUMNS, row)) for row in report.layers]}))
+    else:
+        for key, value in report.summary.items():
+            print(f"{key:24s} {value:.6g}")
+        print()
+        print(format_table(report.layers))
+        print(f"\n{report.summary['mir_samples'] + report.summary['ur_samples']} samples scored in {elapsed:.2f} s")
+
+    failed = []
+    for gate in args.gate:
+        metric, limit = gate.split("=", 1)
+        if metric not in report.summary:
+            parser.error(f"unknown metric {metric}, one of {', '.join(report.summary)}")
+        if report.summary[metric] > float(limit):
+            failed.append(f"{metric} {report.summary[metric]:.6g} > {limit}")
+    if failed:
+        print("FAILED: " + "; ".join(failed), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
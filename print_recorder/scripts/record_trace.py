@@ -0,0 +1,9 @@
+#! /usr/bin/env python3
+import rospy
+from print_recorder.node import record
+
+if __name__ == '__main__':
+    try:
+        record()
+    except rospy.ROSInterruptException:
+        pass
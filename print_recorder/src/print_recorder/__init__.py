@@ -0,0 +1,16 @@
+"""Recording, replay and analysis of print runs.
+
+Names are imported on first access, so e.g. the numpy only print_recorder.analytics
+can be used without pulling in rospy and the messages.
+"""
+import importlib
+
+_EXPORTS = {"Replay": "replay", "STREAM_TYPES": "trace", "Trace": "trace", "TraceWriter": "trace"}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    raise AttributeError(f"module {__name__} has no attribute {name}")
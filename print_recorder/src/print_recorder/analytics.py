@@ -0,0 +1,268 @@
+"""Scores of an executed run against the reference paths.
+
+    mir = ReferencePath(mir_positions[:, :2])       # e.g. /mir_path_original
+    ur = ReferencePath(ur_positions)                # /ur_path_original, 3d
+    report = analyze(Trace(directory), mir, ur)
+    report.summary["ur_cross_track_p95"], report.layers
+
+All samples are projected at once: a kd-tree over the midpoints of short pieces of
+the distinct segments gives k candidates per sample, the projection onto them is
+vectorized in blocks. Samples where the candidates cannot prove the nearest segment
+get more candidates and at last all segments, so the result is exact.
+"""
+from collections import namedtuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# per sample arrays: segment index, position t in [0, 1] on it, arc length and distance to the path
+Projection = namedtuple("Projection", ["segment", "t", "arc_length", "distance"])
+
+Report = namedtuple("Report", ["summary", "layers", "samples"])
+
+LAYER_COLUMNS = ("layer", "z", "duration", "ur_samples", "ur_error_mean", "ur_error_p95", "ur_error_max",
+                 "speed_mean", "speed_cv", "mir_error_mean", "mir_error_max", "sync_lag_mean", "sync_lag_max")
+
+
+class ReferencePath:
+    """Polyline (2d or 3d) with vectorized nearest segment projection.
+
+    Paths that repeat themselves (the MiR drives the same round for every layer) are
+    projected onto their distinct segments, a progress hint picks the round.
+    """
+
+    def __init__(self, points, candidates=8, block_size=1 << 16):
+        points = np.asarray(points, dtype=float)
+        self.points = points
+        self.starts = points[:-1]
+        self.deltas = np.diff(points, axis=0)
+        self.lengths = np.linalg.norm(self.deltas, axis=1)
+        self.arc_length = np.concatenate(([0.0], np.cumsum(self.lengths)))
+        self.block_size = block_size
+
+        # distinct segments and their copies, grouped and in path order
+        geometry, self.distinct = np.unique(np.hstack((self.starts, self.deltas)), axis=0, return_inverse=True)
+        self.distinct = self.distinct.ravel()
+        dim = points.shape[1]
+        self.distinct_starts, self.distinct_deltas = geometry[:, :dim], geometry[:, dim:]
+        self.distinct_lengths = lengths = np.linalg.norm(self.distinct_deltas, axis=1)
+        length_sq = lengths ** 2
+        self.inv_length_sq = np.divide(1.0, length_sq, out=np.zeros_like(length_sq), where=length_sq > 0.0)
+        self.copies = np.argsort(self.distinct, kind="stable")
+        self.first_copy = np.searchsorted(self.distinct[self.copies], np.arange(len(geometry) + 1))
+        # copies are in path order, so their arc length grows within a group: offset by group to search all at once
+        self.copy_arc_length = self.arc_length[self.copies]
+        self.group_span = self.arc_length[-1] + 1.0
+        self.copy_keys = self.copy_arc_length + self.distinct[self.copies] * self.group_span
+
+        # long segments (travel, layer changes) are split into pieces of at most piece_length,
+        # every point of a segment is then within piece_length / 2 of one of its piece midpoints
+        self.piece_length = max(float(np.median(lengths)), lengths.sum() / (4 * len(lengths)), 1e-9)
+        pieces = np.maximum(np.ceil(lengths / self.piece_length), 1).astype(int)
+        self.piece_segment = np.repeat(np.arange(len(lengths)), pieces)
+        first_piece = np.cumsum(pieces) - pieces
+        piece_t = (np.arange(len(self.piece_segment)) - first_piece[self.piece_segment] + 0.5) / pieces[self.piece_segment]
+        self.tree = cKDTree(self.distinct_starts[self.piece_segment] + piece_t[:, None] * self.distinct_deltas[self.piece_segment])
+        self.candidates = min(candidates, len(self.piece_segment))
+
+    @property
+    def length(self):
+        return self.arc_length[-1]
+
+    def _copy(self, distinct, t, hint):
+        # copy of the distinct segments whose arc length is nearest the hint, any shape
+        first, last = self.first_copy[distinct], self.first_copy[distinct + 1] - 1
+        at = self.copy_arc_length
+        target = hint - t * self.distinct_lengths[distinct]
+        after = np.clip(np.searchsorted(self.copy_keys, target + distinct * self.group_span), first, last)
+        before = np.maximum(after - 1, first)
+        return self.copies[np.where(np.abs(at[before] - target) < np.abs(at[after] - target), before, after)]
+
+    def _project_onto(self, samples, segments, hint, tolerance):
+        # samples (n, d), distinct segments (n, k) -> (segment of the path, t, squared distance to the path) per sample
+        rel = samples[:, None, :] - self.distinct_starts[segments]
+        deltas = self.distinct_deltas[segments]
+        t = np.clip(np.einsum("nkd,nkd->nk", rel, deltas) * self.inv_length_sq[segments], 0.0, 1.0)
+        offset = rel - t[..., None] * deltas
+        dist_sq = np.einsum("nkd,nkd->nk", offset, offset)
+        rows = np.arange(len(samples))
+        nearest = np.argmin(dist_sq, axis=1)
+        if hint is None:
+            return self.copies[self.first_copy[segments[rows, nearest]]], t[rows, nearest], dist_sq[rows, nearest]
+        # where the path overlaps itself, the segment within the tolerance that is nearest the hint
+        copies = self._copy(segments, t, hint[:, None])
+        deviation = np.abs(self.arc_length[copies] + t * self.lengths[copies] - hint[:, None])
+        limit = (np.sqrt(dist_sq[rows, nearest]) + tolerance) ** 2
+        best = np.argmin(np.where(dist_sq <= limit[:, None], deviation, np.inf), axis=1)
+        return copies[rows, best], t[rows, best], dist_sq[rows, nearest]
+
+    def _project_candidates(self, samples, hint, tolerance, k):
+        piece_distance, pieces = self.tree.query(samples, k=k)
+        if k == 1:
+            piece_distance, pieces = piece_distance[:, None], pieces[:, None]
+        segment, t, dist_sq = self._project_onto(samples, self.piece_segment[pieces], hint, tolerance)
+        # a segment that is not a candidate has all its piece midpoints beyond the k-th one,
+        # so it is at least that far minus half a piece away
+        margin = 0.5 * self.piece_length + (tolerance if hint is not None else 0.0)
+        proven = np.sqrt(dist_sq) <= piece_distance[:, -1] - margin
+        return segment, t, dist_sq, proven
+
+    def _project_block(self, samples, hint, tolerance):
+        segment, t, dist_sq, proven = self._project_candidates(samples, hint, tolerance, self.candidates)
+        unproven = np.flatnonzero(~proven)
+        n_pieces = len(self.piece_segment)
+        k = self.candidates
+        # dense regions (path running back next to itself): more candidates for the few unproven samples
+        while len(unproven) and 8 * k < n_pieces and len(unproven) * 8 * k <= (1 << 24):
+            k *= 8
+            segment[unproven], t[unproven], dist_sq[unproven], proven = self._project_candidates(
+                samples[unproven], None if hint is None else hint[unproven], tolerance, k)
+            unproven = unproven[~proven]
+        if len(unproven) and self.candidates < n_pieces:
+            all_segments = np.arange(len(self.distinct_starts))
+            # bounded memory: rows * segments elements per step
+            step = max(1, (1 << 22) // len(all_segments))
+            for first in range(0, len(unproven), step):
+                rows = unproven[first:first + step]
+                exact = self._project_onto(samples[rows], np.broadcast_to(all_segments, (len(rows), len(all_segments))),
+                                           None if hint is None else hint[rows], tolerance)
+                segment[rows], t[rows], dist_sq[rows] = exact
+        return segment, t, dist_sq
+
+    def project(self, samples, hint=None, tolerance=0.05):
+        """Projection of samples (n, d) onto the path, d as the path.
+
+        hint: expected arc length per sample, picks among the segments within tolerance
+        of the nearest one (repeated rounds), default the first one. distance is always
+        the distance to the nearest segment.
+        """
+        samples = np.asarray(samples, dtype=float)[:, :self.points.shape[1]]
+        hint = None if hint is None else np.asarray(hint, dtype=float)
+        segment = np.zeros(len(samples), dtype=int)
+        t = np.zeros(len(samples))
+        dist_sq = np.zeros(len(samples))
+        for first in range(0, len(samples), self.block_size):
+            block = slice(first, first + self.block_size)
+            segment[block], t[block], dist_sq[block] = self._project_block(samples[block], None if hint is None else hint[block], tolerance)
+        arc_length = self.arc_length[segment] + t * self.lengths[segment]
+        return Projection(segment, t, arc_length, np.sqrt(dist_sq))
+
+
+def layer_starts(points, min_step=1e-4):
+    """First point of every layer of a 3d path, like parse_path.layers.detect_layers on its z."""
+    z = np.asarray(points, dtype=float)[:, 2]
+    return np.concatenate(([0], np.flatnonzero(np.abs(np.diff(z)) > min_step) + 1))
+
+
+def path_speed(times, arc_length, window=0.1):
+    """Speed along the path, ds/dt over at least window seconds (sample times are jittery)."""
+    times = np.asarray(times, dtype=float)
+    if len(times) < 2:
+        return np.zeros(len(times))
+    # central difference between the samples window/2 before and after
+    before = np.clip(np.searchsorted(times, times - 0.5 * window), 0, len(times) - 1)
+    after = np.clip(np.searchsorted(times, times + 0.5 * window), 0, len(times) - 1)
+    dt = times[after] - times[before]
+    return np.divide(arc_length[after] - arc_length[before], dt, out=np.zeros(len(times)), where=dt > 0)
+
+
+def monotone(values):
+    # printed progress never goes back, projection noise at crossings would
+    return np.maximum.accumulate(values)
+
+
+def sync_lag(mir_times, mir_progress, ur_times, ur_progress, mir_length):
+    """(lag in m along the MiR path, lag in s) of the UR behind the MiR, at the UR sample times.
+
+    Progress is the normalized arc length (0..1) of each robot on its own path, like
+    the PathSynchronizer of the MiR follower uses it.
+    """
+    mir_progress = monotone(mir_progress)
+    mir_at_ur = np.interp(ur_times, mir_times, mir_progress)
+    lag_m = (mir_at_ur - ur_progress) * mir_length
+    # when did the MiR have the progress the UR has now
+    reached, first = np.unique(mir_progress, return_index=True)
+    lag_s = ur_times - np.interp(ur_progress, reached, mir_times[first])
+    return lag_m, lag_s
+
+
+def _stats(values, prefix, summary):
+    values = np.asarray(values)
+    if len(values) == 0:
+        values = np.zeros(1)
+    summary[prefix + "_mean"] = float(np.mean(values))
+    summary[prefix + "_p95"] = float(np.percentile(values, 95))
+    summary[prefix + "_max"] = float(np.max(values))
+
+
+def _cv(values):
+    mean = np.mean(values) if len(values) else 0.0
+    return float(np.std(values) / mean) if mean > 0 else 0.0
+
+
+def analyze(trace, mir_reference, ur_reference, min_speed=0.005, speed_window=0.1, layer_step=1e-4):
+    """Report of a recorded run (print_recorder.Trace with mir_pose and ur_pose streams).
+
+    min_speed: samples slower than this along the UR path do not count as printing
+    for the speed uniformity (start, stops, layer changes).
+    """
+    ur = trace["ur_pose"]
+    ur_times = np.asarray(ur["t"])
+    ur_projection = ur_reference.project(np.column_stack((ur["x"], ur["y"], ur["z"])))
+    ur_progress = monotone(ur_projection.arc_length)
+    speed = path_speed(ur_times, ur_progress, speed_window)
+    printing = speed > min_speed
+
+    mir = trace["mir_pose"]
+    mir_times = np.asarray(mir["t"])
+    # the MiR path repeats per layer: the round the MiR is in follows from the progress of the UR
+    hint = np.interp(mir_times, ur_times, ur_progress / ur_reference.length) * mir_reference.length if len(ur_times) else None
+    mir_projection = mir_reference.project(np.column_stack((mir["x"], mir["y"])), hint)
+
+    lag_m, lag_s = sync_lag(mir_times, mir_projection.arc_length / mir_reference.length,
+                            ur_times, ur_progress / ur_reference.length, mir_reference.length)
+
+    start, end = trace.time_range()
+    summary = {"duration": end - start, "mir_samples": len(mir_times), "ur_samples": len(ur_times),
+               "ur_completion": float(ur_progress[-1] / ur_reference.length) if len(ur_times) else 0.0}
+    _stats(mir_projection.distance, "mir_cross_track", summary)
+    _stats(ur_projection.distance, "ur_cross_track", summary)
+    summary["speed_mean"] = float(np.mean(speed[printing])) if printing.any() else 0.0
+    summary["speed_cv"] = _cv(speed[printing])
+    _stats(np.abs(lag_m), "sync_lag_m", summary)
+    _stats(np.abs(lag_s), "sync_lag_s", summary)
+
+    # layers of the reference, samples belong to the layer of their projection
+    starts = layer_starts(ur_reference.points, layer_step)
+    ur_layer = np.searchsorted(starts, ur_projection.segment, side="right") - 1
+    # the MiR is in the layer the UR prints at that time
+    mir_layer = ur_layer[np.clip(np.searchsorted(ur_times, mir_times), 0, len(ur_times) - 1)] if len(ur_times) else \
+        np.zeros(len(mir_times), dtype=int)
+
+    layers = []
+    for layer, start in enumerate(starts):
+        in_layer = ur_layer == layer
+        if not in_layer.any():
+            continue
+        layer_times = ur_times[in_layer]
+        layer_speed = speed[in_layer & printing]
+        mir_error = mir_projection.distance[mir_layer == layer]
+        layer_lag = np.abs(lag_m[in_layer])
+        ur_error = ur_projection.distance[in_layer]
+        layers.append((layer, float(ur_reference.points[start, 2]), float(layer_times[-1] - layer_times[0]), int(in_layer.sum()),
+                       float(ur_error.mean()), float(np.percentile(ur_error, 95)), float(ur_error.max()),
+                       float(layer_speed.mean()) if len(layer_speed) else 0.0, _cv(layer_speed),
+                       float(mir_error.mean()) if len(mir_error) else 0.0, float(mir_error.max()) if len(mir_error) else 0.0,
+                       float(layer_lag.mean()), float(layer_lag.max())))
+
+    samples = {"mir_t": mir_times, "mir_cross_track": mir_projection.distance, "mir_arc_length": mir_projection.arc_length,
+               "ur_t": ur_times, "ur_cross_track": ur_projection.distance, "ur_arc_length": ur_projection.arc_length,
+               "ur_speed": speed, "ur_layer": ur_layer, "sync_lag_m": lag_m, "sync_lag_s": lag_s}
+    return Report(summary, layers, samples)
+
+
+def format_table(rows, columns=LAYER_COLUMNS):
+    lines = ["  ".join(f"{name:>14}" for name in columns)]
+    for row in rows:
+        lines.append("  ".join(f"{value:>14d}" if isinstance(value, int) else f"{value:>14.6g}" for value in row))
+    return "\n".join(lines)
@@ -0,0 +1,69 @@
+import datetime
+import os
+
+import rospy
+
+from print_recorder.replay import Replay
+from print_recorder.trace import STREAM_TYPES, Trace, TraceWriter
+
+# stream: (topic parameter, default topic, message type), the topics the nodes of this repo use.
+# The follower topics are relative, the recorder runs in the namespace of the robot it records.
+STREAMS = {
+    "mir_pose": ("~mir_pose_topic", "/mur620a/mir_pose_simple", "Pose"),
+    "ur_pose": ("~ur_pose_topic", "/mur620a/UR10_r/global_tcp_pose", "PoseStamped"),
+    "cmd_vel": ("~cmd_vel_topic", "/mur620a/mobile_base_controller/cmd_vel", "Twist"),
+    "trajectory_index": ("~trajectory_index_topic", "trajectory_index", "Int32"),
+    "ur_cmd_vel_local": ("~ur_cmd_vel_local_topic", "ur_vel_induced_by_mir/ur_cmd_vel_local", "Twist"),
+    "ur_twist_debug": ("~ur_twist_debug_topic", "ur_twist_debug", "TwistStamped"),
+}
+
+
+def default_trace_dir():
+    ros_home = os.environ.get("ROS_HOME", os.path.expanduser("~/.ros"))
+    return os.path.join(ros_home, "traces", datetime.datetime.now().strftime("%Y%m%d-%H%M%S"))
+
+
+def record():
+    rospy.init_node("trace_recorder")
+    directory = rospy.get_param("~output_dir", "") or default_trace_dir()
+    # resolved names in meta.json, a relative topic only means something together with the namespace of the recorder
+    streams = {name: (rospy.resolve_name(rospy.get_param(param, topic)), type_name)
+               for name, (param, topic, type_name) in STREAMS.items()}
+    writer = TraceWriter(directory, streams, rospy.get_param("~chunk_size", 4096))
+
+    def callback(msg, stream):
+        writer.append_msg(stream, rospy.get_time(), msg)
+
+    for name, (topic, type_name) in streams.items():
+        rospy.Subscriber(topic, STREAM_TYPES[type_name].msg_class, callback, callback_args=name, queue_size=100)
+
+    def close():
+        writer.close()
+        rospy.loginfo(f"Trace written to {directory}: " + ", ".join(f"{name} {count}" for name, count in writer.counts.items()))
+
+    rospy.on_shutdown(close)
+    rospy.loginfo(f"Recording to {directory}")
+    rospy.spin()
+
+
+def replay_topic(prefix, topic):
+    """topic below prefix, e.g. /replay + /mur620a/ur_twist_debug -> /replay/mur620a/ur_twist_debug."""
+    if not prefix:
+        return topic
+    return prefix.rstrip("/") + "/" + topic.lstrip("/")
+
+
+def replay():
+    rospy.init_node("trace_replay")
+    trace = Trace(rospy.get_param("~trace_dir"))
+    streams = rospy.get_param("~streams", []) or trace.streams
+    # e.g. /replay, so the replay does not mix with a running system
+    prefix = rospy.get_param("~topic_prefix", "")
+    publishers = {stream: rospy.Publisher(replay_topic(prefix, trace.topic(stream)), STREAM_TYPES[trace.meta[stream]["type"]].msg_class,
+                                          queue_size=100) for stream in streams if stream in trace}
+
+    replay = Replay(trace, list(publishers))
+    speed = rospy.get_param("~speed", 1.0)
+    rospy.loginfo(f"Replaying {len(replay)} messages at speed {speed}")
+    count = replay.run(lambda stream, msg: publishers[stream].publish(msg), speed, rospy.is_shutdown)
+    rospy.loginfo(f"Replayed {count} messages")
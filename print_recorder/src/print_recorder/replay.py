@@ -0,0 +1,71 @@
+"""Replay of a recorded trace in receive order, in real time, scaled or as fast as possible."""
+import time
+
+import numpy as np
+
+
+class Replay:
+    """Messages of the given streams of a trace (default all), ordered by receive time."""
+
+    def __init__(self, trace, streams=None, start=None, end=None):
+        self.trace = trace
+        self.streams = [stream for stream in (streams or trace.streams) if stream in trace]
+        times, stream_ids, rows = [], [], []
+        for i, stream in enumerate(self.streams):
+            t = np.asarray(trace[stream]["t"])
+            times.append(t)
+            stream_ids.append(np.full(len(t), i))
+            rows.append(np.arange(len(t)))
+        times = np.concatenate(times) if times else np.zeros(0)
+        order = np.argsort(times, kind="stable")
+        self.times = times[order]
+        self.stream_ids = np.concatenate(stream_ids)[order] if stream_ids else np.zeros(0, dtype=int)
+        self.rows = np.concatenate(rows)[order] if rows else np.zeros(0, dtype=int)
+        first = np.searchsorted(self.times, start) if start is not None else 0
+        last = np.searchsorted(self.times, end, side="right") if end is not None else len(self.times)
+        self.times, self.stream_ids, self.rows = self.times[first:last], self.stream_ids[first:last], self.rows[first:last]
+        # row major tables, one row per message without t
+        self.tables = [trace.table(stream)[:, 1:] for stream in self.streams]
+
+    def __len__(self):
+        return len(self.times)
+
+    def __iter__(self):
+        """(t, stream, msg) in receive order."""
+        for t, stream_id, row in zip(self.times.tolist(), self.stream_ids.tolist(), self.rows.tolist()):
+            yield t, self.streams[stream_id], self.trace.message(self.streams[stream_id], self.tables[stream_id][row].tolist())
+
+    def run(self, publish, speed=1.0, is_shutdown=lambda: False):
+        """publish(stream, msg) every message, speed times faster than recorded, speed <= 0: no waiting."""
+        if not len(self):
+            return 0
+        wall_start = time.monotonic()
+        t0 = self.times[0]
+        count = 0
+        for t, stream, msg in self:
+            if is_shutdown():
+                break
+            if speed > 0:
+                delay = (t - t0) / speed - (time.monotonic() - wall_start)
+                if delay > 0:
+                    time.sleep(delay)
+            publish(stream, msg)
+            count += 1
+        return count
+
+    def drive(self, bus, topics=None):
+        """Publish into a print_sim SimBus, advancing its clock to every receive time.
+
+        The timers of the nodes on the bus (e.g. the control loop of the MiR follower)
+        run in between, like they did during the recording. topics: {stream: topic},
+        default the recorded topics.
+        """
+        topics = topics or {}
+        publishers = {stream: bus.publisher(topics.get(stream, self.trace.topic(stream)), None) for stream in self.streams}
+        offset = self.times[0] - bus.time if len(self) else 0.0
+        for t, stream, msg in self:
+            dt = t - offset - bus.time
+            if dt > 0:
+                bus.advance(dt)
+            publishers[stream].publish(msg)
+        return len(self)
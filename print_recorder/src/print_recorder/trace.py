@@ -0,0 +1,207 @@
+"""Columnar execution traces: one append only float64 file per stream column.
+
+A trace is a directory:
+
+    meta.json                       streams with their topic, message type and columns
+    <stream>.<column>.f8            little endian float64, one value per received message
+
+Every stream has the receive time "t" (ROS time in s) as first column. Messages are
+written into a preallocated column major chunk, a full chunk is handed to a writer
+thread that appends each column to its file. Reading memory maps the column files,
+a column of a 2 h print is one array without parsing anything.
+"""
+import json
+import os
+import queue
+import threading
+from collections import namedtuple
+
+import numpy as np
+import rospy
+from geometry_msgs.msg import Pose, PoseStamped, Twist, TwistStamped
+from std_msgs.msg import Int32
+
+# values(msg) -> tuple of the columns after t, message(row) builds the message back
+StreamType = namedtuple("StreamType", ["msg_class", "columns", "values", "message"])
+
+POSE_COLUMNS = ("x", "y", "z", "qx", "qy", "qz", "qw")
+TWIST_COLUMNS = ("vx", "vy", "vz", "wx", "wy", "wz")
+
+
+def _twist_values(twist):
+    return (twist.linear.x, twist.linear.y, twist.linear.z, twist.angular.x, twist.angular.y, twist.angular.z)
+
+
+def _twist(row, twist=None):
+    twist = twist or Twist()
+    twist.linear.x, twist.linear.y, twist.linear.z, twist.angular.x, twist.angular.y, twist.angular.z = row[:6]
+    return twist
+
+
+def _pose_values(msg):
+    p, q = msg.position, msg.orientation
+    return (p.x, p.y, p.z, q.x, q.y, q.z, q.w)
+
+
+def _pose(row):
+    msg = Pose()
+    p, q = msg.position, msg.orientation
+    p.x, p.y, p.z, q.x, q.y, q.z, q.w = row
+    return msg
+
+
+def _pose_stamped_values(msg):
+    return (msg.header.stamp.to_sec(),) + _pose_values(msg.pose)
+
+
+def _pose_stamped(row):
+    msg = PoseStamped()
+    msg.header.stamp = rospy.Time.from_sec(row[0])
+    msg.pose = _pose(row[1:])
+    return msg
+
+
+def _twist_stamped_values(msg):
+    return (msg.header.stamp.to_sec(),) + _twist_values(msg.twist)
+
+
+def _twist_stamped(row):
+    msg = TwistStamped()
+    msg.header.stamp = rospy.Time.from_sec(row[0])
+    _twist(row[1:], msg.twist)
+    return msg
+
+
+STREAM_TYPES = {
+    "Pose": StreamType(Pose, POSE_COLUMNS, _pose_values, _pose),
+    "PoseStamped": StreamType(PoseStamped, ("stamp",) + POSE_COLUMNS, _pose_stamped_values, _pose_stamped),
+    "Twist": StreamType(Twist, TWIST_COLUMNS, _twist_values, _twist),
+    "TwistStamped": StreamType(TwistStamped, ("stamp",) + TWIST_COLUMNS, _twist_stamped_values, _twist_stamped),
+    "Int32": StreamType(Int32, ("data",), lambda msg: (msg.data,), lambda row: Int32(int(row[0]))),
+}
+
+
+def column_file(directory, stream, column):
+    return os.path.join(directory, f"{stream}.{column}.f8")
+
+
+class _Chunk:
+    __slots__ = ("data", "count")
+
+    def __init__(self, n_columns, size):
+        self.data = np.empty((n_columns, size))
+        self.count = 0
+
+
+class TraceWriter:
+    """Buffered appends of messages to a trace directory.
+
+    streams: {name: (topic, type name of STREAM_TYPES)}. append() of one stream must
+    always come from the same thread (one subscriber callback per stream).
+    """
+
+    def __init__(self, directory, streams, chunk_size=4096):
+        self.directory = directory
+        self.streams = dict(streams)
+        self.chunk_size = chunk_size
+        self.columns = {name: ("t",) + STREAM_TYPES[type_name].columns for name, (_, type_name) in self.streams.items()}
+        self.chunks = {name: _Chunk(len(columns), chunk_size) for name, columns in self.columns.items()}
+        self.counts = dict.fromkeys(self.streams, 0)
+
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "meta.json"), "w") as f:
+            json.dump({"streams": {name: {"topic": topic, "type": type_name, "columns": list(self.columns[name])}
+                                   for name, (topic, type_name) in self.streams.items()}}, f, indent=2)
+        self.files = {name: [open(column_file(directory, name, column), "ab") for column in columns]
+                      for name, columns in self.columns.items()}
+
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._write_loop, name="trace_writer", daemon=True)
+        self.thread.start()
+
+    def append(self, stream, t, values):
+        chunk = self.chunks[stream]
+        column = chunk.data[:, chunk.count]
+        column[0] = t
+        column[1:] = values
+        chunk.count += 1
+        self.counts[stream] += 1
+        if chunk.count == self.chunk_size:
+            self.queue.put((stream, chunk))
+            self.chunks[stream] = _Chunk(chunk.data.shape[0], self.chunk_size)
+
+    def append_msg(self, stream, t, msg):
+        self.append(stream, t, STREAM_TYPES[self.streams[stream][1]].values(msg))
+
+    def _write_loop(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            stream, chunk = item
+            for f, values in zip(self.files[stream], chunk.data[:, :chunk.count]):
+                f.write(values.tobytes())
+            for f in self.files[stream]:
+                f.flush()
+
+    def close(self):
+        """Write the partial chunks and wait for the writer thread."""
+        for stream, chunk in self.chunks.items():
+            if chunk.count:
+                self.queue.put((stream, chunk))
+            self.chunks[stream] = _Chunk(chunk.data.shape[0], self.chunk_size)
+        self.queue.put(None)
+        self.thread.join()
+        for files in self.files.values():
+            for f in files:
+                f.close()
+
+
+class Trace:
+    """Read access to a trace directory: trace["cmd_vel"]["vx"] is a memory mapped column."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json")) as f:
+            self.meta = json.load(f)["streams"]
+        self._columns = {}
+
+    @property
+    def streams(self):
+        return list(self.meta)
+
+    def topic(self, stream):
+        return self.meta[stream]["topic"]
+
+    def __contains__(self, stream):
+        return stream in self.meta
+
+    def __getitem__(self, stream):
+        if stream not in self._columns:
+            columns = {}
+            for column in self.meta[stream]["columns"]:
+                filename = column_file(self.directory, stream, column)
+                size = os.path.getsize(filename) // 8
+                columns[column] = np.memmap(filename, dtype="<f8", mode="r", shape=(size,)) if size else np.zeros(0)
+            # an interrupted write can leave the columns of the last chunk at different lengths
+            length = min(len(values) for values in columns.values())
+            self._columns[stream] = {column: values[:length] for column, values in columns.items()}
+        return self._columns[stream]
+
+    def __len__(self):
+        return sum(len(self[stream]["t"]) for stream in self.meta)
+
+    def table(self, stream):
+        """(n, n_columns) array of a stream, columns as in meta["columns"]."""
+        columns = self[stream]
+        return np.column_stack([columns[column] for column in self.meta[stream]["columns"]])
+
+    def message(self, stream, row):
+        # row without t
+        return STREAM_TYPES[self.meta[stream]["type"]].message(row)
+
+    def time_range(self):
+        times = [self[stream]["t"] for stream in self.meta if len(self[stream]["t"])]
+        if not times:
+            return 0.0, 0.0
+        return min(t[0] for t in times), max(t[-1] for t in times)
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from print_recorder.analytics import ReferencePath  # noqa: E402
+
+
+def brute_force(points, samples):
+    # distance of every sample to every segment
+    starts, deltas = points[:-1], np.diff(points, axis=0)
+    rel = samples[:, None, :] - starts
+    length_sq = np.einsum("kd,kd->k", deltas, deltas)
+    t = np.clip(np.einsum("nkd,kd->nk", rel, deltas) / np.where(length_sq > 0.0, length_sq, 1.0), 0.0, 1.0)
+    return np.linalg.norm(rel - t[..., None] * deltas, axis=2)
+
+
+def rounds(n_rounds, points_per_round, layer_height=0.0):
+    angle = np.linspace(0.0, 2.0 * np.pi, points_per_round, endpoint=False)
+    radius = 1.0 + 0.3 * np.sin(5.0 * angle)
+    layer = np.column_stack((radius * np.cos(angle), radius * np.sin(angle), np.zeros(points_per_round)))
+    return np.concatenate([layer + (0.0, 0.0, i * layer_height) for i in range(n_rounds)])
+
+
+def check_exact(points, samples, **kwargs):
+    path = ReferencePath(points, **kwargs)
+    projection = path.project(samples)
+    distances = brute_force(points, samples[:, :points.shape[1]])
+    np.testing.assert_allclose(projection.distance, distances.min(axis=1), atol=1e-12)
+    # the reported segment and t give a point at that distance
+    on_path = path.starts[projection.segment] + projection.t[:, None] * path.deltas[projection.segment]
+    np.testing.assert_allclose(np.linalg.norm(samples[:, :points.shape[1]] - on_path, axis=1), projection.distance, atol=1e-12)
+    np.testing.assert_allclose(projection.arc_length, path.arc_length[projection.segment] + projection.t * path.lengths[projection.segment])
+    return path, projection
+
+
+def test_project_3d():
+    rng = np.random.default_rng(8)
+    points = rounds(6, 300, layer_height=0.01)
+    # close to the path, far away and between the layers
+    samples = np.concatenate((points[rng.integers(0, len(points), 500)] + rng.normal(scale=0.01, size=(500, 3)),
+                              rng.uniform(-3.0, 3.0, size=(200, 3))))
+    check_exact(points, samples)
+    # tiny blocks and a single candidate force the fallbacks
+    check_exact(points, samples, candidates=1, block_size=64)
+
+
+def test_project_travel_segments():
+    rng = np.random.default_rng(9)
+    # dense contour with a long travel move to a second one
+    points = np.concatenate((rounds(1, 400)[:, :2], rounds(1, 400)[:, :2] + (10.0, 0.0)))
+    samples = np.column_stack((rng.uniform(-2.0, 12.0, 1000), rng.uniform(-2.0, 2.0, 1000)))
+    check_exact(points, samples)
+
+
+def test_project_repeated_rounds():
+    # the MiR drives the same round three times, the hint picks the round
+    points = rounds(3, 200)[:, :2]
+    samples = points[[50, 250, 450]] + 0.001
+    path, projection = check_exact(points, samples)
+    round_length = path.arc_length[200]
+    assert (projection.arc_length < round_length).all()
+    hinted = path.project(samples, hint=projection.arc_length + np.arange(3) * round_length)
+    np.testing.assert_allclose(hinted.arc_length, projection.arc_length + np.arange(3) * round_length, atol=1e-9)
+    np.testing.assert_allclose(hinted.distance, projection.distance)
@@ -0,0 +1,70 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("rospy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from geometry_msgs.msg import Twist  # noqa: E402
+
+from print_recorder.trace import POSE_COLUMNS, TWIST_COLUMNS, Trace, TraceWriter, column_file  # noqa: E402
+
+STREAMS = {"cmd_vel": ("/mur620a/cmd_vel", "Twist"), "mir_pose": ("/mur620a/mir_pose", "Pose"),
+           "index": ("/trajectory_index", "Int32")}
+
+
+def record(directory, n, chunk_size=16):
+    writer = TraceWriter(str(directory), STREAMS, chunk_size)
+    for i in range(n):
+        twist = Twist()
+        twist.linear.x, twist.angular.z = 0.01 * i, -0.001 * i
+        writer.append_msg("cmd_vel", 100.0 + 0.1 * i, twist)
+        writer.append("mir_pose", 100.0 + 0.1 * i, (i, 2.0 * i, 0.0, 0.0, 0.0, 0.0, 1.0))
+        if i % 3 == 0:
+            writer.append("index", 100.0 + 0.1 * i, (i // 3,))
+    writer.close()
+    return writer
+
+
+def test_round_trip(tmp_path):
+    # 50 rows: three full chunks and a partial one written on close
+    writer = record(tmp_path, 50)
+    assert writer.counts == {"cmd_vel": 50, "mir_pose": 50, "index": 17}
+
+    trace = Trace(str(tmp_path))
+    assert trace.streams == list(STREAMS) and trace.topic("cmd_vel") == "/mur620a/cmd_vel"
+    assert len(trace) == 117
+    np.testing.assert_allclose(trace["cmd_vel"]["t"], 100.0 + 0.1 * np.arange(50))
+    np.testing.assert_allclose(trace["cmd_vel"]["vx"], 0.01 * np.arange(50))
+    np.testing.assert_allclose(trace["cmd_vel"]["wz"], -0.001 * np.arange(50))
+    np.testing.assert_array_equal(trace["index"]["data"], np.arange(17))
+    assert trace.table("mir_pose").shape == (50, 1 + len(POSE_COLUMNS))
+    assert trace.time_range() == (100.0, trace["cmd_vel"]["t"][-1])
+
+    twist = trace.message("cmd_vel", trace.table("cmd_vel")[7, 1:])
+    assert (twist.linear.x, twist.angular.z) == (0.07, -0.007)
+    pose = trace.message("mir_pose", trace.table("mir_pose")[3, 1:])
+    assert (pose.position.x, pose.position.y, pose.orientation.w) == (3.0, 6.0, 1.0)
+
+
+def test_truncated_last_chunk(tmp_path):
+    record(tmp_path, 40)
+    # the writer died while appending the last chunk: later columns are shorter, one value is cut in half
+    for column in TWIST_COLUMNS[3:]:
+        filename = column_file(str(tmp_path), "cmd_vel", column)
+        with open(filename, "r+b") as f:
+            f.truncate(os.path.getsize(filename) - 8 * 5 - 3)
+    trace = Trace(str(tmp_path))
+    columns = trace["cmd_vel"]
+    assert all(len(values) == 34 for values in columns.values())
+    np.testing.assert_allclose(columns["vx"], 0.01 * np.arange(34))
+    np.testing.assert_allclose(columns["wz"], -0.001 * np.arange(34))
+    assert len(trace["mir_pose"]["t"]) == 40
+
+
+def test_empty_stream(tmp_path):
+    TraceWriter(str(tmp_path), STREAMS).close()
+    trace = Trace(str(tmp_path))
+    assert len(trace) == 0 and trace.time_range() == (0.0, 0.0)
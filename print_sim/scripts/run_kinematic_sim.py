@@ -0,0 +1,51 @@
+#! /usr/bin/env python3
+"""Run the MiR follower and the UR compensation in the headless kinematic simulation.
+
+    run_kinematic_sim.py --set follower.Kp=1.2 --set follower.Kw=2.0 --max-time 120
+    run_kinematic_sim.py --geometry 0.2 1.0 0.05 0.3 --set follower.max_velocity=0.3
+                                        curvature speed limits published with the path
+"""
+import argparse
+import json
+
+from print_sim.kinematic_sim import load_mir_path, simulate
+
+
+def parse_value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path-file", help="MiR path store, default the one of parse_mir_path")
+    parser.add_argument("--simplify-tolerance", type=float, default=0.005)
+    parser.add_argument("--max-time", type=float, help="simulated seconds, default 3x the nominal duration")
+    parser.add_argument("--no-compensation", action="store_true", help="do not run the UR compensation node")
+    parser.add_argument("--geometry", type=float, nargs=4, metavar=("LOOKAHEAD", "VMAX", "A_LAT", "W_MAX"),
+                        help="publish the path geometry of parse_path with these parameters")
+    parser.add_argument("--set", action="append", default=[], metavar="NODE.PARAM=VALUE",
+                        help="private parameter of the follower or compensation node")
+    parser.add_argument("--json", action="store_true", help="print the result as json")
+    args = parser.parse_args()
+
+    params = {"follower": {}, "compensation": {}}
+    for assignment in args.set:
+        name, value = assignment.split("=", 1)
+        node, param = name.split(".", 1)
+        params[node][param] = parse_value(value)
+
+    result = simulate(load_mir_path(args.path_file, args.simplify_tolerance), args.max_time,
+                      follower_params=params["follower"], compensation_params=params["compensation"],
+                      compensation=not args.no_compensation, geometry=args.geometry)
+    if args.json:
+        print(json.dumps(result._asdict()))
+    else:
+        for key, value in result._asdict().items():
+            print(f"{key:18s} {value}")
+
+
+if __name__ == "__main__":
+    main()
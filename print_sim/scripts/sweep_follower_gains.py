@@ -0,0 +1,70 @@
+#! /usr/bin/env python3
+"""Sweep MiR follower parameters on the kinematic simulation and print the Pareto front
+of total print time against maximum path deviation.
+
+    sweep_follower_gains.py --grid Kp=0.8,1.0,1.2 --grid Kw=1,2,4 --grid distance_threshold=0.1,0.15
+    sweep_follower_gains.py --range Kp=0.5:2 --range max_velocity=0.1:0.3 --samples 200 --points 500
+"""
+import argparse
+import json
+import sys
+
+from print_sim.gain_sweep import ResultCache, grid, pareto_front, random_samples, sweep
+from print_sim.kinematic_sim import load_mir_path
+
+
+def parse_grid(specs):
+    return {name: [json.loads(v) for v in values.split(",")] for name, values in (s.split("=", 1) for s in specs)}
+
+
+def parse_ranges(specs):
+    return {name: tuple(float(v) for v in bounds.split(":")) for name, bounds in (s.split("=", 1) for s in specs)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--grid", action="append", default=[], metavar="PARAM=V1,V2,...")
+    parser.add_argument("--range", action="append", default=[], metavar="PARAM=LOW:HIGH")
+    parser.add_argument("--samples", type=int, default=0, help="random candidates drawn from the ranges")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--path-file", help="MiR path store, default the one of parse_mir_path")
+    parser.add_argument("--simplify-tolerance", type=float, default=0.005)
+    parser.add_argument("--points", type=int, help="only the first N path points, for quick sweeps")
+    parser.add_argument("--max-time", type=float, help="simulated seconds per run, default 3x the nominal duration")
+    parser.add_argument("--no-compensation", action="store_true")
+    parser.add_argument("--workers", type=int, help="processes, default one per cpu")
+    parser.add_argument("--cache", default="follower_sweep_cache.jsonl", help="results of earlier runs, '' to disable")
+    parser.add_argument("--output", help="write all results and the front as json")
+    args = parser.parse_args()
+
+    candidates = grid(parse_grid(args.grid)) if args.grid else []
+    if args.samples:
+        candidates += random_samples(parse_ranges(args.range), args.samples, args.seed)
+    if not candidates:
+        parser.error("no candidates, use --grid and/or --range with --samples")
+
+    points = load_mir_path(args.path_file, args.simplify_tolerance)
+    if args.points:
+        points = points[:args.points]
+    options = {"compensation": not args.no_compensation, "max_time": args.max_time}
+
+    def progress(done, total):
+        print(f"\r{done}/{total} simulated", end="", file=sys.stderr, flush=True)
+
+    results = sweep(points, candidates, options, args.workers, ResultCache(args.cache or None), progress)
+    print(file=sys.stderr)
+    front = pareto_front(results)
+
+    print(f"{len(results)} candidates, {sum(r['completed'] for _, r in results)} completed, {len(front)} on the Pareto front")
+    print(f"{'print time [s]':>15} {'max dev [m]':>12} {'rms dev [m]':>12}  parameters")
+    for params, result in front:
+        print(f"{result['sim_time']:15.2f} {result['cross_track_max']:12.4f} {result['cross_track_rms']:12.4f}  {json.dumps(params)}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": [{"params": p, "result": r} for p, r in results],
+                       "front": [{"params": p, "result": r} for p, r in front]}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
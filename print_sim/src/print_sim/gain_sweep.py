@@ -0,0 +1,112 @@
+"""Parallel parameter sweep of the MiR follower on the kinematic simulation.
+
+Every candidate is a dict of private follower parameters (Kp, Kw, distance_threshold,
+control_rate, index_coupling_gain, ...). Candidates are simulated in a process pool,
+results are cached in a JSON lines file keyed by the path and the parameters, so
+repeated or extended sweeps only simulate what is new. The Pareto front trades the
+total print time against the maximum path deviation.
+"""
+import concurrent.futures
+import hashlib
+import itertools
+import json
+import os
+
+import numpy as np
+
+from print_sim.kinematic_sim import simulate
+
+_worker_points = None
+
+
+def _init_worker(points):
+    # the path is sent once per worker, not once per candidate
+    global _worker_points
+    _worker_points = points
+
+
+def _evaluate(params, options):
+    result = simulate(_worker_points, options.get("max_time"), follower_params=params,
+                      compensation=options.get("compensation", True))
+    return result._asdict()
+
+
+def grid(axes):
+    """All combinations of {param: [values]}."""
+    names = sorted(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+
+def random_samples(ranges, n, seed=0):
+    """n candidates drawn uniformly from {param: (low, high)}."""
+    rng = np.random.default_rng(seed)
+    names = sorted(ranges)
+    samples = rng.uniform([ranges[name][0] for name in names], [ranges[name][1] for name in names], (n, len(names)))
+    return [dict(zip(names, row.tolist())) for row in samples]
+
+
+def path_digest(points):
+    return hashlib.sha1(np.ascontiguousarray(points, dtype=float).tobytes()).hexdigest()
+
+
+def cache_key(digest, params, options):
+    return json.dumps({"path": digest, "params": params, "options": options}, sort_keys=True)
+
+
+class ResultCache:
+    """Results of evaluated candidates, persisted as one JSON object per line."""
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.results = {}
+        if filename and os.path.exists(filename):
+            with open(filename) as f:
+                for line in f:
+                    record = json.loads(line)
+                    self.results[record["key"]] = record["result"]
+
+    def get(self, key):
+        return self.results.get(key)
+
+    def add(self, key, result):
+        self.results[key] = result
+        if self.filename:
+            with open(self.filename, "a") as f:
+                f.write(json.dumps({"key": key, "result": result}) + "\n")
+
+
+def sweep(points, candidates, options=None, workers=None, cache=None, progress=None):
+    """Simulate all candidates, returns [(params, result dict)] in candidate order."""
+    options = dict(options or {})
+    cache = cache if cache is not None else ResultCache()
+    digest = path_digest(points)
+    keys = [cache_key(digest, params, options) for params in candidates]
+
+    pending = {}
+    for key, params in zip(keys, candidates):
+        if cache.get(key) is None and key not in pending:
+            pending[key] = params
+
+    if pending:
+        with concurrent.futures.ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(points,)) as pool:
+            futures = {pool.submit(_evaluate, params, options): key for key, params in pending.items()}
+            for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                cache.add(futures[future], future.result())
+                if progress is not None:
+                    progress(done, len(futures))
+
+    return [(params, cache.get(key)) for key, params in zip(keys, candidates)]
+
+
+def pareto_front(results, time_key="sim_time", error_key="cross_track_max"):
+    """Completed runs that no other completed run beats in both print time and path deviation, fastest first."""
+    completed = [(params, result) for params, result in results if result["completed"]]
+    if not completed:
+        return []
+    objectives = np.array([(result[time_key], result[error_key]) for _, result in completed])
+    # dominated: some other run is not worse in both and better in one
+    not_worse = np.all(objectives[None, :, :] <= objectives[:, None, :], axis=2)
+    better = np.any(objectives[None, :, :] < objectives[:, None, :], axis=2)
+    dominated = np.any(not_worse & better, axis=1)
+    front = [completed[i] for i in np.flatnonzero(~dominated)]
+    return sorted(front, key=lambda item: item[1][time_key])
@@ -0,0 +1,251 @@
+"""Headless closed loop simulation of the MiR follower and the UR compensation.
+
+The unchanged PathFollowerNode and UrMobileRobotCompensation classes run on a SimBus
+(no ROS master, simulated clock). The MiR is integrated as a unicycle from the
+published cmd_vel, the UR end effector as a point that moves with the MiR and with
+the commanded compensation twist in the UR base frame. With a perfect compensation
+the end effector stays where it is in the map while the MiR drives.
+
+The UR follower is not simulated. With ur_progress="nominal" /trajectory_index reports
+the MiR path index the UR would be at if it printed with the nominal velocity profile,
+so the index coupling of the MiR follower acts like with a UR that keeps its own timing.
+With ur_progress="mir" it reports the MiR target index and the coupling stays neutral.
+"""
+import importlib.util
+import math
+import os
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+import rospkg
+import rospy
+from geometry_msgs.msg import Pose, PoseStamped, TransformStamped, Twist
+from nav_msgs.msg import Path
+from std_msgs.msg import Bool, Empty, Int32
+from tf2_msgs.msg import TFMessage
+
+from print_sim.sim_bus import SimBus, SimTransformListener
+
+SimResult = namedtuple("SimResult", ["completed", "sim_time", "steps", "cross_track_rms", "cross_track_max",
+                                     "ee_drift_max", "cycle_mean_us", "cycle_max_us", "wall_time", "realtime_factor"])
+
+FOLLOWER_NODE = "/path_follower_node"
+COMPENSATION_NODE = "/ur_vel_induced_by_mir"
+BASE_MIR = "mir/base_link"
+BASE_UR = "mir/ur_base_link"
+
+_modules = {}
+
+
+def load_node_module(package, script):
+    """Import a node script of another package once per process."""
+    key = (package, script)
+    if key not in _modules:
+        scripts_dir = os.path.join(rospkg.RosPack().get_path(package), "scripts")
+        # both followers have a helper package next to their scripts, only one can be importable at a time
+        for name in [name for name in sys.modules if name == "helper" or name.startswith("helper.")]:
+            del sys.modules[name]
+        sys.path.insert(0, scripts_dir)
+        try:
+            spec = importlib.util.spec_from_file_location(f"{package}.{script}", os.path.join(scripts_dir, script + ".py"))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        finally:
+            sys.path.remove(scripts_dir)
+        _modules[key] = module
+    return _modules[key]
+
+
+def load_mir_path(path_file=None, simplify_tolerance=0.005):
+    """MiR path points (n, 2) as the parser would publish them on /mir_path_original."""
+    from parse_path import engine
+    profile = engine.PROFILES["mir"]
+    if path_file is None:
+        path_file = os.path.join(rospkg.RosPack().get_path(profile.package), "path", profile.file_name)
+    source = engine.PathSource(path_file, profile, tolerance=simplify_tolerance)
+    positions, _ = engine.original_path(source.points, profile)
+    return positions[:, :2]
+
+
+def path_message(points):
+    from parse_path import engine, node
+    positions = np.zeros((len(points) - 1, 3))
+    positions[:, :2] = points[:-1]
+    return node.build_path(positions, engine.heading_quaternions(points[:, 0], points[:, 1]), rospy.Time(0))
+
+
+def geometry_message(points, geometry_params):
+    """PathGeometry parallel to path_message(points), geometry_params as parse_path.node.geometry_params()."""
+    from parse_path import geometry
+    from print_path_msgs.msg import PathGeometry
+    full = geometry.path_geometry(points, *geometry_params)
+    return PathGeometry(heading_lookahead=geometry_params[0], arc_length=full.arc_length[:-1].tolist(),
+                        heading=full.heading[:-1].tolist(), curvature=full.curvature[:-1].tolist(),
+                        speed_limit=full.speed_limit[:-1].tolist())
+
+
+def yaw_quaternion(pose, yaw):
+    pose.orientation.z = math.sin(yaw / 2)
+    pose.orientation.w = math.cos(yaw / 2)
+
+
+class KinematicSim:
+    """One closed loop run. Parameters are the private ROS parameters of the two nodes.
+
+    geometry: (heading lookahead, max velocity, max lateral acceleration, max angular velocity)
+    of the path geometry the parser would publish with the path, None publishes none.
+    """
+
+    def __init__(self, mir_points, follower_params=None, compensation_params=None, compensation=True,
+                 mount=(0.5, 0.1, 0.2), ee_offset=(0.3, 0.0, 0.5), start_offset=(0.0, 0.0, 0.0), record_every=10,
+                 ur_progress="nominal", geometry=None):
+        self.mir_points = np.asarray(mir_points, dtype=float)
+        self.follower_params = {"instrumentation": False, "checkpoint_period": 0.0, **(follower_params or {})}
+        self.compensation_params = {"instrumentation": False, "base_mir_frame_id": BASE_MIR,
+                                    "base_ur_frame_id": BASE_UR, **(compensation_params or {})}
+        self.compensation = compensation
+        self.mount = np.asarray(mount, dtype=float)
+        self.ee_local = np.asarray(ee_offset, dtype=float).copy()
+        self.start_offset = start_offset
+        self.record_every = record_every
+        self.ur_progress = ur_progress
+        self.geometry = geometry
+
+        self.cmd_vel = Twist()
+        self.ur_cmd_vel = Twist()
+        self.completed = False
+
+    # bus callbacks
+
+    def cmd_vel_callback(self, msg):
+        self.cmd_vel = msg
+
+    def ur_cmd_vel_callback(self, msg):
+        self.ur_cmd_vel = msg
+
+    def completion_callback(self, msg):
+        self.completed = msg.data
+
+    def setup(self, bus):
+        params = {f"{FOLLOWER_NODE}/{k}": v for k, v in self.follower_params.items()}
+        params.update({f"{COMPENSATION_NODE}/{k}": v for k, v in self.compensation_params.items()})
+        bus.params.update(params)
+
+        self.follower = load_node_module("mir_trajectory_follower", "mir_trajectory_follower").PathFollowerNode()
+
+        mount = TransformStamped()
+        mount.header.frame_id = BASE_MIR
+        mount.child_frame_id = BASE_UR
+        mount.transform.translation.x, mount.transform.translation.y, mount.transform.translation.z = self.mount.tolist()
+        mount.transform.rotation.w = 1.0
+        bus.publisher("/tf_static", TFMessage, latch=True).publish(TFMessage(transforms=[mount]))
+
+        if self.compensation:
+            compensation_module = load_node_module("ur_trajectory_follower", "ur_vel_induced_by_mir")
+            compensation_module.TransformListener = SimTransformListener
+            bus.remaps[f"{COMPENSATION_NODE}/mir_cmd_vel"] = bus.resolve(self.follower.cmd_vel_topic)
+            bus.init_node(COMPENSATION_NODE)
+            self.compensation_node = compensation_module.UrMobileRobotCompensation()
+            bus.subscriber(f"{COMPENSATION_NODE}/ur_cmd_vel_local", Twist, self.ur_cmd_vel_callback)
+
+        bus.subscriber(self.follower.cmd_vel_topic, Twist, self.cmd_vel_callback)
+        bus.subscriber("/path_following_complete", Bool, self.completion_callback)
+        self.mir_pose_pub = bus.publisher(self.follower.mir_pose_topic, Pose)
+        self.index_pub = bus.publisher(self.follower.trajectory_index_topic, Int32)
+        self.ur_pose_pub = bus.publisher(f"{COMPENSATION_NODE}/ur_pose", PoseStamped)
+        if self.geometry is not None:
+            from print_path_msgs.msg import PathGeometry
+            bus.publisher(self.follower.geometry_topic, PathGeometry, latch=True).publish(
+                geometry_message(self.mir_points, self.geometry))
+        bus.publisher(self.follower.mir_path_topic, Path, latch=True).publish(path_message(self.mir_points))
+
+    def run(self, max_time=None):
+        bus = SimBus()
+        with bus.install():
+            self.setup(bus)
+            return self.simulate(bus, max_time)
+
+    def simulate(self, bus, max_time):
+        follower = self.follower
+        dt = 1.0 / follower.control_rate
+        path_index = follower.path.index
+        profile = follower.path.profile
+        if max_time is None:
+            max_time = 3.0 * path_index.arc_length[-1] / max(follower.max_velocity, 1e-3) + 10.0
+
+        start = self.mir_points[0]
+        heading = math.atan2(*(self.mir_points[1] - start)[::-1])
+        x, y, yaw = start[0] + self.start_offset[0], start[1] + self.start_offset[1], heading + self.start_offset[2]
+
+        mir_pose = Pose()
+        ur_pose = PoseStamped()
+        ur_pose.header.frame_id = BASE_UR
+        ur_pose.pose.orientation.w = 1.0
+        index_msg = Int32()
+
+        def ee_world():
+            c, s = math.cos(yaw), math.sin(yaw)
+            rx, ry = self.mount[:2] + self.ee_local[:2]
+            return np.array((x + c * rx - s * ry, y + s * rx + c * ry))
+
+        ee_start = ee_world()
+        cross_track = []
+        ee_drift = []
+        cycles = []
+        steps = 0
+        wall_start = time.perf_counter()
+        bus.publisher("/start_follow_path", Empty).publish(Empty())
+
+        while bus.time < max_time and not self.completed:
+            mir_pose.position.x, mir_pose.position.y = x, y
+            yaw_quaternion(mir_pose, yaw)
+            self.mir_pose_pub.publish(mir_pose)
+            ur_pose.pose.position.x, ur_pose.pose.position.y, ur_pose.pose.position.z = self.ee_local.tolist()
+            self.ur_pose_pub.publish(ur_pose)
+            if self.ur_progress == "nominal":
+                ur_arc_length = np.interp(bus.time, profile.time, profile.arc_length)
+                index_msg.data = int(np.searchsorted(path_index.arc_length, ur_arc_length))
+            else:
+                index_msg.data = follower.target_idx
+            self.index_pub.publish(index_msg)
+
+            cycle_start = time.perf_counter()
+            bus.advance(dt)
+            cycles.append(time.perf_counter() - cycle_start)
+
+            # unicycle MiR, the UR moves its end effector in its base frame (not rotated against the MiR)
+            v, w = self.cmd_vel.linear.x, self.cmd_vel.angular.z
+            x += v * math.cos(yaw) * dt
+            y += v * math.sin(yaw) * dt
+            yaw += w * dt
+            self.ee_local[0] += self.ur_cmd_vel.linear.x * dt
+            self.ee_local[1] += self.ur_cmd_vel.linear.y * dt
+            self.ee_local[2] += self.ur_cmd_vel.linear.z * dt
+
+            steps += 1
+            if steps % self.record_every == 0:
+                cross_track.append(path_index.nearest((x, y))[3])
+                ee_drift.append(np.linalg.norm(ee_world() - ee_start))
+
+        wall_time = time.perf_counter() - wall_start
+        cross_track = np.asarray(cross_track) if cross_track else np.zeros(1)
+        cycles = np.asarray(cycles) if cycles else np.zeros(1)
+        return SimResult(
+            completed=bool(self.completed),
+            sim_time=bus.time,
+            steps=steps,
+            cross_track_rms=float(np.sqrt(np.mean(cross_track ** 2))),
+            cross_track_max=float(cross_track.max()),
+            ee_drift_max=float(max(ee_drift)) if ee_drift else 0.0,
+            cycle_mean_us=float(cycles.mean() * 1e6),
+            cycle_max_us=float(cycles.max() * 1e6),
+            wall_time=wall_time,
+            realtime_factor=bus.time / max(wall_time, 1e-9),
+        )
+
+
+def simulate(mir_points, max_time=None, **kwargs):
+    """Run one simulation and return its SimResult, see KinematicSim for the arguments."""
+    return KinematicSim(mir_points, **kwargs).run(max_time)
@@ -0,0 +1,187 @@
+"""In-process replacement of the rospy transport, so nodes can run without a ROS master.
+
+SimBus.install() swaps the rospy functions the nodes of this repo use (init_node,
+get_param, Publisher, Subscriber, Timer, Service, on_shutdown, ...) for versions
+that deliver messages synchronously by function call and run timers on a simulated
+clock. Messages are not serialized, a subscriber gets the published instance.
+
+    bus = SimBus()
+    with bus.install():
+        node = PathFollowerNode()
+        bus.advance(0.01)       # runs all timers that are due, rospy.Time.now() is the sim time
+"""
+import contextlib
+import heapq
+import itertools
+from collections import defaultdict
+
+import rospy
+import rospy.rostime
+
+_UNSPECIFIED = object()
+
+
+class SimTimer:
+    def __init__(self, bus, period, callback, oneshot=False):
+        self.bus = bus
+        self.period = period.to_sec() if hasattr(period, "to_sec") else float(period)
+        self.callback = callback
+        self.oneshot = oneshot
+        self.last = None
+        self.active = True
+        bus.schedule(self, bus.time + self.period)
+
+    def run(self, now):
+        current = rospy.Time.from_sec(now)
+        last = rospy.Time.from_sec(self.last) if self.last is not None else None
+        self.last = now
+        self.callback(rospy.TimerEvent(last, last, current, current, 0.0))
+        if self.active and not self.oneshot:
+            self.bus.schedule(self, now + self.period)
+
+    def shutdown(self):
+        self.active = False
+
+
+class SimBus:
+    def __init__(self, params=None, remaps=None):
+        self.params = dict(params or {})  # fully resolved names, e.g. /path_follower_node/Kp
+        self.remaps = dict(remaps or {})  # resolved topic -> resolved topic
+        self.subscribers = defaultdict(list)
+        self.latched = {}
+        self.services = {}
+        self.shutdown_hooks = []
+        self.node_name = "/sim"
+        self.time = 0.0
+        self.queue = []  # (due time, sequence, timer)
+        self.sequence = itertools.count()
+
+    # names
+
+    def resolve(self, name):
+        if name.startswith("~"):
+            name = f"{self.node_name}/{name[1:]}"
+        elif not name.startswith("/"):
+            name = "/" + name
+        return self.remaps.get(name, name)
+
+    # rospy api
+
+    def init_node(self, name, *args, **kwargs):
+        self.node_name = "/" + name.lstrip("/")
+
+    def get_param(self, name, default=_UNSPECIFIED):
+        key = self.resolve(name)
+        if key in self.params:
+            return self.params[key]
+        if default is _UNSPECIFIED:
+            raise KeyError(name)
+        return default
+
+    def publisher(self, topic, data_class, *args, latch=False, subscriber_listener=None, **kwargs):
+        return SimPublisher(self, self.resolve(topic), latch)
+
+    def subscriber(self, topic, data_class, callback=None, callback_args=None, **kwargs):
+        topic = self.resolve(topic)
+        if callback_args is not None:
+            bound, callback = callback, (lambda msg: bound(msg, callback_args))
+        self.subscribers[topic].append(callback)
+        if topic in self.latched:
+            callback(self.latched[topic])
+        return SimSubscriber(self, topic, callback)
+
+    def service(self, name, service_class, handler, **kwargs):
+        self.services[self.resolve(name)] = handler
+
+    def on_shutdown(self, hook):
+        self.shutdown_hooks.append(hook)
+
+    # time
+
+    def schedule(self, timer, due):
+        heapq.heappush(self.queue, (due, next(self.sequence), timer))
+
+    def advance(self, dt):
+        """Advance the sim clock by dt, running every timer that gets due on the way."""
+        end = self.time + dt
+        while self.queue and self.queue[0][0] <= end + 1e-12:
+            due, _, timer = heapq.heappop(self.queue)
+            if not timer.active:
+                continue
+            self.set_time(due)
+            timer.run(due)
+        self.set_time(end)
+
+    def set_time(self, t):
+        self.time = t
+        rospy.rostime._set_rostime(rospy.Time.from_sec(t))
+
+    @contextlib.contextmanager
+    def install(self):
+        """Patch rospy for the duration of the block."""
+        bus = self
+        patches = {
+            "init_node": self.init_node,
+            "get_param": self.get_param,
+            "get_name": lambda: bus.node_name,
+            "get_namespace": lambda: "/",
+            "Publisher": self.publisher,
+            "Subscriber": self.subscriber,
+            "Service": self.service,
+            "Timer": lambda period, callback, oneshot=False, **kwargs: SimTimer(bus, period, callback, oneshot),
+            "on_shutdown": self.on_shutdown,
+            "is_shutdown": lambda: False,
+        }
+        saved = {name: getattr(rospy, name) for name in patches}
+        rospy.rostime.set_rostime_initialized(True)
+        self.set_time(self.time)
+        for name, value in patches.items():
+            setattr(rospy, name, value)
+        try:
+            yield self
+        finally:
+            for name, value in saved.items():
+                setattr(rospy, name, value)
+
+    def shutdown(self):
+        for hook in self.shutdown_hooks:
+            hook()
+
+
+class SimPublisher:
+    def __init__(self, bus, topic, latch):
+        self.bus = bus
+        self.name = topic
+        self.latch = latch
+
+    def publish(self, msg):
+        if self.latch:
+            self.bus.latched[self.name] = msg
+        for callback in list(self.bus.subscribers[self.name]):
+            callback(msg)
+
+    def get_num_connections(self):
+        return len(self.bus.subscribers[self.name])
+
+    def unregister(self):
+        pass
+
+
+class SimSubscriber:
+    def __init__(self, bus, topic, callback):
+        self.bus = bus
+        self.name = topic
+        self.callback = callback
+
+    def unregister(self):
+        self.bus.subscribers[self.name].remove(self.callback)
+
+
+class SimTransformListener:
+    """tf.TransformListener replacement for nodes that only need /tf_static (served by the bus)."""
+
+    def waitForTransform(self, target, source, time, timeout):
+        raise LookupError(f"No transform from {source} to {target} in the simulation")
+
+    def lookupTransform(self, target, source, time):
+        raise LookupError(f"No transform from {source} to {target} in the simulation")
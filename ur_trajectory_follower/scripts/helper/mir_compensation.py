@@ -0,0 +1,55 @@
+import numpy as np
+
+from match_lib.robot_mats.jacobians.jacobian_platform import getJacobianPlatformWithEEF
+
+# The platform jacobian is affine in the EEF offset (v_ee = v_mir + w x r), so it is
+# J(rx, ry) = J0 + rx*Jx + ry*Jy. The three terms are taken from match_lib once,
+# which allows evaluating whole trajectories without a python call per sample.
+_J0 = np.asarray(getJacobianPlatformWithEEF(0.0, 0.0), dtype=float)
+_JX = np.asarray(getJacobianPlatformWithEEF(1.0, 0.0), dtype=float) - _J0
+_JY = np.asarray(getJacobianPlatformWithEEF(0.0, 1.0), dtype=float) - _J0
+
+
+# J(rx, ry) @ v = [J0 Jx Jy] @ (v, rx*v, ry*v), one matrix product for single samples
+_J_STACKED = np.hstack((_J0, _JX, _JY))
+
+
+class InducedVelocity:
+    """getJacobianPlatformWithEEF(rx, ry) @ (vx, vy, wz) for single samples, for high rate callbacks.
+
+    Nothing is allocated per call: the stacked MiR twist lives in a preallocated buffer
+    and the product is written into the given (6,) array, e.g. TwistBuffer.data.
+    """
+    __slots__ = ("_stacked",)
+
+    def __init__(self):
+        self._stacked = np.zeros(9)
+
+    def compute(self, rx, ry, mir_vel_local, out):
+        s = self._stacked
+        s[0], s[1], s[2] = mir_vel_local
+        np.multiply(s[:3], rx, out=s[3:6])
+        np.multiply(s[:3], ry, out=s[6:])
+        return np.dot(_J_STACKED, s, out=out)
+
+
+def ee_vel_induced_by_mir(ee_offsets, mir_vels_local):
+    """EEF twists induced by the MiR for many samples at once.
+
+    ee_offsets: (n, 2) vectors from the MiR base to the EEF (x, y) in the MiR frame
+    mir_vels_local: (n, 3) MiR twists (vx, vy, wz) in the MiR frame, or a single (3,) twist
+    returns: (n, 6) induced EEF twists (vx, vy, vz, wx, wy, wz)
+    """
+    ee_offsets = np.atleast_2d(np.asarray(ee_offsets, dtype=float))
+    mir_vels_local = np.atleast_2d(np.asarray(mir_vels_local, dtype=float))
+    return (mir_vels_local @ _J0.T
+            + ee_offsets[:, 0:1] * (mir_vels_local @ _JX.T)
+            + ee_offsets[:, 1:2] * (mir_vels_local @ _JY.T))
+
+
+def compensation_limit_violations(compensation, max_linear, max_angular):
+    """Indices of samples whose compensation twist exceeds the cartesian speed limits."""
+    compensation = np.atleast_2d(compensation)
+    linear = np.linalg.norm(compensation[:, :3], axis=1)
+    angular = np.linalg.norm(compensation[:, 3:], axis=1)
+    return np.flatnonzero((linear > max_linear) | (angular > max_angular))
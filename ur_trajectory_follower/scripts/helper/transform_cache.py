@@ -0,0 +1,103 @@
+from collections import namedtuple
+
+import numpy as np
+import rospy
+from tf import transformations
+from tf2_msgs.msg import TFMessage
+from geometry_msgs.msg import Pose
+
+# matrix: 4x4 homogeneous transform target <- source, rotation: the same rotation as quaternion (x, y, z, w)
+CachedTransform = namedtuple("CachedTransform", ["matrix", "rotation"])
+
+IDENTITY = CachedTransform(np.identity(4), np.array([0.0, 0.0, 0.0, 1.0]))
+
+
+def _frame(frame_id):
+    # tf2 frame ids have no leading slash, the launch files of this repo use them
+    return frame_id.lstrip("/")
+
+
+def _matrix(translation, rotation):
+    matrix = transformations.quaternion_matrix(rotation)
+    matrix[:3, 3] = translation
+    return matrix
+
+
+class StaticTransformCache:
+    """Resolves transforms between statically connected frames once and keeps them as numpy matrices.
+
+    The static tree is built from /tf_static directly, every new /tf_static message drops the
+    cached results so they are resolved again on the next lookup. Frames that are not connected
+    through /tf_static may move, they are looked up with the TransformListener on every call
+    and never cached.
+    """
+
+    def __init__(self, listener=None, timeout=4.0):
+        self.listener = listener
+        self.timeout = timeout
+        self.static = {}  # child -> (parent, 4x4 parent <- child)
+        self.cache = {}
+        self.dynamic = set()  # pairs waited for once, looked up on every call
+        rospy.Subscriber("/tf_static", TFMessage, self.tf_static_callback)
+
+    def tf_static_callback(self, msg):
+        for transform in msg.transforms:
+            t = transform.transform.translation
+            r = transform.transform.rotation
+            self.static[_frame(transform.child_frame_id)] = (_frame(transform.header.frame_id), _matrix((t.x, t.y, t.z), (r.x, r.y, r.z, r.w)))
+        # replace instead of clear, readers keep a consistent dict
+        self.cache = {}
+
+    def lookup(self, target_frame, source_frame):
+        key = (_frame(target_frame), _frame(source_frame))
+        cached = self.cache.get(key)
+        if cached is None:
+            cached = self._resolve_static(*key)
+            if cached is None:
+                return self._lookup_dynamic(*key)
+            self.cache[key] = cached
+        return cached
+
+    def _to_root(self, frame):
+        # (root frame, 4x4 root <- frame) along the static tree
+        matrix = np.identity(4)
+        visited = set()
+        while frame in self.static and frame not in visited:
+            visited.add(frame)
+            frame, parent_matrix = self.static[frame]
+            matrix = parent_matrix @ matrix
+        return frame, matrix
+
+    def _resolve_static(self, target_frame, source_frame):
+        # None if the frames are not connected through /tf_static
+        if target_frame == source_frame:
+            return IDENTITY
+        target_root, root_target = self._to_root(target_frame)
+        source_root, root_source = self._to_root(source_frame)
+        if target_root != source_root:
+            return None
+        matrix = np.linalg.inv(root_target) @ root_source
+        return CachedTransform(matrix, transformations.quaternion_from_matrix(matrix))
+
+    def _lookup_dynamic(self, target_frame, source_frame):
+        if self.listener is None:
+            raise LookupError(f"No static transform from {source_frame} to {target_frame}")
+        if (target_frame, source_frame) not in self.dynamic:
+            self.listener.waitForTransform(target_frame, source_frame, rospy.Time(0), rospy.Duration(self.timeout))
+            self.dynamic.add((target_frame, source_frame))
+        translation, rotation = self.listener.lookupTransform(target_frame, source_frame, rospy.Time(0))
+        return CachedTransform(_matrix(translation, rotation), np.asarray(rotation, dtype=float))
+
+
+def transform_pose(transform, pose):
+    """Apply a CachedTransform to a geometry_msgs/Pose, returns a new Pose."""
+    m = transform.matrix
+    p = pose.position
+    q = pose.orientation
+    result = Pose()
+    result.position.x = m[0, 0] * p.x + m[0, 1] * p.y + m[0, 2] * p.z + m[0, 3]
+    result.position.y = m[1, 0] * p.x + m[1, 1] * p.y + m[1, 2] * p.z + m[1, 3]
+    result.position.z = m[2, 0] * p.x + m[2, 1] * p.y + m[2, 2] * p.z + m[2, 3]
+    result.orientation.x, result.orientation.y, result.orientation.z, result.orientation.w = \
+        transformations.quaternion_multiply(transform.rotation, (q.x, q.y, q.z, q.w))
+    return result
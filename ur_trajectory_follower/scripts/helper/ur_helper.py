@@ -3,21 +3,96 @@ import numpy as np
 from tf import transformations
 from geometry_msgs.msg import Twist, Vector3
 
-Vector3.__mul__ = lambda self, other: Vector3(x=self.x*other, y=self.y*other, z=self.z*other)
-Vector3.__rmul__ = lambda self, other: Vector3(x=self.x*other, y=self.y*other, z=self.z*other)
-Vector3.__neg__ = lambda self: Vector3(x=-self.x, y=-self.y, z=-self.z)
 
-def rotateVector(vec=(0.0, 0.0, 0.0, 1.0), rot=(0.0, 0.0, 0.0, 1.0), transpose=False):
+def rotation_matrix(rot=(0.0, 0.0, 0.0, 1.0), transpose=False, out=None):
+    """3x3 rotation matrix of a quaternion (x, y, z, w), written into out if given."""
+    if out is None:
+        out = np.empty((3, 3))
+    x, y, z, w = rot
     if transpose:
-        rot_conj = rot
-        rot = transformations.quaternion_conjugate(rot_conj)
-    else:
-        rot_conj = transformations.quaternion_conjugate(rot)
-    trans = transformations.quaternion_multiply(transformations.quaternion_multiply(rot_conj, vec), rot)[:3]
-    return trans
+        # R(q)^T = R(conjugate(q))
+        x, y, z = -x, -y, -z
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    out[0, 0] = 1.0 - 2.0 * (yy + zz)
+    out[1, 1] = 1.0 - 2.0 * (xx + zz)
+    out[2, 2] = 1.0 - 2.0 * (xx + yy)
+    out[0, 1] = 2.0 * (xy - wz)
+    out[1, 0] = 2.0 * (xy + wz)
+    out[0, 2] = 2.0 * (xz + wy)
+    out[2, 0] = 2.0 * (xz - wy)
+    out[1, 2] = 2.0 * (yz - wx)
+    out[2, 1] = 2.0 * (yz + wx)
+    return out
+
+
+def rotateVector(vec=(0.0, 0.0, 0.0, 1.0), rot=(0.0, 0.0, 0.0, 1.0), transpose=False):
+    # rot^-1 * vec * rot, i.e. R(rot)^T @ vec (R(rot) @ vec for transpose=True)
+    return rotation_matrix(rot, transpose=not transpose) @ np.asarray(vec[:3], dtype=float)
+
 
 def negateTwist(twist: Twist):
-    return Twist(linear=-twist.linear, angular=-twist.angular)
+    return Twist(linear=Vector3(x=-twist.linear.x, y=-twist.linear.y, z=-twist.linear.z),
+                 angular=Vector3(x=-twist.angular.x, y=-twist.angular.y, z=-twist.angular.z))
+
+
+class TwistBuffer:
+    """Twist as preallocated 6 element array (vx, vy, vz, wx, wy, wz) with in-place math.
+
+    Meant for high rate loops: nothing is allocated after construction, messages are only
+    read in from_msg and written in to_msg at the subscriber/publisher boundary.
+    """
+    __slots__ = ("data", "linear", "angular", "_scratch")
+
+    def __init__(self, values=None):
+        self.data = np.zeros(6)
+        self.linear = self.data[:3]
+        self.angular = self.data[3:]
+        self._scratch = np.zeros(3)
+        if values is not None:
+            self.data[:] = values
+
+    def set(self, values):
+        self.data[:] = values
+        return self
+
+    def copy_from(self, other):
+        self.data[:] = other.data
+        return self
+
+    def from_msg(self, twist):
+        d = self.data
+        d[0], d[1], d[2] = twist.linear.x, twist.linear.y, twist.linear.z
+        d[3], d[4], d[5] = twist.angular.x, twist.angular.y, twist.angular.z
+        return self
+
+    def to_msg(self, twist=None):
+        # fills the given message, so the publisher can reuse one instance
+        if twist is None:
+            twist = Twist()
+        twist.linear.x, twist.linear.y, twist.linear.z, twist.angular.x, twist.angular.y, twist.angular.z = self.data.tolist()
+        return twist
+
+    def negate(self):
+        np.negative(self.data, out=self.data)
+        return self
+
+    def add(self, other):
+        np.add(self.data, other.data, out=self.data)
+        return self
+
+    def scale(self, factor):
+        np.multiply(self.data, factor, out=self.data)
+        return self
+
+    def rotate(self, matrix):
+        # matrix: 3x3 rotation, e.g. from rotation_matrix(..., out=preallocated)
+        np.dot(matrix, self.linear, out=self._scratch)
+        self.linear[:] = self._scratch
+        np.dot(matrix, self.angular, out=self._scratch)
+        self.angular[:] = self._scratch
+        return self
 
 
 if __name__ == "__main__":
@@ -27,3 +102,7 @@ if __name__ == "__main__":
         print(twist)
         print(negateTwist(twist))
         print(twist)
+
+        buffer = TwistBuffer().from_msg(twist)
+        rot = rotation_matrix(transformations.quaternion_from_euler(0.0, 0.0, np.pi / 2))
+        print(buffer.rotate(rot).negate().to_msg())
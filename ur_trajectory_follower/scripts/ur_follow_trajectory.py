@@ -1,24 +1,269 @@
 #!/usr/bin/env python3
 
 import rospy
-from helper.ur_helper import Control_ur_helper
+from helper.ur_helper import TwistBuffer, rotation_matrix
+from helper.transform_cache import StaticTransformCache
 import math
-from geometry_msgs.msg import TwistStamped
+import time
+import numpy as np
+import tf
+from tf import TransformListener
+from geometry_msgs.msg import TwistStamped, Twist, PoseStamped, Pose
+from nav_msgs.msg import Path
+from std_msgs.msg import Int32, Float64
+from std_srvs.srv import Trigger, TriggerResponse
+from print_path_msgs.msg import PathChunk, PathManifest
+from print_path_msgs.path_chunks import PathChunkAssembler, manifest_topic, chunk_topic
+from node_instrumentation import Instrumentation
+import print_checkpoint
 
 class Control_ur():
-    
+
     def config(self):
-        
+
         self.ur_scanner_angular_offset = rospy.get_param("~ur_scanner_angular_offset", -math.pi)
-    
-    
+        self.control_rate = rospy.get_param("~control_rate", 125.0)  # UR twist control runs at 125-500 Hz
+        self.feed_rate = rospy.get_param("~feed_rate", 0.1)
+        self.Kp = rospy.get_param("~Kp", 1.0)
+        self.search_window = rospy.get_param("~search_window", 20)  # segments checked per cycle
+        self.max_linear_velocity = rospy.get_param("~max_linear_velocity", 0.3)
+        # path topics are relative, one follower per robot namespace (see parse_path.service).
+        # The original path is in map like global_tcp_pose, the transformed one is shifted by the parser.
+        self.robot_name = rospy.get_param("~robot_name", "mur620a")
+        self.ur_name = rospy.get_param("~ur_name", "UR10_r")
+        self.ur_path_topic = rospy.get_param("~ur_path_topic", "ur_path_original")
+        self.ur_pose_topic = rospy.get_param("~ur_pose_topic", f"/{self.robot_name}/{self.ur_name}/global_tcp_pose")
+        self.mir_pose_topic = rospy.get_param("~mir_pose_topic", f"/{self.robot_name}/mir_pose_simple")
+        self.trajectory_index_topic = rospy.get_param("~trajectory_index_topic", "trajectory_index")
+        self.base_mir_frame_id = rospy.get_param("~base_mir_frame_id", f"{self.robot_name}/base_link")
+        self.base_ur_frame_id = rospy.get_param("~base_ur_frame_id", f"{self.robot_name}/{self.ur_name}/base_link")
+        # written by the MiR follower, ~resume continues at its TCP position
+        self.checkpoint_file = rospy.get_param("~checkpoint_file", "") or print_checkpoint.default_checkpoint_file()
+
+
     def __init__(self):
         rospy.init_node("control_ur_node")
-        Control_ur_helper(self)
-        self.twist_debug_publisher = rospy.Publisher("/ur_twist_debug", TwistStamped, queue_size=1)    
+        self.twist_debug_publisher = rospy.Publisher("ur_twist_debug", TwistStamped, queue_size=1)
         self.config()
-        
-    
-    
+
+        # path as preallocated arrays, filled once per received path
+        self.points = np.zeros((0, 3))
+        self.deltas = np.zeros((0, 3))
+        self.inv_length_sq = np.zeros(0)
+        self.tangents = np.zeros((0, 3))
+        self.path_index = 0
+        self.is_active = False
+        # set by ~stop, the control loop publishes the zero twist, so no command of a running cycle follows it
+        self.stop_requested = False
+
+        # latest inputs from the callbacks
+        self.ur_position = None
+        self.mir_yaw = 0.0
+        self.compensation = TwistBuffer()
+
+        # per cycle buffers
+        self.command = TwistBuffer()
+        self.compensation_ur = TwistBuffer()  # compensation in the UR base frame
+        self.base_rotation = np.identity(3)  # map <- UR base
+        self.mounting_rotation = None  # MiR base <- UR base, resolved when following starts
+        self.mir_rotation = np.identity(3)
+        self.world_velocity = np.zeros(3)
+        self.command_msg = TwistStamped()
+        self.command_msg.header.frame_id = self.base_ur_frame_id
+        self.index_msg = Int32()
+        # achieved timing of the loop on ur_twist_debug: linear = command, angular = (period, jitter, compute time) in s
+        self.cycle_timing = np.zeros(3)
+        self.debug_msg = TwistStamped()
+        self.debug_msg.header.frame_id = self.base_ur_frame_id
+
+        self.transform_cache = StaticTransformCache(TransformListener())
+
+        # period, jitter and compute time of the control loop, see node_instrumentation
+        self.instrumentation = Instrumentation.from_params()
+        self.loop_monitor = self.instrumentation.loop("control_step", self.control_rate)
+        self.publish_timer = self.instrumentation.timer("publish_command")
+
+        rospy.Subscriber(self.ur_path_topic, Path, self.path_callback)
+        self.path_assembler = PathChunkAssembler(self.path_chunks_callback)
+        rospy.Subscriber(manifest_topic(self.ur_path_topic), PathManifest, self.path_assembler.manifest_callback)
+        rospy.Subscriber(chunk_topic(self.ur_path_topic), PathChunk, self.path_assembler.chunk_callback)
+        rospy.Subscriber(self.ur_pose_topic, PoseStamped, self.ur_pose_callback)
+        rospy.Subscriber(self.mir_pose_topic, Pose, self.mir_pose_callback)
+        rospy.Subscriber("~ur_cmd_vel_local", Twist, self.compensation_callback)
+        rospy.Subscriber("~feed_rate", Float64, self.feed_rate_callback)
+
+        self.cmd_vel_publisher = rospy.Publisher("~ur_cmd_vel", TwistStamped, queue_size=1)
+        self.trajectory_index_publisher = rospy.Publisher(self.trajectory_index_topic, Int32, queue_size=1)
+        rospy.Service("~start", Trigger, self.start_service)
+        rospy.Service("~stop", Trigger, self.stop_service)
+        rospy.Service("~resume", Trigger, self.resume_service)
+
+    def set_path(self, poses):
+        points = np.array([(p.pose.position.x, p.pose.position.y, p.pose.position.z) for p in poses], dtype=float)
+        deltas = np.diff(points, axis=0)
+        length_sq = np.einsum("ij,ij->i", deltas, deltas)
+        inv_length_sq = np.divide(1.0, length_sq, out=np.zeros_like(length_sq), where=length_sq > 0.0)
+        tangents = deltas * np.sqrt(inv_length_sq)[:, None]
+        # swap all arrays at once so the control loop never mixes two paths
+        self.points, self.deltas, self.inv_length_sq, self.tangents = points, deltas, inv_length_sq, tangents
+        self.path_index = 0
+
+    def path_callback(self, msg):
+        if self.is_active:
+            rospy.logwarn("Ignoring new UR path while following")
+            return
+        self.set_path(msg.poses)
+
+    def path_chunks_callback(self, poses, complete):
+        if complete and not self.is_active:
+            self.set_path(poses)
+
+    def ur_pose_callback(self, msg):
+        p = msg.pose.position
+        self.ur_position = (p.x, p.y, p.z)
+
+    def mir_pose_callback(self, msg):
+        q = msg.orientation
+        self.mir_yaw = math.atan2(2.0 * (q.w * q.z + q.x * q.y), 1.0 - 2.0 * (q.y * q.y + q.z * q.z))
+
+    def compensation_callback(self, msg):
+        self.compensation.from_msg(msg)
+
+    def feed_rate_callback(self, msg):
+        self.feed_rate = msg.data
+
+    def resolve_mounting(self):
+        # resolved once before the arm moves, a tf lookup in the control loop could block or raise
+        try:
+            mounting = self.transform_cache.lookup(self.base_mir_frame_id, self.base_ur_frame_id)
+        except (tf.Exception, LookupError) as e:
+            rospy.logerr(f"No transform from {self.base_ur_frame_id} to {self.base_mir_frame_id}: {e}")
+            return False
+        self.mounting_rotation = mounting.matrix[:3, :3].copy()
+        return True
+
+    def start_service(self, req):
+        if len(self.points) < 2:
+            return TriggerResponse(success=False, message="Got no path")
+        if not self.resolve_mounting():
+            return TriggerResponse(success=False, message="UR mounting transform not available")
+        self.path_index = 0
+        self.stop_requested = False
+        self.is_active = True
+        return TriggerResponse(success=True, message="Following UR path")
+
+    def resume_service(self, req):
+        if len(self.points) < 2:
+            return TriggerResponse(success=False, message="Got no path")
+        try:
+            checkpoint = print_checkpoint.read_last(self.checkpoint_file)
+        except ValueError as e:
+            return TriggerResponse(success=False, message=str(e))
+        if checkpoint is None or checkpoint.status == print_checkpoint.COMPLETE:
+            return TriggerResponse(success=False, message="No interrupted print to resume")
+        if any(math.isnan(v) for v in checkpoint.ur_position):
+            return TriggerResponse(success=False, message="Checkpoint has no UR position")
+        if not self.resolve_mounting():
+            return TriggerResponse(success=False, message="UR mounting transform not available")
+        self.path_index = self.nearest_segment(np.asarray(checkpoint.ur_position))
+        self.stop_requested = False
+        self.is_active = True
+        return TriggerResponse(success=True, message=f"Resuming UR path at index {self.path_index}")
+
+    def stop_service(self, req):
+        self.stop_requested = True
+        return TriggerResponse(success=True, message="Stopping")
+
+    def closest_point(self, position):
+        # projection on the segments of a window that starts at the current index, O(search_window)
+        first = min(self.path_index, len(self.deltas) - 1)
+        last = min(first + self.search_window, len(self.deltas))
+        rel = position - self.points[first:last]
+        deltas = self.deltas[first:last]
+        t = np.clip(np.einsum("ij,ij->i", rel, deltas) * self.inv_length_sq[first:last], 0.0, 1.0)
+        offset = rel - t[:, None] * deltas
+        best = int(np.argmin(np.einsum("ij,ij->i", offset, offset)))
+        return first + best, t[best]
+
+    def nearest_segment(self, position):
+        # projection on all segments, only used once when resuming
+        rel = position - self.points[:-1]
+        t = np.clip(np.einsum("ij,ij->i", rel, self.deltas) * self.inv_length_sq, 0.0, 1.0)
+        offset = rel - t[:, None] * self.deltas
+        return int(np.argmin(np.einsum("ij,ij->i", offset, offset)))
+
+    def control_step(self):
+        if self.stop_requested:
+            self.stop_requested = False
+            self.is_active = False
+            self.publish_command(stop=True)
+            return
+        if not self.is_active or self.ur_position is None:
+            return
+        position = np.asarray(self.ur_position)
+        segment, t = self.closest_point(position)
+        self.path_index = segment
+        if segment >= len(self.deltas) - 1 and t >= 1.0:
+            rospy.loginfo("UR path finished")
+            self.is_active = False
+            self.publish_command(stop=True)
+            return
+
+        # feedforward along the path plus feedback onto the closest point (map frame)
+        closest = self.points[segment] + t * self.deltas[segment]
+        np.multiply(self.tangents[segment], self.feed_rate, out=self.world_velocity)
+        self.world_velocity += self.Kp * (closest - position)
+        speed = np.linalg.norm(self.world_velocity)
+        if speed > self.max_linear_velocity:
+            self.world_velocity *= self.max_linear_velocity / speed
+
+        # map -> UR base: MiR yaw and the static mounting rotation
+        half_yaw = 0.5 * self.mir_yaw
+        rotation_matrix((0.0, 0.0, math.sin(half_yaw), math.cos(half_yaw)), out=self.mir_rotation)
+        np.dot(self.mir_rotation, self.mounting_rotation, out=self.base_rotation)
+
+        self.command.data[:3] = self.world_velocity
+        self.command.data[3:] = 0.0
+        self.command.rotate(self.base_rotation.T)
+        # cancel the motion induced by the MiR, the compensation is in the MiR base frame
+        self.compensation_ur.copy_from(self.compensation).rotate(self.mounting_rotation.T)
+        self.command.add(self.compensation_ur)
+        self.publish_command()
+
+    def publish_command(self, stop=False):
+        if stop:
+            self.command.set(0.0)
+        stamp = rospy.Time.now()
+        self.command_msg.header.stamp = stamp
+        self.command.to_msg(self.command_msg.twist)
+        self.debug_msg.header.stamp = stamp
+        debug = self.debug_msg.twist
+        debug.linear.x, debug.linear.y, debug.linear.z = self.command.linear.tolist()
+        debug.angular.x, debug.angular.y, debug.angular.z = self.cycle_timing.tolist()
+        with self.publish_timer:
+            self.cmd_vel_publisher.publish(self.command_msg)
+            self.twist_debug_publisher.publish(self.debug_msg)
+            self.index_msg.data = self.path_index
+            self.trajectory_index_publisher.publish(self.index_msg)
+
+
     def main(self):
-        pass
\ No newline at end of file
+        rate = rospy.Rate(self.control_rate)
+        nominal = 1.0 / self.control_rate
+        last_start = None
+        while not rospy.is_shutdown():
+            # measured here as well, the loop monitor only reports summaries and is off without ~instrumentation
+            start = time.perf_counter()
+            if last_start is not None:
+                self.cycle_timing[0] = start - last_start
+                self.cycle_timing[1] = self.cycle_timing[0] - nominal
+            last_start = start
+            with self.loop_monitor:
+                self.control_step()
+            # compute time of this cycle, published with the next command
+            self.cycle_timing[2] = time.perf_counter() - start
+            rate.sleep()
+
+
+if __name__ == "__main__":
+    Control_ur().main()
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 
-from match_lib.robot_mats.jacobians.jacobian_platform import getJacobianPlatformWithEEF
-from helper.ur_helper import negateTwist
+from helper.ur_helper import TwistBuffer
+from helper.mir_compensation import InducedVelocity, ee_vel_induced_by_mir, compensation_limit_violations
+from helper.transform_cache import StaticTransformCache, transform_pose
+from node_instrumentation import Instrumentation
 import numpy as np
 import math
 import rospy
-from tf import TransformListener, transformations
+import tf
+from tf import TransformListener
 
 from geometry_msgs.msg import PoseStamped, Pose, Twist, Transform
 
@@ -21,9 +24,24 @@ class UrMobileRobotCompensation():
                 self.mir_pose = Pose()
                 self.mir_vel = Twist()
                 self.listener = TransformListener()
+                self.transform_cache = StaticTransformCache(self.listener)
 
                 self.mir_ur_transform = Transform()
-                self.get_mir_ur_transform()
+                # vector from the MiR base to the UR base, None until the transform is known
+                self.mir_ur_offset = None
+                # reused every cycle, converted to a message only for publishing
+                self.compensation = TwistBuffer()
+                self.induced_velocity = InducedVelocity()
+                self.ur_cmd_vel_local = Twist()
+                self.update_mir_ur_transform()
+                # the mounting rarely changes, a slow timer picks up changes instead of a lookup per cmd_vel
+                refresh_period = rospy.get_param("~transform_refresh_period", 1.0)
+                self.transform_timer = rospy.Timer(rospy.Duration(refresh_period), self.update_mir_ur_transform) if refresh_period > 0 else None
+
+                # receive to publish latency of the compensation, see node_instrumentation
+                self.instrumentation = Instrumentation.from_params()
+                self.callback_timer = self.instrumentation.timer("mir_cmd_vel_callback")
+                self.publish_timer = self.instrumentation.timer("publish_ur_cmd_vel_local")
 
                 #Subscriber
                 rospy.Subscriber("~ur_pose", PoseStamped, self.ur_pose_callback)
@@ -34,25 +52,48 @@ class UrMobileRobotCompensation():
 
         
         def ur_pose_callback(self, data = PoseStamped()):
-            data = self.listener.transformPose(self.ur_base_link_frame_id, data)
-            self.ur_pose = data.pose
+            # the pose frame is static w.r.t. the UR base, so the cached matrix replaces a tf lookup per message
+            try:
+                ur_transform = self.transform_cache.lookup(self.base_ur_frame_id, data.header.frame_id)
+            except (tf.Exception, LookupError) as e:
+                rospy.logwarn_throttle(1.0, f"Can not transform UR pose to {self.base_ur_frame_id}: {e}")
+                return
+            self.ur_pose = transform_pose(ur_transform, data.pose)
         
         def mir_cmd_vel_callback(self, msg = Twist()):
-            self.mir_vel = msg
-            self.pub_induced_vel_compensation()
+            with self.callback_timer:
+                self.mir_vel = msg
+                if self.mir_ur_offset is None:
+                    rospy.logwarn_throttle(1.0, f"No transform from {self.base_ur_frame_id} to {self.base_mir_frame_id} yet, no compensation published")
+                    return
+                self.pub_induced_vel_compensation()
             
         def mir_pose_callback(self, msg = Pose()):
             self.mir_pose = msg
 
 
-        def get_ee_vel_induced_by_mir(self, mir_vel_local: np.ndarray = np.zeros(3)):
+        def get_ee_vel_induced_by_mir(self, mir_vel_local=(0.0, 0.0, 0.0), out=None):
             # get vector from mir_base to ee:
-            rx,ry = self.ur_pose.position.x, self.ur_pose.position.y
-            rx = rx + self.mir_ur_transform.translation.x
-            ry = ry + self.mir_ur_transform.translation.y
-            
-            j_p = getJacobianPlatformWithEEF(rx, ry)
-            return j_p@mir_vel_local
+            rx = self.ur_pose.position.x + self.mir_ur_offset[0]
+            ry = self.ur_pose.position.y + self.mir_ur_offset[1]
+
+            return self.induced_velocity.compute(rx, ry, mir_vel_local, np.zeros(6) if out is None else out)
+
+        def get_ee_vel_induced_by_mir_batch(self, ur_positions, mir_vels_local):
+            # same as get_ee_vel_induced_by_mir for a whole trajectory: (n, 2+) ur positions, (n, 3) mir twists -> (n, 6)
+            if self.mir_ur_offset is None:
+                self.get_mir_ur_transform()  # offline use, raises if the transform is still unknown
+            ee_offsets = np.asarray(ur_positions, dtype=float)[:, :2] + self.mir_ur_offset[:2]
+            return ee_vel_induced_by_mir(ee_offsets, mir_vels_local)
+
+        def preview_compensation(self, ur_positions, mir_vels_local, max_linear=None, max_angular=None):
+            # compensation twists for a planned trajectory, e.g. as feedforward table for the UR follower
+            compensation = -self.get_ee_vel_induced_by_mir_batch(ur_positions, mir_vels_local)
+            if max_linear is not None and max_angular is not None:
+                violations = compensation_limit_violations(compensation, max_linear, max_angular)
+                if len(violations):
+                    rospy.logwarn(f"Compensation exceeds the speed limits at {len(violations)} samples, first at {violations[0]}")
+            return compensation
 
         def compute_mir_vel_global(self, mir_vel_local = Twist(),mir_angle = 0.0):
             mir_vel_global = Twist()
@@ -61,27 +102,37 @@ class UrMobileRobotCompensation():
             mir_vel_global.angular.z = mir_vel_local.angular.z
             return mir_vel_global
         
+        def update_mir_ur_transform(self, event=None):
+            # at startup and from the refresh timer, a missing transform keeps the last known one
+            try:
+                self.get_mir_ur_transform()
+            except (tf.Exception, LookupError) as e:
+                rospy.logwarn_throttle(10.0, f"Can not look up transform from {self.base_ur_frame_id} to {self.base_mir_frame_id}: {e}")
+
         def get_mir_ur_transform(self):
-            tf_listener = self.listener
-            # wait for transform
-            tf_listener.waitForTransform(self.base_mir_frame_id, self.base_ur_frame_id, rospy.Time(0), rospy.Duration(4.0))
-            lin, ang = tf_listener.lookupTransform(self.base_mir_frame_id, self.base_ur_frame_id, rospy.Time(0))
-
-            self.mir_ur_transform.translation.x = lin[0]
-            self.mir_ur_transform.translation.y = lin[1]
-            self.mir_ur_transform.translation.z = lin[2]
-            q = transformations.quaternion_from_euler(ang[0], ang[1], ang[2])
+            # resolved once by the cache (waits for the transform), refreshed there when /tf_static changes
+            mir_ur = self.transform_cache.lookup(self.base_mir_frame_id, self.base_ur_frame_id)
+            # replaced as a whole, the cmd_vel callback may read it concurrently
+            self.mir_ur_offset = mir_ur.matrix[:3, 3].copy()
+
+            self.mir_ur_transform.translation.x = mir_ur.matrix[0, 3]
+            self.mir_ur_transform.translation.y = mir_ur.matrix[1, 3]
+            self.mir_ur_transform.translation.z = mir_ur.matrix[2, 3]
+            # lookupTransform already returns a quaternion
+            q = mir_ur.rotation
             self.mir_ur_transform.rotation.x = q[0]
             self.mir_ur_transform.rotation.y = q[1]
             self.mir_ur_transform.rotation.z = q[2]
             self.mir_ur_transform.rotation.w = q[3]
 
         def pub_induced_vel_compensation(self):
-            vel=-self.get_ee_vel_induced_by_mir((self.mir_vel.linear.x, self.mir_vel.linear.y, self.mir_vel.angular.z))
-            ur_cmd_vel_local = Twist()
-            ur_cmd_vel_local.linear.x, ur_cmd_vel_local.linear.y, ur_cmd_vel_local.linear.z, ur_cmd_vel_local.angular.x, ur_cmd_vel_local.angular.y, ur_cmd_vel_local.angular.z = vel
+            # written straight into the compensation buffer, nothing is allocated per message
+            self.get_ee_vel_induced_by_mir((self.mir_vel.linear.x, self.mir_vel.linear.y, self.mir_vel.angular.z), self.compensation.data)
+            self.compensation.negate()
 
-            self.ur_cmd_vel_local_pub.publish(ur_cmd_vel_local)
+            # rospy serializes on publish, so the message instance can be reused
+            with self.publish_timer:
+                self.ur_cmd_vel_local_pub.publish(self.compensation.to_msg(self.ur_cmd_vel_local))
 
 if __name__ == "__main__":
     rospy.init_node("ur_vel_induced_by_mir")